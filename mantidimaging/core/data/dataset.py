@@ -137,17 +137,17 @@ class Dataset:
         self.sample.proj180deg = proj180deg
 
     @property
-    def _nexus_stack_order(self) -> list[ImageStack]:
+    def nexus_stacks(self) -> list[ImageStack]:
         return list(filter(None, [self.dark_before, self.flat_before, self.sample, self.flat_after, self.dark_after]))
 
     @property
     def nexus_arrays(self) -> list[np.ndarray]:
-        return [image_stack.data for image_stack in self._nexus_stack_order]
+        return [image_stack.data for image_stack in self.nexus_stacks]
 
     @property
     def nexus_rotation_angles(self) -> list[np.ndarray]:
         proj_angles = []
-        for image_stack in self._nexus_stack_order:
+        for image_stack in self.nexus_stacks:
             angles = image_stack.real_projection_angles()
             proj_angles.append(angles.value if angles else np.zeros(image_stack.num_images))
         return proj_angles
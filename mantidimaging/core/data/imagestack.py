@@ -11,6 +11,7 @@ from typing import Any, TextIO, TYPE_CHECKING, cast
 
 import numpy as np
 
+from mantidimaging.core.data.stack_statistics import StackStatistics, compute_statistics
 from mantidimaging.core.data.utility import mark_cropped
 from mantidimaging.core.operation_history import const
 from mantidimaging.core.parallel import utility as pu
@@ -20,6 +21,7 @@ from mantidimaging.core.utility.leak_tracker import leak_tracker
 
 if TYPE_CHECKING:
     from mantidimaging.core.io.instrument_log import InstrumentLog, ShutterCount
+    from mantidimaging.core.utility.progress_reporting import Progress
     import numpy.typing as npt
 
 
@@ -60,6 +62,8 @@ class ImageStack:
         self._log_file: InstrumentLog | None = None
         self._shutter_count_file: ShutterCount | None = None
         self._projection_angles: ProjectionAngles | None = None
+        self._statistics: StackStatistics | None = None
+        self._generation = 0
 
         if name is None:
             if filenames is not None:
@@ -122,6 +126,7 @@ class ImageStack:
         json.dump(self.metadata, f, indent=4)
 
     def record_operation(self, func_name: str, display_name: str, *args, **kwargs) -> None:
+        self.mark_modified()
         if const.OPERATION_HISTORY not in self.metadata:
             self.metadata[const.OPERATION_HISTORY] = []
 
@@ -144,6 +149,40 @@ class ImageStack:
             const.OPERATION_DISPLAY_NAME: display_name
         })
 
+    def statistics(self, progress: Progress | None = None) -> StackStatistics:
+        """
+        Min, max, NaN and non-positive counts and a coarse histogram of the data. These are worked out in a single
+        scan of the stack the first time they are needed, and kept until the data is replaced or an operation is
+        recorded.
+
+        :param progress: Progress for the scan, if the statistics are not already known
+        """
+        if self._statistics is None:
+            self._statistics = compute_statistics(self.data, progress)
+        return self._statistics
+
+    @property
+    def cached_statistics(self) -> StackStatistics | None:
+        """
+        The statistics if they have already been worked out for the current data, without scanning the stack
+        """
+        return self._statistics
+
+    @property
+    def generation(self) -> int:
+        """
+        Counts the changes to the data, so that results worked out from it can be cached with this as part of the key
+        """
+        return self._generation
+
+    def mark_modified(self) -> None:
+        """
+        Forget the cached statistics and move on to a new generation. This happens when the data is replaced or an
+        operation is recorded, and is needed if the data is modified in place without recording an operation.
+        """
+        self._statistics = None
+        self._generation += 1
+
     @property
     def is_processed(self) -> bool:
         """
@@ -153,9 +192,9 @@ class ImageStack:
 
     def copy(self, flip_axes: bool = False) -> ImageStack:
         shape = (self.data.shape[1], self.data.shape[0], self.data.shape[2]) if flip_axes else self.data.shape
-        data_copy = pu.create_array(shape, self.data.dtype)
+        data_copy = self.create_array_like(shape)
         if flip_axes:
-            data_copy.array[:] = np.swapaxes(self.data, 0, 1)
+            pu.swap_axes_into(self.data, data_copy.array)
         else:
             data_copy.array[:] = self.data[:]
 
@@ -165,10 +204,27 @@ class ImageStack:
                             sinograms=not self.is_sinograms if flip_axes else self.is_sinograms)
         return images
 
+    def swap_axes(self, progress: Progress | None = None) -> None:
+        """
+        Switch between projection and sinogram ordering. If there are as many projections as rows the data is
+        transposed in place, otherwise it is copied into a new array which replaces the current one.
+
+        :param progress: Progress for the transpose
+        """
+        if self.data.shape[0] == self.data.shape[1]:
+            pu.swap_axes_in_place(self.data, progress)
+        else:
+            shape = (self.data.shape[1], self.data.shape[0], self.data.shape[2])
+            swapped = self.create_array_like(shape)
+            pu.swap_axes_into(self.data, swapped.array, progress)
+            self.shared_array = swapped
+        self._is_sinograms = not self._is_sinograms
+        self.mark_modified()
+
     def copy_roi(self, roi: SensibleROI) -> ImageStack:
         shape = (self.data.shape[0], roi.height, roi.width)
 
-        data_copy = pu.create_array(shape, self.data.dtype)
+        data_copy = self.create_array_like(shape)
         data_copy.array[:] = self.data[:, roi.top:roi.bottom, roi.left:roi.right]
 
         images = ImageStack(data_copy,
@@ -179,6 +235,14 @@ class ImageStack:
         mark_cropped(images, roi)
         return images
 
+    def create_array_like(self, shape: tuple[int, ...]) -> pu.SharedArray:
+        """
+        Create an array for a copy of this stack, memory mapped if this stack is so that the copy will also fit
+        """
+        if self.is_memory_mapped:
+            return pu.create_memory_mapped_array(shape, self.data.dtype, os.path.dirname(self._shared_array.mmap_path))
+        return pu.create_array(shape, self.data.dtype)
+
     def slice_as_image_stack(self, index: int) -> ImageStack:
         "A slice, either projection or sinogram depending on current ordering"
         return ImageStack(self.slice_as_array(index), metadata=deepcopy(self.metadata), sinograms=self.is_sinograms)
@@ -262,6 +326,7 @@ class ImageStack:
     @data.setter
     def data(self, other: np.ndarray) -> None:
         self._shared_array.array = other
+        self.mark_modified()
 
     @property
     def shared_array(self) -> pu.SharedArray:
@@ -270,18 +335,33 @@ class ImageStack:
     @shared_array.setter
     def shared_array(self, shared_array: pu.SharedArray) -> None:
         self._shared_array = shared_array
+        self.mark_modified()
 
     @property
     def uses_shared_memory(self) -> bool:
         return self._shared_array.has_shared_memory
 
+    @property
+    def is_memory_mapped(self) -> bool:
+        """
+        :return: True if the data is held in a memory mapped file on disk rather than in RAM
+        """
+        return self._shared_array.is_memory_mapped
+
     @property
     def dtype(self) -> np.dtype:
         return self.data.dtype
 
     @staticmethod
-    def create_empty_image_stack(shape: tuple[int, ...], dtype: npt.DTypeLike, metadata: dict[str, Any]) -> ImageStack:
-        arr = pu.create_array(shape, dtype)
+    def create_empty_image_stack(shape: tuple[int, ...],
+                                 dtype: npt.DTypeLike,
+                                 metadata: dict[str, Any],
+                                 memory_mapped: bool = False) -> ImageStack:
+        """
+        :param memory_mapped: Back the stack with a memory mapped file in the scratch directory instead of RAM,
+                              for data that does not fit in memory
+        """
+        arr = pu.create_memory_mapped_array(shape, dtype) if memory_mapped else pu.create_array(shape, dtype)
         return ImageStack(arr, metadata=metadata)
 
     @property
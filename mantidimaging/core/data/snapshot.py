@@ -0,0 +1,303 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+"""
+Snapshots of stacks taken before an operation is applied, so that the original data can be compared or restored
+without holding a second full copy of the stack in memory.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from copy import deepcopy
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+import h5py
+import numpy as np
+
+from mantidimaging.core.data.imagestack import ImageStack
+from mantidimaging.core.io.utility import aligned_ranges, hdf5_slab_size, index_runs
+from mantidimaging.core.parallel import manager as pm
+from mantidimaging.core.parallel import utility as pu
+from mantidimaging.core.utility.progress_reporting import Progress
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+LOG = getLogger(__name__)
+
+# Disk space that the snapshots of a store can use before the oldest are dropped
+SNAPSHOT_BUDGET_BYTES = 8 * 1024**3
+SNAPSHOT_COMPRESSION = "lzf"
+
+
+class _SnapshotFile:
+    """
+    A compressed HDF5 file in the scratch directory holding some of the frames of a snapshot. Later snapshots of
+    the same stack share it for the frames that have not changed, and it is deleted once no snapshot uses it.
+    """
+
+    def __init__(self, directory: str, shape: tuple[int, ...], dtype: np.dtype):
+        fd, self.path = tempfile.mkstemp(suffix=".h5", prefix=f"mi_snapshot_{uuid.uuid4().hex}_", dir=directory)
+        os.close(fd)
+        self._file: h5py.File | None = h5py.File(self.path, "w")
+        self.dataset = self._file.create_dataset("data",
+                                                 shape=shape,
+                                                 dtype=dtype,
+                                                 chunks=(1, ) + tuple(shape[1:]),
+                                                 compression=SNAPSHOT_COMPRESSION,
+                                                 shuffle=True)
+
+    @property
+    def nbytes(self) -> int:
+        return self.dataset.id.get_storage_size()
+
+    def __del__(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class Snapshot:
+    """
+    The data and metadata of a stack at the time it was taken. Only the frames that changed since the previous
+    snapshot of the same stack are written, the rest are read from the earlier snapshot's file.
+    """
+
+    def __init__(self, stack_id: uuid.UUID, shape: tuple[int, ...], dtype: np.dtype, metadata: dict[str, Any],
+                 frame_hashes: list[bytes], sources: list[_SnapshotFile]):
+        self.stack_id = stack_id
+        self.shape = shape
+        self.dtype = dtype
+        self.metadata = metadata
+        self.frame_hashes = frame_hashes
+        self._sources = sources
+
+    @property
+    def files(self) -> set[_SnapshotFile]:
+        return set(self._sources)
+
+    def frame(self, index: int) -> np.ndarray:
+        """
+        Read a single frame of the snapshot
+        """
+        return self._sources[index].dataset[index]
+
+    def _runs(self) -> Iterator[tuple[_SnapshotFile, int, int]]:
+        # Consecutive frames held by the same file, so they can be read in one go
+        start = 0
+        for index in range(1, len(self._sources) + 1):
+            if index == len(self._sources) or self._sources[index] is not self._sources[start]:
+                yield self._sources[start], start, index
+                start = index
+
+    def read_into(self, out: np.ndarray, progress: Progress | None = None) -> np.ndarray:
+        """
+        Read all of the frames into out, which must have the shape and dtype of the snapshot
+        """
+        slab_size = hdf5_slab_size(self.shape[1:], self.dtype.itemsize, (1, ))
+        slabs = [(source, slab) for source, start, stop in self._runs()
+                 for slab in aligned_ranges(start, stop, slab_size)]
+        progress = Progress.ensure_instance(progress, num_steps=len(slabs), task_name="Reading snapshot")
+        with progress:
+            for source, (start, stop) in slabs:
+                source.dataset.read_direct(out, np.s_[start:stop], np.s_[start:stop])
+                progress.update(msg="Slab")
+        return out
+
+    def restore(self, images: ImageStack, progress: Progress | None = None) -> None:
+        """
+        Put the data and metadata of the snapshot back into the stack. The stack's array is reused if the shape has
+        not changed since the snapshot was taken.
+        """
+        if images.data.shape != self.shape or images.data.dtype != self.dtype:
+            images.shared_array = pu.create_array(self.shape, self.dtype)
+        self.read_into(images.data, progress)
+        images.metadata = deepcopy(self.metadata)
+        images.mark_modified()
+
+
+class SnapshotFrames:
+    """
+    Read only, array like view of a snapshot for the image views. Frames are only read from the snapshot's files
+    when they are indexed, so showing a snapshot does not read all of it up front.
+    """
+
+    def __init__(self, snapshot: Snapshot, cached_frames: int = 8):
+        self.snapshot = snapshot
+        self._cached_frames = cached_frames
+        self._frames: OrderedDict[int, np.ndarray] = OrderedDict()
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.snapshot.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.snapshot.dtype
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return self.snapshot.metadata
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def frame(self, index: int) -> np.ndarray:
+        frame = self._frames.get(index)
+        if frame is None:
+            frame = self.snapshot.frame(index)
+            frame.flags.writeable = False
+            self._frames[index] = frame
+            if len(self._frames) > self._cached_frames:
+                self._frames.popitem(last=False)
+        else:
+            self._frames.move_to_end(index)
+        return frame
+
+    def __getitem__(self, key) -> np.ndarray:
+        key = key if isinstance(key, tuple) else (key, )
+        first, rest = key[0], key[1:]
+        if isinstance(first, (int, np.integer)):
+            return self.frame(range(self.shape[0])[first])[rest]
+        indices = range(self.shape[0])[first] if isinstance(first, slice) else np.arange(self.shape[0])[first]
+        return np.stack([self.frame(i)[rest] for i in indices])
+
+    def transpose(self, *axes) -> SnapshotFrames:
+        # The image views transpose into the order they display, which is the order the frames are stored in
+        axes = tuple(axes[0]) if len(axes) == 1 else axes
+        if axes and axes != tuple(range(self.ndim)):
+            raise ValueError(f"Snapshot frames can not be transposed to {axes}")
+        return self
+
+    def min(self) -> Any:
+        return min(np.min(self.frame(i)) for i in range(self.shape[0]))
+
+    def max(self) -> Any:
+        return max(np.max(self.frame(i)) for i in range(self.shape[0]))
+
+    def restore(self, images: ImageStack, progress: Progress | None = None) -> None:
+        self.snapshot.restore(images, progress)
+
+
+def _frame_hashes(data: np.ndarray) -> list[bytes]:
+
+    def frame_hash(index: int) -> bytes:
+        return hashlib.blake2b(np.ascontiguousarray(data[index]), digest_size=16).digest()
+
+    indices = range(data.shape[0])
+    # hashlib releases the GIL for large buffers, so the frames can be hashed on the thread pool
+    hashes = pm.get_thread_pool().map(frame_hash, indices) if pm.cores > 1 else map(frame_hash, indices)
+    return list(hashes)
+
+
+class SnapshotStore:
+    """
+    Keeps snapshots of stacks, oldest first, dropping the oldest once their files use more than the budget. The latest
+    snapshot of each stack is never dropped.
+    """
+
+    def __init__(self, budget_bytes: int = SNAPSHOT_BUDGET_BYTES, directory: str | None = None):
+        self.budget_bytes = budget_bytes
+        self.directory = directory
+        self._snapshots: OrderedDict[uuid.UUID, list[Snapshot]] = OrderedDict()
+
+    def take(self, images: ImageStack, progress: Progress | None = None) -> Snapshot:
+        """
+        Snapshot the current data and metadata of the stack. Frames that are the same as in the stack's previous
+        snapshot are not written again.
+
+        :param images: The stack to snapshot
+        :param progress: Progress updated as the changed frames are written
+        :return: The new snapshot, which is also the latest for the stack
+        """
+        data = images.data
+        hashes = _frame_hashes(data)
+        previous = self.latest(images.id)
+        if previous is not None and (previous.shape != data.shape or previous.dtype != data.dtype):
+            previous = None
+
+        changed = np.array(
+            [i for i, h in enumerate(hashes) if previous is None or previous.frame_hashes[i] != h], dtype=int)
+        sources = list(previous._sources) if previous is not None else []
+        if changed.size:
+            new_file = _SnapshotFile(self.directory or pu.scratch_directory(), data.shape, data.dtype)
+            if not sources:
+                sources = [new_file] * data.shape[0]
+            slab_size = hdf5_slab_size(data.shape[1:], data.itemsize, new_file.dataset.chunks)
+            slabs = [slab for start, stop in index_runs(changed) for slab in aligned_ranges(start, stop, slab_size)]
+            progress = Progress.ensure_instance(progress, num_steps=len(slabs), task_name="Snapshot")
+            with progress:
+                for start, stop in slabs:
+                    new_file.dataset[start:stop] = data[start:stop]
+                    sources[start:stop] = [new_file] * (stop - start)
+                    progress.update(msg="Slab")
+            new_file.dataset.file.flush()
+        LOG.info(f"Snapshot of {images.name} wrote {changed.size} of {data.shape[0]} frames")
+
+        snapshot = Snapshot(images.id, data.shape, data.dtype, deepcopy(images.metadata), hashes, sources)
+        self._snapshots.setdefault(images.id, []).append(snapshot)
+        self._snapshots.move_to_end(images.id)
+        self._evict()
+        return snapshot
+
+    def latest(self, stack_id: uuid.UUID) -> Snapshot | None:
+        snapshots = self._snapshots.get(stack_id)
+        return snapshots[-1] if snapshots else None
+
+    def pop(self, stack_id: uuid.UUID) -> Snapshot | None:
+        """
+        Remove and return the latest snapshot of a stack, making the one before it the latest
+        """
+        snapshots = self._snapshots.get(stack_id)
+        if not snapshots:
+            return None
+        snapshot = snapshots.pop()
+        if not snapshots:
+            del self._snapshots[stack_id]
+        return snapshot
+
+    def discard(self, stack_id: uuid.UUID) -> None:
+        self._snapshots.pop(stack_id, None)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    def __len__(self) -> int:
+        return sum(len(snapshots) for snapshots in self._snapshots.values())
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Disk space used by the files of the kept snapshots, counting shared files once
+        """
+        files = {file for snapshots in self._snapshots.values() for snapshot in snapshots for file in snapshot.files}
+        return sum(file.nbytes for file in files)
+
+    def _evict(self) -> None:
+        while self.nbytes > self.budget_bytes:
+            # The oldest stacks come first, and each stack's snapshots are oldest first
+            oldest = next((snapshots for snapshots in self._snapshots.values() if len(snapshots) > 1), None)
+            if oldest is None:
+                LOG.warning(f"Latest snapshots use {self.nbytes} bytes, more than the budget of {self.budget_bytes}")
+                return
+            oldest.pop(0)
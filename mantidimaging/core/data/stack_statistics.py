@@ -0,0 +1,110 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from mantidimaging.core.parallel import manager as pm
+from mantidimaging.core.parallel.utility import calculate_chunksize, chunk_ranges
+from mantidimaging.core.utility.progress_reporting import Progress
+
+HISTOGRAM_BINS = 256
+# Roughly how many values are kept while scanning the stack to build the coarse histogram
+HISTOGRAM_SAMPLES = 2**20
+
+
+@dataclass(frozen=True)
+class StackStatistics:
+    """
+    Summary of the values in a stack. NaNs are ignored by min, max and the histogram.
+    """
+    min: float
+    max: float
+    nan_count: int
+    zero_count: int
+    negative_count: int
+    histogram: np.ndarray
+    bin_edges: np.ndarray
+
+    @property
+    def non_positive_count(self) -> int:
+        return self.zero_count + self.negative_count
+
+
+@dataclass
+class _PartialStatistics:
+    min: float
+    max: float
+    nan_count: int
+    zero_count: int
+    negative_count: int
+    samples: np.ndarray
+
+
+class _StatisticsWorker:
+
+    def __init__(self, data: np.ndarray, sample_step: int):
+        self.data = data
+        self.sample_step = sample_step
+
+    def __call__(self, index_range: tuple[int, int]) -> _PartialStatistics:
+        chunk = self.data[index_range[0]:index_range[1]]
+        samples = chunk[(slice(None), ) + (np.s_[::self.sample_step], ) * (chunk.ndim - 1)].ravel()
+        return _PartialStatistics(min=float(np.fmin.reduce(chunk, axis=None)),
+                                  max=float(np.fmax.reduce(chunk, axis=None)),
+                                  nan_count=int(np.count_nonzero(np.isnan(chunk))),
+                                  zero_count=int(np.count_nonzero(chunk == 0)),
+                                  negative_count=int(np.count_nonzero(chunk < 0)),
+                                  samples=samples[~np.isnan(samples)])
+
+
+def compute_statistics(data: np.ndarray, progress: Progress | None = None) -> StackStatistics:
+    """
+    Scan a stack once, a chunk of images at a time on the compute thread pool, and summarise its values.
+
+    The histogram is built from an evenly strided sample of each image, so it only gives the rough distribution of
+    the values. The counts and range are exact.
+
+    :param data: The 3D stack to scan
+    :param progress: Updated with the number of images in each chunk as it is scanned
+    :return: The statistics of the stack
+    """
+    num_images = data.shape[0]
+    progress = Progress.ensure_instance(progress, num_steps=num_images, task_name="Stack statistics")
+
+    pixels_per_image = max(math.prod(data.shape[1:]), 1)
+    sample_step = max(math.isqrt(data.size // HISTOGRAM_SAMPLES), 1)
+    chunksize = calculate_chunksize(pm.cores, num_images, pixels_per_image * data.itemsize)
+    worker = _StatisticsWorker(data, sample_step)
+    ranges = chunk_ranges(num_images, chunksize)
+
+    partials = []
+    with progress:
+        results = pm.get_thread_pool().map(worker, ranges) if pm.cores > 1 and len(ranges) > 1 else map(worker, ranges)
+        for index_range, partial in zip(ranges, results, strict=True):
+            partials.append(partial)
+            progress.update(index_range[1] - index_range[0], msg="Statistics")
+
+    min_value = float(np.fmin.reduce([p.min for p in partials])) if partials else np.nan
+    max_value = float(np.fmax.reduce([p.max for p in partials])) if partials else np.nan
+    samples = np.concatenate([p.samples for p in partials]) if partials else np.empty(0)
+    # In float64 so the bin width can not overflow for float32 data spanning most of its range
+    samples = samples[np.isfinite(samples)].astype(np.float64)
+    if samples.size:
+        value_range = (min_value, max_value)
+        if not np.isfinite(value_range).all():
+            value_range = (samples.min(), samples.max())
+        histogram, bin_edges = np.histogram(samples, bins=HISTOGRAM_BINS, range=value_range)
+    else:
+        histogram, bin_edges = np.zeros(HISTOGRAM_BINS, dtype=np.intp), np.zeros(HISTOGRAM_BINS + 1)
+
+    return StackStatistics(min=min_value,
+                           max=max_value,
+                           nan_count=sum(p.nan_count for p in partials),
+                           zero_count=sum(p.zero_count for p in partials),
+                           negative_count=sum(p.negative_count for p in partials),
+                           histogram=histogram,
+                           bin_edges=bin_edges)
@@ -136,9 +136,9 @@ class DatasetTest(unittest.TestCase):
         ds, images = generate_standard_dataset()
         self.assertCountEqual(ds.all_image_ids, [image.id for image in images])
 
-    def test_nexus_stack_order(self):
+    def testnexus_stacks(self):
         ds, _ = generate_standard_dataset()
-        self.assertListEqual(ds._nexus_stack_order,
+        self.assertListEqual(ds.nexus_stacks,
                              [ds.dark_before, ds.flat_before, ds.sample, ds.flat_after, ds.dark_after])
 
     def test_nexus_arrays(self):
@@ -197,7 +197,7 @@ class DatasetTest(unittest.TestCase):
     def test_incomplete_nexus_rotation_angles(self):
         ds, _ = generate_standard_dataset()
         expected_list = []
-        for stack in ds._nexus_stack_order:
+        for stack in ds.nexus_stacks:
             expected_list.append(np.zeros(stack.num_images))
 
         assert np.array_equal(expected_list, ds.nexus_rotation_angles)
@@ -113,6 +113,22 @@ class ImageStackTest(unittest.TestCase):
         self.assertEqual(images.metadata, copy.metadata)
         self.assertNotEqual(copy, images.sinograms)
 
+    def test_swap_axes(self):
+        for shape in [(10, 8, 10), (8, 8, 10)]:
+            with self.subTest(shape=shape):
+                images = generate_images(shape)
+                expected = np.swapaxes(images.data, 0, 1).copy()
+
+                images.swap_axes()
+
+                self.assertTrue(images.is_sinograms)
+                np.testing.assert_array_equal(images.data, expected)
+
+                images.swap_axes()
+
+                self.assertFalse(images.is_sinograms)
+                np.testing.assert_array_equal(images.data, np.swapaxes(expected, 0, 1))
+
     def test_copy_roi(self):
         images = generate_images()
         images.record_operation("Test", "Display", 123)
@@ -189,6 +205,75 @@ class ImageStackTest(unittest.TestCase):
     def test_create_empty_image_stack(self):
         images = ImageStack.create_empty_image_stack((15, 10, 10), np.float32, {})
         self.assertEqual(images.data.shape, (15, 10, 10))
+        self.assertFalse(images.is_memory_mapped)
+
+    def test_create_empty_memory_mapped_image_stack(self):
+        images = ImageStack.create_empty_image_stack((15, 10, 10), np.float32, {}, memory_mapped=True)
+        self.assertEqual(images.data.shape, (15, 10, 10))
+        self.assertTrue(images.is_memory_mapped)
+        self.assertTrue(images.uses_shared_memory)
+
+    def test_copy_of_memory_mapped_stack_is_memory_mapped(self):
+        images = ImageStack.create_empty_image_stack((4, 6, 8), np.float32, {}, memory_mapped=True)
+        images.data[:] = np.random.random(images.data.shape)
+
+        for copy in [images.copy(), images.copy(flip_axes=True), images.copy_roi(SensibleROI(1, 1, 5, 4))]:
+            self.assertTrue(copy.is_memory_mapped)
+            self.assertNotEqual(copy.shared_array.mmap_path, images.shared_array.mmap_path)
+        np.testing.assert_array_equal(images.copy(flip_axes=True).data, np.swapaxes(images.data, 0, 1))
+        np.testing.assert_array_equal(images.sino(2), np.swapaxes(images.data, 0, 1)[2])
+
+    def test_statistics_are_cached(self):
+        images = generate_images()
+
+        with mock.patch("mantidimaging.core.data.imagestack.compute_statistics") as compute_statistics:
+            first = images.statistics()
+            second = images.statistics()
+
+        compute_statistics.assert_called_once_with(images.data, None)
+        self.assertIs(first, second)
+
+    def test_statistics_recomputed_after_operation_recorded(self):
+        images = generate_images()
+        self.assertEqual(images.statistics().nan_count, 0)
+
+        images.data[0, 0, 0] = np.nan
+        images.record_operation("NaNTest", "NaN test")
+
+        self.assertEqual(images.statistics().nan_count, 1)
+
+    def test_statistics_recomputed_when_data_replaced(self):
+        images = generate_images()
+        images.statistics()
+
+        images.data = np.full((2, 3, 4), -1.0)
+
+        self.assertEqual(images.statistics().negative_count, 24)
+
+    def test_cached_statistics_does_not_scan_stack(self):
+        images = generate_images()
+        self.assertIsNone(images.cached_statistics)
+
+        statistics = images.statistics()
+        self.assertIs(images.cached_statistics, statistics)
+
+        images.mark_modified()
+        self.assertIsNone(images.cached_statistics)
+
+    def test_generation_changes_when_stack_modified(self):
+        images = generate_images()
+        generations = [images.generation]
+
+        images.record_operation("Test", "Test")
+        generations.append(images.generation)
+        images.data = np.zeros((2, 3, 4))
+        generations.append(images.generation)
+        images.swap_axes()
+        generations.append(images.generation)
+        images.mark_modified()
+        generations.append(images.generation)
+
+        self.assertEqual(len(set(generations)), len(generations))
 
     def test_get_projection_angles_from_logfile(self):
         images = generate_images()
@@ -0,0 +1,166 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import os
+from copy import deepcopy
+from unittest import mock
+
+import numpy as np
+import numpy.testing as npt
+from parameterized import parameterized
+
+from mantidimaging.core.data.snapshot import SnapshotFrames, SnapshotStore
+from mantidimaging.core.utility.progress_reporting import Progress
+from mantidimaging.test_helpers.file_outputting_test_case import FileOutputtingTestCase
+from mantidimaging.test_helpers.unit_test_helper import generate_images
+
+
+class SnapshotStoreTest(FileOutputtingTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.store = SnapshotStore(directory=self.output_directory)
+        self.images = generate_images(seed=3)
+        self.images.record_operation("Test", "Display", 123)
+
+    def _snapshot_files(self) -> list[str]:
+        return sorted(os.listdir(self.output_directory))
+
+    @parameterized.expand([("single_thread", 1), ("thread_pool", 4)])
+    def test_restore(self, _, cores: int):
+        expected = self.images.data.copy()
+        expected_metadata = deepcopy(self.images.metadata)
+        shared_array = self.images.shared_array
+        with mock.patch("mantidimaging.core.data.snapshot.pm.cores", cores):
+            snapshot = self.store.take(self.images)
+
+        self.images.data[:] *= 2
+        self.images.record_operation("Double", "Double")
+        snapshot.restore(self.images)
+
+        npt.assert_array_equal(self.images.data, expected)
+        self.assertEqual(self.images.metadata, expected_metadata)
+        self.assertIs(self.images.shared_array, shared_array)
+
+    def test_restore_after_shape_change(self):
+        expected = self.images.data.copy()
+        snapshot = self.store.take(self.images)
+
+        self.images.data = self.images.data[:, 1:4, 2:6].copy()
+        snapshot.restore(self.images)
+
+        npt.assert_array_equal(self.images.data, expected)
+
+    def test_frames(self):
+        snapshot = self.store.take(self.images)
+
+        npt.assert_array_equal(snapshot.frame(4), self.images.data[4])
+        read = np.empty_like(self.images.data)
+        npt.assert_array_equal(snapshot.read_into(read), self.images.data)
+
+    @parameterized.expand([("frame", 4), ("negative_frame", -1), ("frame_and_pixel", (2, 3, 4)),
+                           ("frame_region", (3, slice(1, 5), slice(2, 6))), ("slice", slice(2, 7, 2)),
+                           ("all_region", (slice(None), slice(1, 5), 3)), ("indices", np.array([0, 5, 9]))])
+    def test_snapshot_frames_indexing(self, _, key):
+        frames = SnapshotFrames(self.store.take(self.images))
+
+        npt.assert_array_equal(frames[key], self.images.data[key])
+
+    def test_snapshot_frames_only_reads_indexed_frames(self):
+        snapshot = self.store.take(self.images)
+        frames = SnapshotFrames(snapshot, cached_frames=2)
+
+        with mock.patch.object(snapshot, "frame", wraps=snapshot.frame) as read_frame:
+            self.assertEqual((frames.shape, frames.dtype, frames.ndim), (self.images.data.shape,
+                                                                         self.images.data.dtype, 3))
+            self.assertIs(frames.transpose((0, 1, 2)), frames)
+            read_frame.assert_not_called()
+
+            frames[3, 1:4]
+            frames[3]
+            frames[5]
+            frames[6]
+            frames[3]
+
+        self.assertEqual(read_frame.call_args_list, [mock.call(3), mock.call(5), mock.call(6), mock.call(3)])
+        self.assertRaises(ValueError, frames.transpose, (1, 0, 2))
+
+    def test_snapshot_frames_min_max_and_restore(self):
+        expected = self.images.data.copy()
+        frames = SnapshotFrames(self.store.take(self.images))
+        self.images.data[:] *= 2
+
+        self.assertEqual(frames.min(), expected.min())
+        self.assertEqual(frames.max(), expected.max())
+        frames.restore(self.images)
+
+        npt.assert_array_equal(self.images.data, expected)
+
+    def test_only_changed_frames_are_written(self):
+        first = self.store.take(self.images)
+        self.images.data[3:5] += 1
+        expected = self.images.data.copy()
+
+        progress = Progress()
+        second = self.store.take(self.images, progress)
+
+        self.assertEqual(len(first.files), 1)
+        self.assertEqual(len(second.files), 2)
+        self.assertEqual(len(self._snapshot_files()), 2)
+        self.assertEqual(len([e for e in progress.progress_history if e.msg.startswith("Slab")]), 1)
+        self.assertLess(second.files.difference(first.files).pop().nbytes, first.files.pop().nbytes)
+        npt.assert_array_equal(second.read_into(np.empty_like(expected)), expected)
+
+    def test_unchanged_stack_writes_nothing(self):
+        first = self.store.take(self.images)
+
+        second = self.store.take(self.images)
+
+        self.assertEqual(second.files, first.files)
+        self.assertEqual(len(self._snapshot_files()), 1)
+
+    def test_latest_and_pop(self):
+        first = self.store.take(self.images)
+        second = self.store.take(self.images)
+
+        self.assertIs(self.store.latest(self.images.id), second)
+        self.assertIs(self.store.pop(self.images.id), second)
+        self.assertIs(self.store.latest(self.images.id), first)
+        self.assertIs(self.store.pop(self.images.id), first)
+        self.assertIsNone(self.store.pop(self.images.id))
+        self.assertIsNone(self.store.latest(self.images.id))
+
+    def test_files_are_deleted_once_unused(self):
+        self.store.take(self.images)
+        self.assertEqual(len(self._snapshot_files()), 1)
+
+        self.store.discard(self.images.id)
+
+        self.assertEqual(self._snapshot_files(), [])
+
+    def test_oldest_snapshots_are_evicted_over_budget(self):
+        other = generate_images(seed=4)
+        self.store.take(other)
+        self.store.take(self.images)
+        self.images.data[:] += 1
+        latest_images = self.store.take(self.images)
+        self.store.budget_bytes = self.store.nbytes - 1
+
+        other.data[:] += 1
+        latest_other = self.store.take(other)
+
+        # This stack was snapshotted less recently than the other, so its older snapshot is dropped first
+        self.assertEqual(len(self.store), 3)
+        self.assertIs(self.store.pop(self.images.id), latest_images)
+        self.assertIsNone(self.store.latest(self.images.id))
+        self.assertIs(self.store.latest(other.id), latest_other)
+        self.assertEqual(len(self._snapshot_files()), 3)
+
+    def test_latest_snapshots_are_kept_over_budget(self):
+        store = SnapshotStore(budget_bytes=1, directory=self.output_directory)
+
+        with self.assertLogs("mantidimaging.core.data.snapshot", "WARNING"):
+            snapshot = store.take(self.images)
+
+        self.assertIs(store.latest(self.images.id), snapshot)
@@ -0,0 +1,68 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import numpy.testing as npt
+from parameterized import parameterized
+
+from mantidimaging.core.data.stack_statistics import HISTOGRAM_BINS, compute_statistics
+from mantidimaging.core.utility.progress_reporting import Progress
+
+
+class StackStatisticsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.data = np.random.default_rng(5).uniform(-1, 3, (12, 9, 11)).astype(np.float32)
+        self.data[2, 3, 4] = np.nan
+        self.data[7, 1, 1] = np.nan
+        self.data[4, 2, 2] = 0
+
+    @parameterized.expand([("single_thread", 1), ("thread_pool", 4)])
+    def test_matches_numpy(self, _, cores: int):
+        with mock.patch("mantidimaging.core.data.stack_statistics.pm.cores", cores):
+            stats = compute_statistics(self.data)
+
+        self.assertEqual(stats.min, np.nanmin(self.data))
+        self.assertEqual(stats.max, np.nanmax(self.data))
+        self.assertEqual(stats.nan_count, 2)
+        self.assertEqual(stats.zero_count, 1)
+        self.assertEqual(stats.negative_count, np.count_nonzero(self.data < 0))
+        self.assertEqual(stats.non_positive_count, np.count_nonzero(self.data <= 0))
+
+    def test_histogram_covers_the_value_range(self):
+        stats = compute_statistics(self.data)
+
+        self.assertEqual(len(stats.histogram), HISTOGRAM_BINS)
+        self.assertEqual(stats.bin_edges[0], stats.min)
+        self.assertEqual(stats.bin_edges[-1], stats.max)
+        self.assertEqual(stats.histogram.sum(), np.count_nonzero(~np.isnan(self.data)))
+
+    @mock.patch("mantidimaging.core.data.stack_statistics.HISTOGRAM_SAMPLES", 100)
+    def test_histogram_is_sampled_for_large_stacks(self):
+        stats = compute_statistics(self.data)
+
+        self.assertLess(stats.histogram.sum(), self.data.size)
+        self.assertEqual(stats.nan_count, 2)
+
+    def test_all_nan(self):
+        stats = compute_statistics(np.full((3, 4, 5), np.nan, dtype=np.float32))
+
+        self.assertTrue(np.isnan(stats.min))
+        self.assertTrue(np.isnan(stats.max))
+        self.assertEqual(stats.nan_count, 60)
+        npt.assert_array_equal(stats.histogram, 0)
+
+    def test_progress(self):
+        progress = Progress()
+
+        compute_statistics(self.data, progress)
+
+        self.assertTrue(progress.is_completed())
+
+
+if __name__ == "__main__":
+    unittest.main()
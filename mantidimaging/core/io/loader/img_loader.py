@@ -4,6 +4,7 @@
 This module handles the loading of FIT, FITS, TIF, TIFF
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 from collections.abc import Callable
 
@@ -15,6 +16,11 @@ if TYPE_CHECKING:
     import numpy as np
     import numpy.typing as npt
     from ...utility.data_containers import Indices
+    from .loader import ImageProbe
+
+# Maximum number of files that are read at the same time. Decoding releases the GIL so this speeds up loading, but
+# too many concurrent reads will thrash network filesystems.
+MAX_IN_FLIGHT_READS = 8
 
 
 def execute(load_func: Callable[[str], np.ndarray],
@@ -22,7 +28,10 @@ def execute(load_func: Callable[[str], np.ndarray],
             img_format: str,
             dtype: npt.DTypeLike,
             indices: list[int] | Indices | None,
-            progress: Progress | None = None) -> ImageStack:
+            progress: Progress | None = None,
+            max_in_flight: int = MAX_IN_FLIGHT_READS,
+            load_into_func: Callable[[str, np.ndarray], None] | None = None,
+            probe_func: Callable[[str], ImageProbe] | None = None) -> ImageStack:
     """
     Reads a stack of images into memory, assuming dark and flat images
     are in separate directories.
@@ -32,6 +41,11 @@ def execute(load_func: Callable[[str], np.ndarray],
         '>f2' - float16
         '>f4' - float32
 
+    :param max_in_flight: Maximum number of files to read at the same time, 1 to read them sequentially
+    :param load_into_func: Optional function that reads a file straight into a destination array, casting as it
+                           writes. Used instead of load_func for the stack, avoiding a temporary array per file.
+    :param probe_func: Optional function that reads the image shape from the file header, used instead of loading
+                       the first image to find the shape.
     :returns: ImageStack object
     """
     if not sample_path:
@@ -39,16 +53,16 @@ def execute(load_func: Callable[[str], np.ndarray],
 
     # The following codes assume that all images have the same size and properties as the first.
     # This is always true in the case of raw data
-    first_sample_img = load_func(sample_path[0])
+    if probe_func is not None:
+        img_shape = probe_func(sample_path[0]).shape
+    else:
+        img_shape = load_func(sample_path[0]).shape
 
     # select the files loaded based on the indices, if any are provided
     chosen_input_filenames = sample_path[indices[0]:indices[1]:indices[2]] if indices else sample_path
 
-    # get the shape of all images
-    img_shape = first_sample_img.shape
-
     # forward all arguments to internal class for easy re-usage
-    il = ImageLoader(load_func, img_format, img_shape, dtype, indices, progress)
+    il = ImageLoader(load_func, img_format, img_shape, dtype, indices, progress, max_in_flight, load_into_func)
 
     sample_data = il.load_sample_data(chosen_input_filenames)
 
@@ -63,13 +77,17 @@ class ImageLoader:
                  img_shape: tuple[int, ...],
                  data_dtype: npt.DTypeLike,
                  indices: list[int] | Indices | None,
-                 progress: Progress | None = None):
+                 progress: Progress | None = None,
+                 max_in_flight: int = MAX_IN_FLIGHT_READS,
+                 load_into_func: Callable[[str, np.ndarray], None] | None = None):
         self.load_func = load_func
         self.img_format = img_format
         self.img_shape = img_shape
         self.data_dtype = data_dtype
         self.indices = indices
         self.progress = progress
+        self.max_in_flight = max_in_flight
+        self.load_into_func = load_into_func
 
     def load_sample_data(self, input_file_names: list[str]) -> pu.SharedArray:
         # determine what the loaded data was
@@ -79,21 +97,47 @@ class ImageLoader:
         else:
             raise ValueError(f"Data loaded has invalid shape: {self.img_shape}")
 
+    def _load_file(self, data: pu.SharedArray, idx: int, in_file: str) -> None:
+        try:
+            if self.load_into_func is not None:
+                self.load_into_func(in_file, data.array[idx])
+            else:
+                data.array[idx, :] = self.load_func(in_file)
+        except ValueError as exc:
+            raise ValueError("An image has different width and/or height "
+                             "dimensions! All images must have the same "
+                             f"dimensions. Expected dimensions: {self.img_shape} Error "
+                             f"message: {exc}") from exc
+        except OSError as exc:
+            raise RuntimeError(f"Could not load file {in_file}. Error details: {exc}") from exc
+
     def _do_files_load_seq(self, data: pu.SharedArray, files: list[str]) -> pu.SharedArray:
         progress = Progress.ensure_instance(self.progress, num_steps=len(files), task_name='Loading')
 
         with progress:
             for idx, in_file in enumerate(files):
-                try:
-                    data.array[idx, :] = self.load_func(in_file)
+                self._load_file(data, idx, in_file)
+                progress.update(msg='Image')
+
+        return data
+
+    def _do_files_load_parallel(self, data: pu.SharedArray, files: list[str]) -> pu.SharedArray:
+        """
+        Read the files on a pool of at most max_in_flight threads, each writing straight into its own image of the
+        destination array. The first error stops any files that have not started loading yet and is raised here.
+        """
+        progress = Progress.ensure_instance(self.progress, num_steps=len(files), task_name='Loading')
+
+        with progress, ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="mi_load") as executor:
+            futures = [executor.submit(self._load_file, data, idx, in_file) for idx, in_file in enumerate(files)]
+            try:
+                for future in as_completed(futures):
+                    future.result()
                     progress.update(msg='Image')
-                except ValueError as exc:
-                    raise ValueError("An image has different width and/or height "
-                                     "dimensions! All images must have the same "
-                                     f"dimensions. Expected dimensions: {self.img_shape} Error "
-                                     f"message: {exc}") from exc
-                except OSError as exc:
-                    raise RuntimeError(f"Could not load file {in_file}. Error details: {exc}") from exc
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
         return data
 
@@ -102,5 +146,7 @@ class ImageLoader:
         # If it's not possible better crash here than later.
         num_images = len(files)
         shape = (num_images, self.img_shape[0], self.img_shape[1])
-        data = pu.create_array(shape, self.data_dtype)
+        data = pu.create_array(shape, self.data_dtype, allow_memory_mapped=True)
+        if self.max_in_flight > 1 and num_images > 1:
+            return self._do_files_load_parallel(data, files)
         return self._do_files_load_seq(data, files)
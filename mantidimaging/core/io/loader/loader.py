@@ -3,9 +3,10 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from collections.abc import Callable
 
 import numpy as np
@@ -30,6 +31,21 @@ DEFAULT_PIXEL_SIZE = 0
 DEFAULT_PIXEL_DEPTH = "float32"
 
 
+class ImageProbe(NamedTuple):
+    """
+    Shape and dtype of an image, as read from its file header
+    """
+    shape: tuple[int, ...]
+    dtype: np.dtype
+
+
+# Number of probed files remembered. Enough for the first image of every stack in a few datasets.
+PROBE_CACHE_SIZE = 256
+
+# FITS BITPIX values and the dtypes astropy reads them as, before any BZERO/BSCALE scaling
+_FITS_BITPIX_DTYPES = {8: np.uint8, 16: np.int16, 32: np.int32, 64: np.int64, -32: np.float32, -64: np.float64}
+
+
 @dataclass
 class ImageParameters:
     """
@@ -79,6 +95,34 @@ def _imread(filename: Path | str) -> np.ndarray:
         raise RuntimeError(f"TiffFileError {e.args[0]}: {filename}") from e
 
 
+def _imread_into(filename: Path | str, out: np.ndarray) -> None:
+    """
+    Read one TIFF image straight into out, casting to the dtype of out as it is written, so that no intermediate
+    array is allocated.
+
+    :param filename: name of the image file, can be relative or absolute path
+    :param out: the destination, usually one image of the shared stack array
+    """
+    try:
+        with tifffile.TiffFile(filename) as tif:
+            series = tif.series[0]
+            if series.shape != out.shape:
+                raise ValueError(f"Image {filename} has shape {series.shape}, expected {out.shape}")
+            data_offset = series.dataoffset
+            file_dtype = series.dtype.newbyteorder(tif.byteorder)
+            if data_offset is None:
+                # Compressed or tiled, tifffile decodes each segment into out
+                tif.asarray(out=out)
+                return
+    except tifffile.TiffFileError as e:
+        raise RuntimeError(f"TiffFileError {e.args[0]}: {filename}") from e
+
+    # Uncompressed contiguous data is copied directly from the file, converting in the same pass
+    file_data = np.memmap(filename, dtype=file_dtype, mode="r", offset=data_offset, shape=out.shape)
+    np.copyto(out, file_data, casting="unsafe")
+    del file_data
+
+
 def get_loader(in_format: str) -> Callable[[Path | str], np.ndarray]:
     if in_format in ['fits', 'fit']:
         load_func = _fitsread
@@ -89,11 +133,62 @@ def get_loader(in_format: str) -> Callable[[Path | str], np.ndarray]:
     return load_func
 
 
+def _tiff_probe(filename: str) -> ImageProbe:
+    try:
+        with tifffile.TiffFile(filename) as tif:
+            series = tif.series[0]
+            return ImageProbe(tuple(series.shape), np.dtype(series.dtype))
+    except tifffile.TiffFileError as e:
+        raise RuntimeError(f"TiffFileError {e.args[0]}: {filename}") from e
+
+
+def _fits_probe(filename: str) -> ImageProbe:
+    header = fits.getheader(filename)
+    # FITS axes are listed fastest varying first, so NAXIS1 is the width
+    shape = tuple(header[f"NAXIS{axis}"] for axis in range(header["NAXIS"], 0, -1))
+    bitpix = header["BITPIX"]
+    dtype = np.dtype(_FITS_BITPIX_DTYPES[bitpix])
+    bzero, bscale = header.get("BZERO", 0), header.get("BSCALE", 1)
+    if bitpix > 8 and bscale == 1 and bzero == 2**(bitpix - 1):
+        # Unsigned integers are stored as signed with an offset, and astropy reads them back as unsigned
+        dtype = np.dtype(f"uint{bitpix}")
+    elif bzero != 0 or bscale != 1:
+        dtype = np.dtype(np.float64 if abs(bitpix) == 64 else np.float32)
+    return ImageProbe(shape, dtype)
+
+
+@lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe_image_cached(filename: str, in_format: str, mtime_ns: int) -> ImageProbe:
+    if in_format in ['fits', 'fit']:
+        return _fits_probe(filename)
+    elif in_format in ['tiff', 'tif']:
+        return _tiff_probe(filename)
+    raise NotImplementedError("Loading not implemented for:", in_format)
+
+
+def probe_image(file_path: Path | str) -> ImageProbe:
+    """
+    Read the shape and dtype of an image from its header, without reading the pixel data.
+    Results are cached for each path and modification time.
+    """
+    file_path = Path(file_path)
+    return _probe_image_cached(str(file_path), file_path.suffix.lstrip(".").lower(), file_path.stat().st_mtime_ns)
+
+
+def get_direct_loader(in_format: str) -> Callable[[Path | str, np.ndarray], None] | None:
+    """
+    :return: A function that reads an image of the given format straight into a destination array, or None if the
+             format can only be read into a new array with get_loader
+    """
+    if in_format in ['tiff', 'tif']:
+        return _imread_into
+    return None
+
+
 def read_image_dimensions(file_path: Path) -> tuple[int, int]:
-    load_func = get_loader(file_path.suffix.replace(".", ""))
-    img = load_func(file_path)
-    assert len(img.shape) == 2
-    return img.shape
+    shape = probe_image(file_path).shape
+    assert len(shape) == 2
+    return shape  # type: ignore[return-value]
 
 
 def load_log(log_file: Path) -> InstrumentLog:
@@ -155,7 +250,14 @@ def load(filename_group: FilenameGroup,
             angles = angles[angle_order]
             file_names = [file_names[i] for i in angle_order]
 
-    image_stack = img_loader.execute(load_func, file_names, in_format, dtype, indices, progress)
+    image_stack = img_loader.execute(load_func,
+                                     file_names,
+                                     in_format,
+                                     dtype,
+                                     indices,
+                                     progress,
+                                     load_into_func=get_direct_loader(in_format),
+                                     probe_func=probe_image)
 
     if log_file is not None:
         image_stack.log_file = log_data
@@ -0,0 +1,79 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+"""
+This module handles reading image stacks out of HDF5/NeXus datasets
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from mantidimaging.core.io.utility import aligned_ranges, hdf5_slab_size, index_runs
+from mantidimaging.core.parallel import utility as pu
+from mantidimaging.core.utility.progress_reporting import Progress
+
+if TYPE_CHECKING:
+    import h5py
+    import numpy.typing as npt
+
+
+def image_slabs(dataset: h5py.Dataset, indices: npt.ArrayLike) -> list[tuple[int, int]]:
+    """
+    The ranges of the first axis of the dataset that the images at the given indices are read in. Consecutive indices
+    are read as slices, split into slabs that line up with the chunks of the dataset.
+    """
+    slab_size = hdf5_slab_size(dataset.shape[1:], dataset.dtype.itemsize, dataset.chunks)
+    return [slab for start, stop in index_runs(np.asarray(indices)) for slab in aligned_ranges(start, stop, slab_size)]
+
+
+def read_images(dataset: h5py.Dataset,
+                indices: npt.ArrayLike,
+                dtype: npt.DTypeLike,
+                progress: Progress | None = None,
+                stage: str | None = None) -> pu.SharedArray:
+    """
+    Read the images at the given indices of the first axis of the dataset into a new shared array.
+
+    :param dataset: The HDF5 dataset holding the images
+    :param indices: Increasing indices of the images to read
+    :param dtype: The dtype of the returned array, the data is converted as it is read
+    :param progress: Progress reported after each slab is read
+    :param stage: See read_images_into
+    :return: The SharedArray containing the images
+    """
+    indices = np.asarray(indices)
+    data = pu.create_array((indices.size, *dataset.shape[1:]), dtype, allow_memory_mapped=True)
+    read_images_into(dataset, indices, data.array, progress, stage)
+    return data
+
+
+def read_images_into(dataset: h5py.Dataset,
+                     indices: npt.ArrayLike,
+                     out: np.ndarray,
+                     progress: Progress | None = None,
+                     stage: str | None = None) -> np.ndarray:
+    """
+    Read the images at the given indices straight into out, without an intermediate copy.
+
+    Each chunk is only decompressed once, as the images are read in the slabs from image_slabs, and memory use is
+    bounded by out.
+
+    :param stage: If given, this read is one stage of a progress that the caller has set the steps for, from the
+                  image_slabs of every stage, and the stage is named in the progress messages. Otherwise the
+                  progress is set up for this read alone.
+    """
+    slabs = image_slabs(dataset, indices)
+
+    if stage is None:
+        progress = Progress.ensure_instance(progress, num_steps=len(slabs), task_name="Loading NeXus data")
+    else:
+        progress = Progress.ensure_instance(progress, task_name="Loading NeXus data")
+    with progress:
+        dest_start = 0
+        for start, stop in slabs:
+            dest_stop = dest_start + stop - start
+            dataset.read_direct(out, np.s_[start:stop], np.s_[dest_start:dest_stop])
+            dest_start = dest_stop
+            progress.update(msg="Slab" if stage is None else f"{stage} slab")
+    return out
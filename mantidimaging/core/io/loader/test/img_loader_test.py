@@ -0,0 +1,99 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import threading
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from mantidimaging.core.io.loader import img_loader
+from mantidimaging.core.utility.progress_reporting import Progress
+
+IMAGE_SHAPE = (4, 5)
+
+
+def _fake_load(filename: str) -> np.ndarray:
+    return np.full(IMAGE_SHAPE, int(filename.split("_")[1]), dtype=np.uint16)
+
+
+class ImageLoaderTest(unittest.TestCase):
+
+    def _files(self, count: int) -> list[str]:
+        return [f"image_{i}" for i in range(count)]
+
+    def test_execute_loads_files_in_order(self):
+        for max_in_flight in [1, 4]:
+            with self.subTest(max_in_flight=max_in_flight):
+                images = img_loader.execute(_fake_load, self._files(20), "tif", np.float32, None,
+                                            max_in_flight=max_in_flight)
+
+                self.assertEqual(images.data.shape, (20, *IMAGE_SHAPE))
+                self.assertEqual(images.data.dtype, np.float32)
+                npt.assert_array_equal(images.data[:, 0, 0], np.arange(20))
+
+    def test_execute_with_indices(self):
+        images = img_loader.execute(_fake_load, self._files(20), "tif", np.float32, [2, 12, 3])
+
+        npt.assert_array_equal(images.data[:, 0, 0], [2, 5, 8, 11])
+
+    def test_parallel_load_limits_reads_in_flight(self):
+        lock = threading.Lock()
+        in_flight = 0
+        max_seen = 0
+        release = threading.Event()
+
+        def load(filename):
+            nonlocal in_flight, max_seen
+            with lock:
+                in_flight += 1
+                max_seen = max(max_seen, in_flight)
+                if in_flight == 3:
+                    release.set()
+            release.wait(timeout=5)
+            with lock:
+                in_flight -= 1
+            return _fake_load(filename)
+
+        img_loader.execute(load, self._files(30), "tif", np.float32, None, max_in_flight=3)
+
+        self.assertEqual(max_seen, 3)
+
+    def test_parallel_load_reports_progress_for_every_file(self):
+        progress = Progress()
+
+        loader = img_loader.ImageLoader(_fake_load, "tif", IMAGE_SHAPE, np.float32, None, progress, max_in_flight=4)
+        loader.load_files(self._files(10))
+
+        self.assertEqual(len([entry for entry in progress.progress_history if entry.msg.startswith("Image")]), 10)
+        self.assertTrue(progress.is_completed())
+
+    def test_wrong_image_shape(self):
+        def load(filename):
+            return np.zeros((3, 3)) if filename == "image_7" else _fake_load(filename)
+
+        expected_msg = r"different width and/or height.*Expected dimensions: \(4, 5\)"
+        for max_in_flight in [1, 4]:
+            with self.subTest(max_in_flight=max_in_flight):
+                with self.assertRaisesRegex(ValueError, expected_msg):
+                    img_loader.execute(load, self._files(10), "tif", np.float32, None, max_in_flight=max_in_flight)
+
+    def test_unreadable_file(self):
+        def load(filename):
+            if filename == "image_3":
+                raise OSError("read failed")
+            return _fake_load(filename)
+
+        for max_in_flight in [1, 4]:
+            with self.subTest(max_in_flight=max_in_flight):
+                with self.assertRaisesRegex(RuntimeError, "Could not load file image_3. Error details: read failed"):
+                    img_loader.execute(load, self._files(10), "tif", np.float32, None, max_in_flight=max_in_flight)
+
+    def test_invalid_image_dimensions(self):
+        with self.assertRaisesRegex(ValueError, "Data loaded has invalid shape"):
+            img_loader.execute(lambda _: np.zeros((2, 3, 4)), self._files(2), "tif", np.float32, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
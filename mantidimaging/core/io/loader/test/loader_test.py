@@ -1,17 +1,25 @@
 # Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
+import os
 from pathlib import Path
 from unittest import mock
 
 import numpy as np
+import numpy.testing as npt
+import astropy.io.fits as fits
+import tifffile
+from parameterized import parameterized
 
 from mantidimaging.core.io.filenames import FilenameGroup
 from mantidimaging.core.io.instrument_log import InstrumentLog
 from mantidimaging.core.io.loader.loader import (DEFAULT_PIXEL_DEPTH, DEFAULT_PIXEL_SIZE, DEFAULT_IS_SINOGRAM,
-                                                 create_loading_parameters_for_file_path, get_loader, load, _imread)
+                                                 create_loading_parameters_for_file_path, get_loader, load, _imread,
+                                                 _imread_into, get_direct_loader, probe_image,
+                                                 read_image_dimensions, _probe_image_cached)
 
 from mantidimaging.core.utility.data_containers import FILE_TYPES, ProjectionAngles
+from mantidimaging.test_helpers import FileOutputtingTestCase
 from mantidimaging.test_helpers.unit_test_helper import FakeFSTestCase
 
 
@@ -96,3 +104,107 @@ class LoaderTest(FakeFSTestCase):
         self._file_list_count_equal(filenames, reordered_filenames)
         self.assertListEqual(['foo_0.tif', 'foo_8.tif', 'foo_16.tif', 'foo_3.tif', 'foo_11.tif'],
                              reordered_filenames[:5])
+
+
+class DirectTiffLoadTest(FileOutputtingTestCase):
+
+    def _write_tiff(self, data: np.ndarray, **kwargs) -> str:
+        filename = os.path.join(self.output_directory, "image.tif")
+        tifffile.imwrite(filename, data, **kwargs)
+        return filename
+
+    @parameterized.expand([
+        ("uncompressed", {}),
+        ("big_endian", {"byteorder": ">"}),
+        ("compressed", {"compression": "zlib"}),
+        ("tiled", {"tile": (16, 16)}),
+    ])
+    def test_imread_into_casts_to_destination(self, _, write_kwargs):
+        expected = np.arange(32 * 48, dtype=np.uint16).reshape((32, 48))
+        filename = self._write_tiff(expected, **write_kwargs)
+        stack = np.zeros((3, 32, 48), dtype=np.float32)
+
+        _imread_into(filename, stack[1])
+
+        npt.assert_array_equal(stack[1], expected)
+        npt.assert_array_equal(stack[0], 0)
+        npt.assert_array_equal(stack[2], 0)
+
+    def test_imread_into_wrong_shape(self):
+        filename = self._write_tiff(np.zeros((48, 32), dtype=np.uint16))
+
+        self.assertRaisesRegex(ValueError, "expected \\(32, 48\\)", _imread_into, filename,
+                               np.zeros((32, 48), dtype=np.float32))
+
+    def test_imread_into_invalid_file(self):
+        filename = os.path.join(self.output_directory, "a.tif")
+        with open(filename, "w") as f:
+            f.write("BADDATA")
+
+        self.assertRaisesRegex(RuntimeError, filename, _imread_into, filename, np.zeros((2, 2), dtype=np.float32))
+
+    def test_get_direct_loader(self):
+        self.assertIs(get_direct_loader("tif"), _imread_into)
+        self.assertIsNone(get_direct_loader("fits"))
+
+
+class ProbeImageTest(FileOutputtingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        _probe_image_cached.cache_clear()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.output_directory, name)
+
+    @parameterized.expand([(np.uint16, ), (np.float32, ), (np.uint8, )])
+    def test_probe_tiff(self, dtype):
+        filename = self._path("image.tif")
+        tifffile.imwrite(filename, np.zeros((6, 7), dtype=dtype))
+
+        probe = probe_image(filename)
+
+        self.assertEqual(probe.shape, (6, 7))
+        self.assertEqual(probe.dtype, np.dtype(dtype))
+
+    @parameterized.expand([(np.uint16, ), (np.int16, ), (np.float32, ), (np.uint8, ), (np.int32, ), (np.float64, )])
+    def test_probe_fits_matches_loaded_data(self, dtype):
+        filename = self._path("image.fits")
+        fits.writeto(filename, np.zeros((6, 7), dtype=dtype))
+
+        probe = probe_image(filename)
+        data = fits.getdata(filename)
+
+        self.assertEqual(probe.shape, data.shape)
+        self.assertEqual(probe.dtype, data.dtype.newbyteorder("="))
+
+    def test_probe_fits_scaled_data_is_float(self):
+        filename = self._path("image.fits")
+        hdu = fits.PrimaryHDU(np.zeros((6, 7), dtype=np.int16))
+        hdu.header["BSCALE"] = 0.5
+        hdu.writeto(filename)
+
+        self.assertEqual(probe_image(filename).dtype, np.float32)
+
+    def test_probe_does_not_read_pixel_data(self):
+        filename = self._path("image.tif")
+        tifffile.imwrite(filename, np.zeros((6, 7), dtype=np.uint16))
+
+        with mock.patch("mantidimaging.core.io.loader.loader.tifffile.TiffFile.asarray") as mock_asarray:
+            self.assertEqual(read_image_dimensions(Path(filename)), (6, 7))
+        mock_asarray.assert_not_called()
+
+    def test_probe_is_cached_until_file_changes(self):
+        filename = self._path("image.tif")
+        tifffile.imwrite(filename, np.zeros((6, 7), dtype=np.uint16))
+        probe_image(filename)
+
+        with mock.patch("mantidimaging.core.io.loader.loader._tiff_probe") as mock_probe:
+            self.assertEqual(probe_image(filename).shape, (6, 7))
+            mock_probe.assert_not_called()
+
+        tifffile.imwrite(filename, np.zeros((8, 9), dtype=np.uint16))
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(probe_image(filename).shape, (8, 9))
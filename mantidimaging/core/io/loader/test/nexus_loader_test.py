@@ -0,0 +1,102 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import h5py
+import numpy as np
+import numpy.testing as npt
+
+from mantidimaging.core.io.loader.nexus_loader import image_slabs, read_images, read_images_into
+from mantidimaging.core.utility.progress_reporting import Progress
+
+
+class NexusLoaderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nexus = h5py.File("data", "w", driver="core", backing_store=False)
+        self.data_array = np.arange(12 * 3 * 4, dtype=np.uint16).reshape((12, 3, 4))
+
+    def tearDown(self) -> None:
+        self.nexus.close()
+
+    def test_read_images_converts_dtype(self):
+        dataset = self.nexus.create_dataset("data", data=self.data_array)
+        indices = [0, 1, 2, 5, 9, 10]
+
+        images = read_images(dataset, indices, np.float32)
+
+        self.assertEqual(images.array.dtype, np.float32)
+        npt.assert_array_equal(images.array, self.data_array[indices])
+
+    @mock.patch("mantidimaging.core.parallel.utility.enough_memory", return_value=False)
+    def test_read_images_into_memory_mapped_array_without_enough_memory(self, _):
+        dataset = self.nexus.create_dataset("data", data=self.data_array)
+
+        images = read_images(dataset, [1, 2, 3], np.float32)
+
+        self.assertTrue(images.is_memory_mapped)
+        npt.assert_array_equal(images.array, self.data_array[1:4])
+
+    def test_read_images_from_chunked_dataset(self):
+        dataset = self.nexus.create_dataset("data", data=self.data_array, chunks=(2, 3, 4), compression="gzip")
+        indices = np.arange(1, 12, 2)
+
+        images = read_images(dataset, indices, np.float64)
+
+        npt.assert_array_equal(images.array, self.data_array[indices])
+
+    def test_consecutive_indices_are_read_as_slices(self):
+        dataset = self.nexus.create_dataset("data", data=self.data_array)
+        out = np.zeros((6, 3, 4), dtype=np.float32)
+
+        with mock.patch.object(h5py.Dataset, "read_direct", autospec=True) as mock_read:
+            read_images_into(dataset, [1, 2, 3, 7, 8, 9], out)
+
+        source_selections = [call.args[2] for call in mock_read.call_args_list]
+        dest_selections = [call.args[3] for call in mock_read.call_args_list]
+        self.assertEqual(source_selections, [np.s_[1:4], np.s_[7:10]])
+        self.assertEqual(dest_selections, [np.s_[0:3], np.s_[3:6]])
+
+    def test_slabs_follow_chunk_boundaries(self):
+        dataset = self.nexus.create_dataset("data", data=self.data_array, chunks=(4, 3, 4))
+        out = np.zeros((10, 3, 4), dtype=np.float32)
+
+        with mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1):
+            with mock.patch.object(h5py.Dataset, "read_direct", autospec=True) as mock_read:
+                read_images_into(dataset, range(1, 11), out)
+
+        source_selections = [call.args[2] for call in mock_read.call_args_list]
+        self.assertEqual(source_selections, [np.s_[1:4], np.s_[4:8], np.s_[8:11]])
+
+    def test_progress_is_reported_per_slab(self):
+        dataset = self.nexus.create_dataset("data", data=self.data_array, chunks=(4, 3, 4))
+        progress = Progress()
+
+        with mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1):
+            read_images(dataset, range(12), np.float32, progress)
+
+        self.assertEqual(len([entry for entry in progress.progress_history if entry.msg.startswith("Slab")]), 3)
+        self.assertTrue(progress.is_completed())
+
+    def test_stages_report_to_one_progress(self):
+        dataset = self.nexus.create_dataset("data", data=self.data_array, chunks=(4, 3, 4))
+
+        with mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1):
+            num_slabs = len(image_slabs(dataset, range(0, 8))) + len(image_slabs(dataset, [9, 10]))
+            progress = Progress(num_steps=num_slabs)
+            with progress:
+                read_images(dataset, range(0, 8), np.float32, progress, stage="First")
+                self.assertFalse(progress.is_completed())
+                read_images(dataset, [9, 10], np.float32, progress, stage="Second")
+                self.assertEqual(progress.current_step, num_slabs)
+
+        messages = [entry.msg.split(" |")[0] for entry in progress.progress_history]
+        self.assertEqual(messages.count("First slab"), 2)
+        self.assertEqual(messages.count("Second slab"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,11 @@
 from __future__ import annotations
 import datetime
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import getLogger
-from typing import TYPE_CHECKING
-from collections.abc import Callable
+from typing import TYPE_CHECKING, NamedTuple
+from collections.abc import Callable, Iterator
 
 import h5py
 from pathlib import Path
@@ -16,12 +18,12 @@ from tifffile import tifffile
 from mantidimaging.core.operation_history.const import TIMESTAMP
 import astropy.io.fits as fits
 
-from .utility import DEFAULT_IO_FILE_FORMAT, NEXUS_PROCESSED_DATA_PATH
-from ..operations.rescale import RescaleFilter
+from .utility import DEFAULT_IO_FILE_FORMAT, NEXUS_PROCESSED_DATA_PATH, aligned_ranges, hdf5_slab_size
 from ..utility.progress_reporting import Progress
 from ..utility.version_check import CheckVersion
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from ..data.dataset import Dataset
     from ..data.imagestack import ImageStack
     from ..utility.data_containers import Indices
@@ -33,6 +35,30 @@ DEFAULT_NAME_PREFIX = 'image'
 DEFAULT_NAME_POSTFIX = ''
 INT16_SIZE = 65536
 
+# Number of threads writing image files at once in image_save. Writing to network storage is latency bound, so this
+# helps even though encoding each file holds the GIL for some of the time.
+SAVE_WRITER_THREADS = 4
+
+# Lossless filters that can be applied to the image data written to a NeXus file
+NEXUS_COMPRESSION_TYPES = ("gzip", "lzf")
+
+
+class StackFormat(NamedTuple):
+    """
+    A format that writes the whole stack into a single file
+    """
+    extension: str
+    # Lossless compression that can be used, with the default first. None writes the data uncompressed.
+    compression_types: tuple[str | None, ...]
+
+
+BIGTIFF_FORMAT = "bigtiff"
+NXS_FORMAT = "nxs"
+STACK_FORMATS = {
+    BIGTIFF_FORMAT: StackFormat("tiff", ("zlib", "zstd", None)),
+    NXS_FORMAT: StackFormat("nxs", (None, ) + NEXUS_COMPRESSION_TYPES),
+}
+
 package_version = CheckVersion().get_version()
 
 
@@ -49,23 +75,75 @@ def write_img(data: np.ndarray, filename: str, overwrite: bool = False, descript
 def write_nxs(data: np.ndarray,
               filename: str,
               projection_angles: np.ndarray | None = None,
-              overwrite: bool = False) -> None:
-    import h5py
-    nxs = h5py.File(filename, 'w')
-
-    # appending flat and dark images is disabled for now
-    # new shape to account for appending flat and dark images
-    # correct_shape = (data.shape[0] + 2, data.shape[1], data.shape[2])
+              overwrite: bool = False,
+              compression: str | None = None,
+              progress: Progress | None = None,
+              uint16_range: tuple[float, float] | None = None) -> None:
+    """
+    Writes a stack into a single HDF5 file, chunked so that each chunk holds one image.
+
+    :param data: The images to write
+    :param filename: The file to create
+    :param projection_angles: Rotation angles of the images, if known
+    :param overwrite: Unused, the file is always replaced
+    :param compression: One of NEXUS_COMPRESSION_TYPES to compress the images with, or None
+    :param progress: Updated as each slab of images is written
+    :param uint16_range: If given, the (min, max) range of the data that is rescaled to uint16 before writing
+    """
+    dtype = np.uint16 if uint16_range is not None else np.float32
+    with h5py.File(filename, 'w') as nxs:
+        # appending flat and dark images is disabled for now
+        # new shape to account for appending flat and dark images
+        # correct_shape = (data.shape[0] + 2, data.shape[1], data.shape[2])
+
+        dset = _create_image_dataset(nxs, "tomography/sample_data", data.shape, dtype, compression)
+        for start, stop, slab in _prepared_slabs(data, uint16_range):
+            dset[start:stop] = slab
+            if progress is not None:
+                progress.update(stop - start, msg="Image")
+        # left here if we decide to start appending the flat and dark images again
+        # dset[-2] = flat[:]
+        # dset[-1] = dark[:]
+
+        if projection_angles is not None:
+            rangle = nxs.create_dataset("tomography/rotation_angle", data=projection_angles)
+            rangle[...] = projection_angles
+
+
+def write_bigtiff(data: np.ndarray,
+                  filename: str,
+                  compression: str | None = None,
+                  progress: Progress | None = None,
+                  uint16_range: tuple[float, float] | None = None,
+                  description: str = "") -> None:
+    """
+    Writes a stack as the pages of a single BigTIFF file. The pages are compressed as they are written, so the
+    compressed stack is never held in memory.
+
+    :param data: The images to write
+    :param filename: The file to create
+    :param compression: Compression for the pages, with a predictor, or None
+    :param progress: Updated as each slab of images is written
+    :param uint16_range: If given, the (min, max) range of the data that is rescaled to uint16 before writing
+    :param description: Written as the description of the first page
+    """
 
-    dset = nxs.create_dataset("tomography/sample_data", data.shape)
-    dset[:data.shape[0]] = data[:]
-    # left here if we decide to start appending the flat and dark images again
-    # dset[-2] = flat[:]
-    # dset[-1] = dark[:]
+    def pages() -> Iterator[np.ndarray]:
+        for start, stop, slab in _prepared_slabs(data, uint16_range):
+            yield from slab
+            if progress is not None:
+                progress.update(stop - start, msg="Image")
 
-    if projection_angles is not None:
-        rangle = nxs.create_dataset("tomography/rotation_angle", data=projection_angles)
-        rangle[...] = projection_angles
+    tifffile.imwrite(filename,
+                     pages(),
+                     shape=data.shape,
+                     dtype=np.uint16 if uint16_range is not None else data.dtype,
+                     bigtiff=True,
+                     compression=compression,
+                     predictor=compression is not None,
+                     description=description,
+                     software="Mantid Imaging",
+                     metadata={"axes": "ZYX"})
 
 
 def image_save(images: ImageStack,
@@ -79,7 +157,9 @@ def image_save(images: ImageStack,
                name_postfix: str = DEFAULT_NAME_POSTFIX,
                indices: list[int] | Indices | None = None,
                pixel_depth: str | None = None,
-               progress: Progress | None = None) -> list[str]:
+               progress: Progress | None = None,
+               num_writers: int = SAVE_WRITER_THREADS,
+               compression: str | None = None) -> list[str]:
     """
     Save image volume (3d) into a series of slices along the Z axis.
     The Z axis in the script is the ndarray.shape[0].
@@ -109,6 +189,9 @@ def image_save(images: ImageStack,
     :param pixel_depth: Defines the target pixel depth of the save operation so
            np.float32 or np.int16 will ensure the values are scaled
            correctly to these values.
+    :param num_writers: Number of threads writing image files at the same time
+    :param compression: Compression for the formats in STACK_FORMATS, which write the
+           whole stack into a single file. Must be one of its compression_types.
     :returns: The filename/filenames of the saved data.
     """
     progress = Progress.ensure_instance(progress, task_name='Save')
@@ -118,9 +201,10 @@ def image_save(images: ImageStack,
     make_dirs_if_needed(output_dir, overwrite_all)
 
     # Define current parameters
-    min_value: float = np.nanmin(images.data)
-    max_value: float = np.nanmax(images.data)
-    int_16_slope = max_value / INT16_SIZE
+    statistics = images.statistics()
+    min_value = statistics.min
+    max_value = statistics.max
+    int_16_slope = float(max_value / INT16_SIZE)
 
     # Do rescale if needed.
     if pixel_depth is None or pixel_depth == "float32":
@@ -144,9 +228,21 @@ def image_save(images: ImageStack,
     if swap_axes:
         data = np.swapaxes(data, 0, 1)
 
-    if out_format in ['nxs']:
-        filename = os.path.join(output_dir, name_prefix + name_postfix)
-        write_nxs(data, filename + '.nxs', overwrite=overwrite_all)
+    uint16_range = (min_value, max_value) if pixel_depth == "int16" else None
+
+    if out_format in STACK_FORMATS:
+        stack_format = STACK_FORMATS[out_format]
+        if compression not in stack_format.compression_types:
+            raise ValueError(f"Compression {compression} can not be used with {out_format}. "
+                             f"Expected one of {stack_format.compression_types}")
+        filename = os.path.join(output_dir, name_prefix + name_postfix + "." + stack_format.extension)
+        progress.set_estimated_steps(data.shape[0])
+        with progress:
+            if out_format == BIGTIFF_FORMAT:
+                write_bigtiff(data, filename, compression, progress, uint16_range, rescale_info)
+            else:
+                write_nxs(data, filename, overwrite=overwrite_all, compression=compression, progress=progress,
+                          uint16_range=uint16_range)
         return [filename]
     else:
         if out_format in ['fit', 'fits']:
@@ -164,36 +260,132 @@ def image_save(images: ImageStack,
             names[i] = os.path.join(output_dir, names[i])
 
         with progress:
-            for idx in range(num_images):
-                # Overwrite images with the copy that has been rescaled.
-                if pixel_depth == "int16":
-                    output_data = RescaleFilter.filter_array(np.copy(images.data[idx]),
-                                                             min_input=min_value,
-                                                             max_input=max_value,
-                                                             max_output=INT16_SIZE - 1).astype(np.uint16)
-                    write_func(output_data, names[idx], overwrite_all, rescale_info)
-                else:
-                    write_func(data[idx, :, :], names[idx], overwrite_all, rescale_info)
-
-                progress.update(msg='Image')
+            _write_image_files(write_func, data, names, overwrite_all, rescale_info, progress, num_writers,
+                               uint16_range)
 
         return names
 
 
-def nexus_save(dataset: Dataset, path: str, sample_name: str, save_as_float: bool) -> None:
+def _write_image_files(write_func: Callable[[np.ndarray, str, bool, str | None], None],
+                       data: np.ndarray,
+                       names: list[str],
+                       overwrite_all: bool,
+                       rescale_info: str,
+                       progress: Progress,
+                       num_writers: int,
+                       uint16_range: tuple[float, float] | None = None) -> None:
+    """
+    Writes each image to its own file from a pool of writer threads. The images are handed to the writers a slab at a
+    time, and at most two slabs are in flight so the next slab is rescaled while the previous one is being written.
+
+    :param write_func: Function writing a single image to a file
+    :param data: The images to write
+    :param names: The file name for each image
+    :param overwrite_all: Overwrite existing files
+    :param rescale_info: Description of the rescale saved with each image
+    :param progress: Updated as each file is written
+    :param num_writers: Number of threads writing files at the same time
+    :param uint16_range: If given, the (min, max) range of the data that is rescaled to uint16 before writing
+    """
+    in_flight: deque[list[Future]] = deque()
+    with ThreadPoolExecutor(max_workers=max(num_writers, 1), thread_name_prefix="mi_save") as executor:
+        try:
+            for start, stop, slab in _prepared_slabs(data, uint16_range):
+                in_flight.append([
+                    executor.submit(write_func, slab[i], names[start + i], overwrite_all, rescale_info)
+                    for i in range(stop - start)
+                ])
+                if len(in_flight) > 1:
+                    _wait_for_writes(in_flight.popleft(), progress)
+            while in_flight:
+                _wait_for_writes(in_flight.popleft(), progress)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def _prepared_slabs(data: np.ndarray,
+                    uint16_range: tuple[float, float] | None = None) -> Iterator[tuple[int, int, np.ndarray]]:
+    """
+    Splits a stack into slabs ready to be written, rescaling each one to uint16 if needed.
+
+    :param data: The images to write
+    :param uint16_range: If given, the (min, max) range of the data that is rescaled to uint16
+    :return: An iterator of (start, stop, images) for each slab
+    """
+    slab_size = hdf5_slab_size(data.shape[1:], np.dtype(np.float64).itemsize)
+    for start, stop in aligned_ranges(0, data.shape[0], slab_size):
+        slab = data[start:stop]
+        if uint16_range is not None:
+            slab = _rescale_to_uint16(slab, *uint16_range, out=np.empty(slab.shape, dtype=np.uint16))
+        yield start, stop, slab
+
+
+def _wait_for_writes(futures: list[Future], progress: Progress) -> None:
+    for future in futures:
+        future.result()
+        progress.update(msg='Image')
+
+
+def _rescale_to_uint16(images: np.ndarray, min_value: float, max_value: float, out: np.ndarray) -> np.ndarray:
+    """
+    Rescales [min_value, max_value] to the full uint16 range for a whole slab of images at once. This gives the same
+    values as RescaleFilter.filter_array followed by a cast to uint16, without copying and interpolating each image.
+
+    :param images: The images to rescale, which are not modified
+    :param min_value: The value mapped to 0
+    :param max_value: The value mapped to the uint16 maximum
+    :param out: uint16 array with the same shape as images to write the result into
+    :return: out
+    """
+    max_output = INT16_SIZE - 1
+    scaled = np.empty(images.shape, dtype=np.float64)
+    if max_value > min_value:
+        np.subtract(images, min_value, out=scaled, dtype=np.float64)
+        # np.interp works out the slope in float64 whatever the type of the range
+        scaled *= max_output / (float(max_value) - float(min_value))
+        np.clip(scaled, 0, max_output, out=scaled)
+        # np.interp returns the end point exactly for values at the top of the range, rounding can fall just short
+        np.copyto(scaled, max_output, where=images >= max_value)
+    else:
+        scaled.fill(max_output)
+    np.nan_to_num(scaled, copy=False, nan=0.0)
+    # RescaleFilter.filter_array writes its result back into the image, so go through the image dtype to round the
+    # same way before truncating to uint16
+    out[...] = scaled.astype(images.dtype, copy=False)
+    return out
+
+
+def nexus_save(dataset: Dataset,
+               path: str,
+               sample_name: str,
+               save_as_float: bool,
+               compression: str | None = None,
+               progress: Progress | None = None) -> None:
     """
     Uses information from a Dataset to create a NeXus file.
+    The images are streamed to disk a slab at a time, rather than building the whole file in memory first.
     :param dataset: The dataset to save as a NeXus file.
     :param path: The NeXus file path.
     :param sample_name: The sample name.
+    :param save_as_float: Save the images as float32, otherwise they are scaled to int16.
+    :param compression: One of NEXUS_COMPRESSION_TYPES to compress the images with, or None.
+    :param progress: Progress reported as each slab of images is written.
     """
+    if compression is not None and compression not in NEXUS_COMPRESSION_TYPES:
+        raise ValueError(f"Unknown NeXus compression: {compression}. Expected one of {NEXUS_COMPRESSION_TYPES}")
+
+    num_images = sum(arr.shape[0] for arr in dataset.nexus_arrays) + sum(recon.num_images for recon in dataset.recons)
+    progress = Progress.ensure_instance(progress, num_steps=num_images, task_name="Save NeXus")
+
     try:
-        nexus_file = h5py.File(path, "w", driver="core")
+        nexus_file = h5py.File(path, "w")
     except OSError as exc:
         raise RuntimeError("Unable to save NeXus file. " + str(exc)) from exc
 
     try:
-        _nexus_save(nexus_file, dataset, sample_name, save_as_float)
+        with progress:
+            _nexus_save(nexus_file, dataset, sample_name, save_as_float, compression, progress)
     except OSError as exc:
         nexus_file.close()
         os.remove(path)
@@ -202,7 +394,12 @@ def nexus_save(dataset: Dataset, path: str, sample_name: str, save_as_float: boo
     nexus_file.close()
 
 
-def _nexus_save(nexus_file: h5py.File, dataset: Dataset, sample_name: str, save_as_float: bool) -> None:
+def _nexus_save(nexus_file: h5py.File,
+                dataset: Dataset,
+                sample_name: str,
+                save_as_float: bool,
+                compression: str | None = None,
+                progress: Progress | None = None) -> None:
     """
     Takes a NeXus file and writes the Dataset information to it.
     :param nexus_file: The NeXus file.
@@ -239,9 +436,10 @@ def _nexus_save(nexus_file: h5py.File, dataset: Dataset, sample_name: str, save_
     rotation_angle.attrs["units"] = "rad"
 
     if dataset.is_processed:
-        _save_processed_data_to_nexus(nexus_file, dataset, rotation_angle, detector["image_key"], save_as_float)
+        _save_processed_data_to_nexus(nexus_file, dataset, rotation_angle, detector["image_key"], save_as_float,
+                                      compression, progress)
     else:
-        _save_image_stacks_to_nexus(dataset, detector, save_as_float)
+        _save_image_stacks_to_nexus(dataset, detector, save_as_float, compression, progress)
 
     # data field
     data = tomo_entry.create_group("data")
@@ -252,16 +450,21 @@ def _nexus_save(nexus_file: h5py.File, dataset: Dataset, sample_name: str, save_
     for recon in dataset.recons:
         assert dataset.sample is not None
         assert dataset.sample.filenames is not None
-        _save_recon_to_nexus(nexus_file, recon, dataset.sample.filenames[0])
+        _save_recon_to_nexus(nexus_file, recon, dataset.sample.filenames[0], compression, progress)
 
 
-def _save_processed_data_to_nexus(nexus_file: h5py.File, dataset: Dataset, rotation_angle: h5py.Dataset,
-                                  image_key: h5py.Dataset, save_as_float: bool) -> None:
+def _save_processed_data_to_nexus(nexus_file: h5py.File,
+                                  dataset: Dataset,
+                                  rotation_angle: h5py.Dataset,
+                                  image_key: h5py.Dataset,
+                                  save_as_float: bool,
+                                  compression: str | None = None,
+                                  progress: Progress | None = None) -> None:
     data = nexus_file.create_group(NEXUS_PROCESSED_DATA_PATH)
     data["rotation_angle"] = rotation_angle
     data["image_key"] = image_key
     _set_nx_class(data, "NXdata")
-    _save_image_stacks_to_nexus(dataset, data, save_as_float)
+    _save_image_stacks_to_nexus(dataset, data, save_as_float, compression, progress)
 
     process = data.create_group("process")
     _set_nx_class(process, "NXprocess")
@@ -270,50 +473,113 @@ def _save_processed_data_to_nexus(nexus_file: h5py.File, dataset: Dataset, rotat
     process.create_dataset("version", data=np.bytes_(package_version))
 
 
-def _save_image_stacks_to_nexus(dataset: Dataset, data_group: h5py.Group, save_as_float: bool) -> None:
+def _save_image_stacks_to_nexus(dataset: Dataset,
+                                data_group: h5py.Group,
+                                save_as_float: bool,
+                                compression: str | None = None,
+                                progress: Progress | None = None) -> None:
     combined_data_shape = (sum([len(arr) for arr in dataset.nexus_arrays]), ) + dataset.nexus_arrays[0].shape[1:]
 
     index = 0
-    if save_as_float:
-        data = dataset.nexus_arrays
-        dtype = "float32"
-    else:
-        data, _ = _convert_float_to_int(dataset.nexus_arrays)
-        dtype = "int16"
+    dtype = "float32" if save_as_float else "int16"
+    nexus_data = _create_image_dataset(data_group, "data", combined_data_shape, dtype, compression)
 
-    data_group.create_dataset("data", shape=combined_data_shape, dtype=dtype)
+    factors = []
+    for stack in dataset.nexus_stacks:
+        scaling_factor = None
+        if not save_as_float:
+            statistics = stack.statistics()
+            scaling_factor = _int16_scaling_factor(statistics.min, statistics.max)
+        _write_images(nexus_data, stack.data, index, progress, scaling_factor)
+        if scaling_factor is not None:
+            factors.append(scaling_factor)
+        index += stack.data.shape[0]
+
+    if factors:
+        nexus_data.attrs["scaling_factors"] = factors
+
+
+def _create_image_dataset(group: h5py.Group, name: str, shape: tuple[int, ...], dtype: npt.DTypeLike,
+                          compression: str | None) -> h5py.Dataset:
+    """
+    Creates a dataset for a stack of images, chunked so that each chunk holds a single image.
+    :param group: The group to create the dataset in.
+    :param name: The dataset name.
+    :param shape: The shape of the stack.
+    :param dtype: The dtype of the dataset.
+    :param compression: The compression filter to use, or None.
+    :return: The new dataset.
+    """
+    return group.create_dataset(name,
+                                shape=shape,
+                                dtype=dtype,
+                                chunks=(1, ) + tuple(shape[1:]),
+                                compression=compression,
+                                shuffle=compression is not None)
+
+
+def _write_images(nexus_data: h5py.Dataset,
+                  images: np.ndarray,
+                  start: int,
+                  progress: Progress | None = None,
+                  scaling_factor: float | None = None) -> None:
+    """
+    Writes a stack of images into a dataset a slab at a time, so only a slab is ever converted to the dtype of the
+    dataset at once.
+    :param nexus_data: The dataset to write to.
+    :param images: The images to write.
+    :param start: The index in the dataset of the first image.
+    :param progress: Progress updated with the number of images in each slab.
+    :param scaling_factor: If given, the images are scaled by this and rounded to int16 before they are written.
+    """
+    slab_size = hdf5_slab_size(images.shape[1:], nexus_data.dtype.itemsize, nexus_data.chunks)
+    buffer = None
+    if scaling_factor is not None:
+        buffer = np.empty((min(slab_size, images.shape[0]), ) + images.shape[1:], dtype=np.int16)
 
-    for arr in data:
-        data_group["data"][index:index + arr.shape[0]] = arr
-        index += arr.shape[0]
+    for slab_start, slab_stop in aligned_ranges(0, images.shape[0], slab_size):
+        slab = images[slab_start:slab_stop]
+        if buffer is not None and scaling_factor is not None:
+            slab = _scale_to_int16(slab, scaling_factor, buffer[:slab_stop - slab_start])
+        nexus_data[start + slab_start:start + slab_stop] = slab
+        if progress is not None:
+            progress.update(steps=slab_stop - slab_start, msg="Image")
 
 
-def _convert_float_to_int(arrays: list[np.ndarray]) -> tuple[list[np.ndarray], list[int]]:
+def _int16_scaling_factor(min_value: float, max_value: float) -> float:
     """
-    Scales a float array to convert it to ints.
-    :param arrays: The dataset arrays.
-    :return: A list of int arrays and a list of scaling factors.
+    Finds the factor that scales the largest magnitude in a float array to the int16 maximum.
+    :param min_value: The smallest value in the array.
+    :param max_value: The largest value in the array.
+    :return: The scaling factor, 1 if the array is all zeros.
     """
-    converted = []
-    factors = []
-
-    def scale_row(row):
-        return np.round(row * scaling_factor).astype("int16")
+    largest = max(abs(min_value), abs(max_value))
+    return float(np.iinfo("int16").max / largest) if largest else 1.0
 
-    for arr in arrays:
-        scaling_factor = np.iinfo("int16").max / max(abs(arr.min()), abs(arr.max()))
-        scaled_arr = np.apply_along_axis(scale_row, axis=1, arr=arr)
-        converted.append(scaled_arr)
-        factors.append(scaling_factor)
 
-    return converted, factors
+def _scale_to_int16(arr: np.ndarray, scaling_factor: float, out: np.ndarray) -> np.ndarray:
+    """
+    Scales and rounds a float array into a preallocated int16 array.
+    :param arr: The float array.
+    :param scaling_factor: The factor to multiply the values by.
+    :param out: The int16 array to write into, with the same shape as arr.
+    :return: out
+    """
+    np.rint(np.multiply(arr, scaling_factor), out=out, casting="unsafe")
+    return out
 
 
-def _save_recon_to_nexus(nexus_file: h5py.File, recon: ImageStack, sample_path: str) -> None:
+def _save_recon_to_nexus(nexus_file: h5py.File,
+                         recon: ImageStack,
+                         sample_path: str,
+                         compression: str | None = None,
+                         progress: Progress | None = None) -> None:
     """
     Saves a recon to a NeXus file.
     :param nexus_file: The NeXus file.
     :param recon: The recon data.
+    :param compression: The compression filter to use for the recon data, or None.
+    :param progress: Progress updated as the recon data is written.
     """
     recon_entry = nexus_file.create_group(recon.name)
     _set_nx_class(recon_entry, "NXentry")
@@ -351,8 +617,8 @@ def _save_recon_to_nexus(nexus_file: h5py.File, recon: ImageStack, sample_path:
     data = recon_entry.create_group("data")
     _set_nx_class(data, "NXdata")
 
-    data.create_dataset("data", shape=recon.data.shape, dtype="float32")
-    data["data"][:] = recon.data
+    recon_data = _create_image_dataset(data, "data", recon.data.shape, "float32", compression)
+    _write_images(recon_data, recon.data, 0, progress)
 
     x_arr, y_arr, z_arr = _create_pixel_size_arrays(recon)
     data.create_dataset("x", shape=x_arr.shape, dtype="float16", data=x_arr)
@@ -10,9 +10,12 @@ from unittest import mock
 import h5py
 import numpy as np
 import numpy.testing as npt
+from parameterized import parameterized
+from tifffile import tifffile
 
 from mantidimaging.core.io.filenames import FilenameGroup
 from mantidimaging.core.io.utility import NEXUS_PROCESSED_DATA_PATH
+from mantidimaging.core.operations.rescale import RescaleFilter
 from mantidimaging.core.operation_history.const import TIMESTAMP
 
 import mantidimaging.test_helpers.unit_test_helper as th
@@ -21,7 +24,8 @@ from mantidimaging.core.data.dataset import Dataset
 from mantidimaging.core.io import loader
 from mantidimaging.core.io import saver
 from mantidimaging.core.io.saver import _rescale_recon_data, _save_recon_to_nexus, _save_processed_data_to_nexus, \
-    _save_image_stacks_to_nexus, _convert_float_to_int
+    _save_image_stacks_to_nexus, _int16_scaling_factor, _scale_to_int16
+from mantidimaging.core.utility.progress_reporting import Progress
 from mantidimaging.core.utility.version_check import CheckVersion
 from mantidimaging.test_helpers import FileOutputtingTestCase
 
@@ -176,6 +180,103 @@ class IOTest(FileOutputtingTestCase):
 
         npt.assert_equal(loaded_images.data, images.data)
 
+    @mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1)
+    def test_parallel_save_keeps_names_and_order(self):
+        images = th.generate_images()
+        progress = Progress()
+
+        names = saver.image_save(images, self.output_directory, num_writers=4, indices=[5, 15, 1], progress=progress)
+
+        self.assertEqual([os.path.basename(name) for name in names],
+                         [f"image_{i:06d}.tif" for i in range(5, 5 + images.num_images)])
+        for idx, name in enumerate(names):
+            npt.assert_equal(tifffile.imread(name), images.data[idx])
+        self.assertEqual(len([entry for entry in progress.progress_history if entry.msg.startswith("Image")]),
+                         images.num_images)
+
+    @mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1)
+    def test_int16_save_matches_rescale_filter(self):
+        images = th.generate_images()
+        images.data[0, 0, 0] = np.nan
+        min_value, max_value = np.nanmin(images.data), np.nanmax(images.data)
+
+        names = saver.image_save(images, self.output_directory, pixel_depth="int16")
+
+        for idx, name in enumerate(names):
+            expected = RescaleFilter.filter_array(np.copy(images.data[idx]), min_value, max_value, saver.INT16_SIZE - 1)
+            npt.assert_equal(tifffile.imread(name), np.nan_to_num(expected).astype(np.uint16))
+
+    def test_int16_rescale_matches_rescale_filter_at_bin_edges(self):
+        min_value, max_value = np.float32(-0.3), np.float32(1.7)
+        edges = np.linspace(min_value, max_value, saver.INT16_SIZE, dtype=np.float32)
+        # Each bin edge and the float32 values either side of it
+        images = np.stack([np.nextafter(edges, -np.inf), edges, np.nextafter(edges, np.inf)]).reshape(3, 256, 256)
+
+        rescaled = saver._rescale_to_uint16(images, min_value, max_value, out=np.empty(images.shape, np.uint16))
+
+        for idx, image in enumerate(images):
+            expected = RescaleFilter.filter_array(np.copy(image), min_value, max_value, saver.INT16_SIZE - 1)
+            npt.assert_equal(rescaled[idx], expected.astype(np.uint16))
+
+    def test_failed_image_write_is_raised(self):
+        images = th.generate_images()
+
+        with mock.patch("mantidimaging.core.io.saver.write_img", side_effect=OSError("disk full")):
+            with self.assertRaisesRegex(OSError, "disk full"):
+                saver.image_save(images, self.output_directory)
+
+    @parameterized.expand([("zlib", tifffile.COMPRESSION.ADOBE_DEFLATE), ("zstd", tifffile.COMPRESSION.ZSTD),
+                           (None, tifffile.COMPRESSION.NONE)])
+    def test_save_bigtiff_stack(self, compression, expected_compression):
+        images = th.generate_images()
+
+        names = saver.image_save(images,
+                                 self.output_directory,
+                                 out_format=saver.BIGTIFF_FORMAT,
+                                 compression=compression)
+
+        self.assertEqual(names, [os.path.join(self.output_directory, "image.tiff")])
+        with tifffile.TiffFile(names[0]) as tif:
+            self.assertTrue(tif.is_bigtiff)
+            self.assertEqual(len(tif.pages), images.num_images)
+            self.assertEqual(tif.pages[0].compression, expected_compression)
+            npt.assert_equal(tif.asarray(), images.data)
+
+    @mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1)
+    def test_save_bigtiff_stack_as_int16(self):
+        images = th.generate_images()
+
+        names = saver.image_save(images, self.output_directory, out_format=saver.BIGTIFF_FORMAT, pixel_depth="int16")
+
+        stack = tifffile.imread(names[0])
+        self.assertEqual(stack.dtype, np.uint16)
+        self.assertEqual(stack.shape, images.data.shape)
+        self.assertEqual(stack.max(), saver.INT16_SIZE - 1)
+
+    @parameterized.expand([(None, ), ("gzip", ), ("lzf", )])
+    def test_save_hdf5_stack(self, compression):
+        images = th.generate_images()
+        progress = Progress()
+
+        names = saver.image_save(images,
+                                 self.output_directory,
+                                 out_format=saver.NXS_FORMAT,
+                                 compression=compression,
+                                 progress=progress)
+
+        self.assertEqual(names, [os.path.join(self.output_directory, "image.nxs")])
+        with h5py.File(names[0], "r") as nexus_file:
+            data = nexus_file["tomography/sample_data"]
+            self.assertEqual(data.chunks, (1, ) + images.data.shape[1:])
+            self.assertEqual(data.compression, compression)
+            npt.assert_equal(np.array(data), images.data)
+        self.assertTrue(progress.is_completed())
+
+    def test_save_stack_with_unsupported_compression(self):
+        with self.assertRaisesRegex(ValueError, "can not be used with bigtiff"):
+            saver.image_save(th.generate_images(), self.output_directory, out_format=saver.BIGTIFF_FORMAT,
+                             compression="lzf")
+
     def test_metadata_round_trip(self):
         # Create dummy image stack
         sample = th.gen_img_numpy_rand()
@@ -477,14 +578,96 @@ class IOTest(FileOutputtingTestCase):
             _save_image_stacks_to_nexus(ds, data, False)
             self.assertEqual(data["data"].dtype, "int16")
 
-    def test_convert_float_to_int(self):
-        n_arrs = 3
-        float_arr = [th.gen_img_numpy_rand() for _ in range(3)]
-        conv, factors = _convert_float_to_int(float_arr)
+    @mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1)
+    def test_save_image_stacks_to_nexus_as_int_scales_each_stack(self):
+        sample = th.generate_images(seed=1)
+        flat = th.generate_images(seed=2)
+        flat.data *= 10
+        ds = Dataset(sample=sample, flat_before=flat)
+
+        with h5py.File("path", "w", driver="core", backing_store=False) as nexus_file:
+            data = nexus_file.create_group("data")
+            _save_image_stacks_to_nexus(ds, data, False)
+
+            factors = [_int16_scaling_factor(float(arr.min()), float(arr.max())) for arr in ds.nexus_arrays]
+            expected = [np.round(arr * factor).astype(np.int16) for arr, factor in zip(ds.nexus_arrays, factors)]
+            npt.assert_array_equal(np.array(data["data"]), np.concatenate(expected))
+            npt.assert_array_equal(data["data"].attrs["scaling_factors"], factors)
+
+    def test_save_image_stacks_to_nexus_as_int_uses_stack_statistics(self):
+        sample = th.generate_images(seed=1)
+        sample.data[0, 0, 0] = np.nan
+        statistics = sample.statistics()
+        ds = Dataset(sample=sample)
+
+        with h5py.File("path", "w", driver="core", backing_store=False) as nexus_file:
+            data = nexus_file.create_group("data")
+            with mock.patch("mantidimaging.core.data.imagestack.compute_statistics") as compute_statistics:
+                _save_image_stacks_to_nexus(ds, data, False)
+
+            compute_statistics.assert_not_called()
+            expected_factor = np.iinfo(np.int16).max / max(abs(statistics.min), abs(statistics.max))
+            npt.assert_allclose(data["data"].attrs["scaling_factors"], [expected_factor])
+
+    def test_scale_to_int16_matches_rounding_each_value(self):
+        float_arr = th.gen_img_numpy_rand(seed=3) - 0.5
+        factor = _int16_scaling_factor(float(float_arr.min()), float(float_arr.max()))
+
+        conv = _scale_to_int16(float_arr, factor, np.empty(float_arr.shape, dtype=np.int16))
+
+        self.assertEqual(conv.dtype, np.int16)
+        npt.assert_array_equal(conv, np.round(float_arr * factor).astype(np.int16))
+        self.assertEqual(np.abs(conv).max(), np.iinfo(np.int16).max)
+
+    def test_int16_scaling_factor_all_zeros(self):
+        self.assertEqual(_int16_scaling_factor(0.0, 0.0), 1.0)
+
+    def test_image_stacks_saved_one_image_per_chunk(self):
+        ds = Dataset(sample=th.generate_images())
+
+        with h5py.File("path", "w", driver="core", backing_store=False) as nexus_file:
+            data = nexus_file.create_group("data")
+            _save_image_stacks_to_nexus(ds, data, True)
+            self.assertEqual(data["data"].chunks, (1, ) + ds.sample.data.shape[1:])
+            self.assertIsNone(data["data"].compression)
+
+    @parameterized.expand([("gzip", ), ("lzf", )])
+    def test_nexus_save_compressed(self, compression: str):
+        sample = th.generate_images()
+        sample.data *= 12
+        sample._projection_angles = sample.projection_angles()
+        sd = Dataset(sample=sample)
+        sd.sample.record_operation("", "")
+        path = os.path.join(self.output_directory, "compressed.nxs")
+
+        saver.nexus_save(sd, path, "sample-name", True, compression)
+
+        with h5py.File(path, "r") as nexus_file:
+            data = nexus_file[NEXUS_PROCESSED_DATA_PATH]["data"]
+            self.assertEqual(data.compression, compression)
+            self.assertTrue(data.shuffle)
+            npt.assert_array_equal(np.array(data), sd.sample.data.astype("float32"))
+
+    def test_nexus_save_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            saver.nexus_save(Dataset(sample=th.generate_images()), "path", "sample-name", True, "zip")
+
+    @mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 1)
+    def test_nexus_save_streams_slabs_with_progress(self):
+        sample = th.generate_images()
+        sample._projection_angles = sample.projection_angles()
+        sd = Dataset(sample=sample)
+        path = os.path.join(self.output_directory, "streamed.nxs")
+        progress = Progress()
+
+        saver.nexus_save(sd, path, "sample-name", True, progress=progress)
 
-        for i in range(n_arrs):
-            close_arr = np.isclose(conv[i] / factors[i], float_arr[i], rtol=1e-5)
-            self.assertTrue(np.count_nonzero(close_arr) >= len(close_arr) * 0.75)
+        slabs = [entry for entry in progress.progress_history if entry.msg.startswith("Image")]
+        self.assertEqual(len(slabs), sample.num_images)
+        self.assertTrue(progress.is_completed())
+        with h5py.File(path, "r") as nexus_file:
+            npt.assert_array_equal(np.array(nexus_file["entry1/tomo_entry/instrument/detector/data"]),
+                                   sample.data.astype("float32"))
 
     def test_create_rits_format(self):
         tof = np.array([1, 2, 3])
@@ -2,7 +2,13 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
-from mantidimaging.core.io.utility import find_first_file_that_is_possibly_a_sample
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+
+from mantidimaging.core.io.utility import find_first_file_that_is_possibly_a_sample, hdf5_slab_size, \
+    aligned_ranges, index_runs
 from mantidimaging.test_helpers.unit_test_helper import FakeFSTestCase
 
 
@@ -21,3 +27,34 @@ class UtilityTest(FakeFSTestCase):
 
         found = find_first_file_that_is_possibly_a_sample("a")
         self.assertIsNone(found)
+
+
+class SlabTest(unittest.TestCase):
+
+    @parameterized.expand([
+        ("unchunked", (1000, 1000), 4, None, 16),
+        ("rounded_to_chunks", (1000, 1000), 4, (5, 1000, 1000), 15),
+        ("chunk_larger_than_slab", (1000, 1000), 4, (20, 1000, 1000), 20),
+        ("huge_image", (10000, 10000), 4, None, 1),
+    ])
+    def test_hdf5_slab_size(self, _, image_shape, itemsize, chunks, expected):
+        with mock.patch("mantidimaging.core.io.utility.HDF5_SLAB_BYTES", 64 * 1000**2):
+            self.assertEqual(hdf5_slab_size(image_shape, itemsize, chunks), expected)
+
+    @parameterized.expand([
+        ("aligned", 0, 10, 5, [(0, 5), (5, 10)]),
+        ("unaligned_start", 3, 12, 5, [(3, 5), (5, 10), (10, 12)]),
+        ("within_one_step", 6, 8, 5, [(6, 8)]),
+        ("empty", 4, 4, 5, []),
+    ])
+    def test_aligned_ranges(self, _, start, stop, step, expected):
+        self.assertEqual(aligned_ranges(start, stop, step), expected)
+
+    @parameterized.expand([
+        ("consecutive", [2, 3, 4], [(2, 5)]),
+        ("gaps", [0, 1, 4, 5, 6, 9], [(0, 2), (4, 7), (9, 10)]),
+        ("single", [7], [(7, 8)]),
+        ("empty", [], []),
+    ])
+    def test_index_runs(self, _, indices, expected):
+        self.assertEqual(index_runs(indices), expected)
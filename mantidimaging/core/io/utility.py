@@ -14,6 +14,9 @@ NEXUS_PROCESSED_DATA_PATH = 'processed-data'
 
 THRESHOLD_180 = np.radians(1)
 
+# Approximate amount of data read or written at once when streaming a stack to or from an HDF5 file
+HDF5_SLAB_BYTES = 64 * 1024**2
+
 
 def find_first_file_that_is_possibly_a_sample(file_path: str) -> str | None:
     """
@@ -32,6 +35,47 @@ def find_first_file_that_is_possibly_a_sample(file_path: str) -> str | None:
     return None
 
 
+def hdf5_slab_size(image_shape: tuple[int, ...], itemsize: int, chunks: tuple[int, ...] | None = None) -> int:
+    """
+    Number of images to read or write at once when streaming a stack to or from an HDF5 dataset. This is about
+    HDF5_SLAB_BYTES of data, rounded to a whole number of chunks along the first axis so that no chunk is visited twice.
+
+    :param image_shape: Shape of a single image
+    :param itemsize: Size of a single element in the dataset
+    :param chunks: Chunk shape of the dataset, or None if it is not chunked
+    """
+    image_bytes = max(int(np.prod(image_shape)) * itemsize, 1)
+    slab_size = max(HDF5_SLAB_BYTES // image_bytes, 1)
+    if chunks:
+        slab_size = max(slab_size // chunks[0], 1) * chunks[0]
+    return slab_size
+
+
+def aligned_ranges(start: int, stop: int, step: int) -> list[tuple[int, int]]:
+    """
+    Split [start, stop) into (start, stop) ranges that break at multiples of step
+    """
+    ranges = []
+    while start < stop:
+        end = min((start // step + 1) * step, stop)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def index_runs(indices: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Split increasing indices into runs of consecutive values, as (start, stop) ranges
+    """
+    indices = np.asarray(indices)
+    if indices.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [indices.size]))
+    return [(int(indices[a]), int(indices[b - 1]) + 1) for a, b in zip(starts, stops, strict=True)]
+
+
 def find_projection_closest_to_180(projections: np.ndarray, projection_angles: np.ndarray) -> tuple[np.ndarray, float]:
     """
     Finds the projection closest to 180 and returns it with the difference.
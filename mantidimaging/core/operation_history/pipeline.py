@@ -0,0 +1,206 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import inspect
+from logging import getLogger
+from typing import Any, TYPE_CHECKING
+from collections.abc import Iterable
+
+from mantidimaging import helper as h
+from mantidimaging.core.operations.loader import load_filter_packages
+from mantidimaging.core.parallel import shared as ps
+from mantidimaging.core.utility.progress_reporting import Progress
+from . import const
+from .operations import MODULE_NOT_FOUND, deserialize_metadata
+
+if TYPE_CHECKING:
+    import numpy as np
+    from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.operations.loader import BaseFilterClass
+    from mantidimaging.core.parallel.shared import ComputeFuncType
+    from .operations import ImageOperation
+
+LOG = getLogger(__name__)
+
+# Entries in the operation history that record a result found for the stack rather than a change to its data
+RECORD_ONLY_OPERATIONS = {const.OPERATION_NAME_COR_TILT_FINDING}
+
+
+class FusedStage:
+    """
+    Consecutive operations that each process a single image independently and in place. They are all applied to one
+    image before moving on to the next, so the stack is only streamed through memory once for the whole stage.
+    """
+
+    def __init__(self) -> None:
+        self.operations: list[ImageOperation] = []
+        self.filter_classes: list[BaseFilterClass] = []
+        self.compute_funcs: list[ComputeFuncType] = []
+        self.params: list[dict[str, Any]] = []
+        self.thread_safe = True
+
+    def add(self, operation: ImageOperation, filter_class: BaseFilterClass, compute_func: ComputeFuncType,
+            params: dict[str, Any]) -> None:
+        self.operations.append(operation)
+        self.filter_classes.append(filter_class)
+        self.compute_funcs.append(compute_func)
+        self.params.append(params)
+        self.thread_safe = self.thread_safe and filter_class.thread_safe
+
+    def check(self, images: ImageStack) -> None:
+        """
+        Check that every operation of the stage can be applied to the images, before any of them change the images
+        """
+        h.check_data_stack(images)
+        for filter_class, params in zip(self.filter_classes, self.params, strict=True):
+            filter_class.check_projection_compute(images, params)
+
+    def run(self, images: ImageStack, progress: Progress | None = None) -> ImageStack:
+        self.check(images)
+        ps.run_compute_func(_FusedComputeFunction(self.compute_funcs),
+                            images.data.shape[0],
+                            images.shared_array, {'stages': self.params},
+                            progress,
+                            thread_safe=self.thread_safe)
+        return images
+
+
+class BarrierStage:
+    """
+    An operation that needs the whole stack, works on sinograms or changes the shape of the data. It is run through
+    its filter_func once all of the previous operations have finished with every image.
+    """
+
+    def __init__(self, operation: ImageOperation, filter_class: BaseFilterClass | None, filter_kwargs: dict[str, Any]):
+        self.operations = [operation]
+        self.filter_class = filter_class
+        self.filter_kwargs = filter_kwargs
+
+    def run(self, images: ImageStack, progress: Progress | None = None) -> ImageStack:
+        if self.filter_class is None:
+            # Only the axes swap is run without a filter, see plan_pipeline
+            images.swap_axes(progress)
+            return images
+        result = self.filter_class.filter_func(images, progress=progress, **self.filter_kwargs)
+        return result if result is not None else images
+
+
+class _FusedComputeFunction:
+
+    def __init__(self, compute_funcs: list[ComputeFuncType]):
+        self.compute_funcs = compute_funcs
+
+    def __call__(self, i: int, array: np.ndarray, params: dict[str, Any]) -> None:
+        for compute_func, func_params in zip(self.compute_funcs, params['stages'], strict=True):
+            compute_func(i, array, func_params)  # type: ignore[arg-type]
+
+
+def _filter_kwargs(operation: ImageOperation, filter_class: BaseFilterClass,
+                   stacks: dict[str, ImageStack | None]) -> dict[str, Any]:
+    """
+    Get the kwargs to run the operation with, adding the stacks that its filter_func takes and checking that the
+    filter_func accepts all of them.
+    """
+    signature = inspect.signature(filter_class.filter_func)
+    kwargs = dict(operation.filter_kwargs)
+    kwargs.update({name: stack for name, stack in stacks.items() if name in signature.parameters})
+    try:
+        signature.bind(None, **kwargs)
+    except TypeError as exc:
+        raise ValueError(f"Invalid parameters for {operation.display_name or operation.filter_name}: {exc}") from exc
+    return kwargs
+
+
+def plan_pipeline(operations: Iterable[ImageOperation],
+                  filters: dict[str, BaseFilterClass] | None = None,
+                  stacks: dict[str, ImageStack | None] | None = None) -> list[FusedStage | BarrierStage]:
+    """
+    Split the operations into stages. Runs of operations that provide a per-image compute function are fused into a
+    single stage, every other operation is a barrier in the order it was given.
+
+    The parameters of every operation are checked before any stage is run.
+
+    :param operations: The operations to run, in order
+    :param filters: Filter classes by their class name, loaded from the operations package if not given
+    :param stacks: Stacks by parameter name, e.g. flat_before, passed to the operations that take them. The operation
+                   history does not keep these.
+    """
+    if filters is None:
+        filters = {f.__name__: f for f in load_filter_packages()}
+    if stacks is None:
+        stacks = {}
+
+    stages: list[FusedStage | BarrierStage] = []
+    for operation in operations:
+        if operation.filter_name == const.OPERATION_NAME_AXES_SWAP:
+            stages.append(BarrierStage(operation, None, {}))
+            continue
+        try:
+            filter_class = filters[operation.filter_name]
+        except KeyError as exc:
+            msg = MODULE_NOT_FOUND.format(operation.filter_name)
+            LOG.error(msg)
+            raise KeyError(msg) from exc
+
+        filter_kwargs = _filter_kwargs(operation, filter_class, stacks)
+        compute = filter_class.projection_compute(**filter_kwargs)
+        if compute is None:
+            stages.append(BarrierStage(operation, filter_class, filter_kwargs))
+            continue
+        if not stages or not isinstance(stages[-1], FusedStage):
+            stages.append(FusedStage())
+        stages[-1].add(operation, filter_class, *compute)
+    return stages
+
+
+def run_pipeline(images: ImageStack,
+                 operations: Iterable[ImageOperation],
+                 progress: Progress | None = None,
+                 record: bool = True,
+                 stacks: dict[str, ImageStack | None] | None = None) -> ImageStack:
+    """
+    Apply the operations to the images, fusing neighbouring per-image operations so that each image is processed by
+    all of them while it is still in cache.
+
+    :param images: The images to process. Operations that change the shape of the data, or swap the axes of a stack
+                   that does not have as many projections as rows, replace its array.
+    :param operations: The operations to apply, in order
+    :param progress: Progress reported by each stage as it runs
+    :param record: Record each operation in the operation history of the returned stack
+    :param stacks: Stacks by parameter name, e.g. flat_before, passed to the operations that take them
+    :return: The processed images
+    """
+    stages = plan_pipeline(operations, stacks=stacks)
+    # Stages after a barrier are checked as they start, as the barrier may change the shape of the images
+    if stages and isinstance(stages[0], FusedStage):
+        stages[0].check(images)
+    progress = Progress.ensure_instance(progress, task_name="Operation pipeline")
+    with progress:
+        for stage in stages:
+            names = ", ".join(op.display_name or op.filter_name for op in stage.operations)
+            LOG.info("Running pipeline stage: %s", names)
+            progress.update(0, msg=names)
+            images = stage.run(images, progress)
+            if record:
+                for op in stage.operations:
+                    images.record_operation(op.filter_name, op.display_name, **op.filter_kwargs)
+    return images
+
+
+def replay_history(images: ImageStack,
+                   metadata: dict[str, Any],
+                   progress: Progress | None = None,
+                   stacks: dict[str, ImageStack | None] | None = None) -> ImageStack:
+    """
+    Apply the operations from the operation history of another stack to the images, through the pipeline. Entries
+    that only record a result found for that stack, like its centre of rotation, are skipped.
+
+    :param images: The images to process
+    :param metadata: The metadata of the stack whose operations are applied
+    :param progress: Progress reported by each stage as it runs
+    :param stacks: Stacks by parameter name, e.g. flat_before, passed to the operations that take them
+    :return: The processed images
+    """
+    operations = [op for op in deserialize_metadata(metadata) if op.filter_name not in RECORD_ONLY_OPERATIONS]
+    return run_pipeline(images, operations, progress, stacks=stacks)
@@ -0,0 +1,220 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import numpy.testing as npt
+
+from mantidimaging.core.operation_history import const
+from mantidimaging.core.operation_history.operations import MODULE_NOT_FOUND, ImageOperation
+from mantidimaging.core.operation_history.pipeline import (BarrierStage, FusedStage, plan_pipeline, replay_history,
+                                                           run_pipeline)
+from mantidimaging.core.operations.arithmetic import ArithmeticFilter
+from mantidimaging.core.operations.clip_values import ClipValuesFilter
+from mantidimaging.core.operations.crop_coords import CropCoordinatesFilter
+from mantidimaging.core.operations.flat_fielding import FlatFieldFilter
+from mantidimaging.core.utility.progress_reporting import Progress
+from mantidimaging.test_helpers.unit_test_helper import generate_images
+
+ARITHMETIC = ImageOperation("ArithmeticFilter", {"mult_val": 2.0, "add_val": 1.0}, "Arithmetic")
+CLIP = ImageOperation("ClipValuesFilter", {"clip_min": 0.5, "clip_max": 2.0}, "Clip Values")
+CROP = ImageOperation("CropCoordinatesFilter", {"region_of_interest": [0, 0, 5, 4]}, "Crop Coordinates")
+MEDIAN_GPU = ImageOperation("MedianFilter", {"size": 3, "force_cpu": False}, "Median")
+FLAT_FIELD = ImageOperation("FlatFieldFilter", {"selected_flat_fielding": "Only Before", "use_dark": True},
+                            "Flat-fielding")
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_per_image_operations_are_fused_between_barriers(self):
+        stages = plan_pipeline([ARITHMETIC, CLIP, CROP, ARITHMETIC])
+
+        self.assertEqual([type(stage) for stage in stages], [FusedStage, BarrierStage, FusedStage])
+        self.assertEqual(stages[0].operations, [ARITHMETIC, CLIP])
+        self.assertEqual(stages[1].operations, [CROP])
+        self.assertEqual(stages[2].operations, [ARITHMETIC])
+
+    def test_fused_stage_is_only_thread_safe_if_every_filter_is(self):
+        self.assertTrue(ArithmeticFilter.thread_safe)
+        self.assertFalse(ClipValuesFilter.thread_safe)
+
+        self.assertTrue(plan_pipeline([ARITHMETIC])[0].thread_safe)
+        self.assertFalse(plan_pipeline([ARITHMETIC, CLIP])[0].thread_safe)
+
+    def test_filter_that_can_not_be_fused_is_a_barrier(self):
+        stages = plan_pipeline([MEDIAN_GPU])
+
+        self.assertIsInstance(stages[0], BarrierStage)
+
+    def test_axes_swap_is_a_barrier(self):
+        stages = plan_pipeline([ImageOperation(const.OPERATION_NAME_AXES_SWAP, {}, "Axes Swapped")])
+
+        self.assertIsInstance(stages[0], BarrierStage)
+
+    def test_unknown_filter(self):
+        with self.assertRaisesRegex(KeyError, MODULE_NOT_FOUND.format("NonExistingFilter12")):
+            plan_pipeline([ImageOperation("NonExistingFilter12", {}, "unknown")])
+
+    def test_invalid_params_fail_before_processing(self):
+        bad_arithmetic = ImageOperation("ArithmeticFilter", {"div_val": 0.0}, "Arithmetic")
+
+        with self.assertRaises(ValueError):
+            plan_pipeline([ARITHMETIC, bad_arithmetic])
+
+    def test_invalid_barrier_params_fail_before_processing(self):
+        bad_crop = ImageOperation("CropCoordinatesFilter", {"region": [0, 0, 5, 4]}, "Crop Coordinates")
+
+        with self.assertRaisesRegex(ValueError, "Invalid parameters for Crop Coordinates"):
+            plan_pipeline([ARITHMETIC, bad_crop])
+
+    def test_flat_fielding_is_fused_with_the_stacks_given(self):
+        flat_before, dark_before = generate_images(), generate_images()
+
+        stacks = {"flat_before": flat_before, "dark_before": dark_before}
+
+        stages = plan_pipeline([FLAT_FIELD, ARITHMETIC], stacks=stacks)
+
+        self.assertEqual([type(stage) for stage in stages], [FusedStage])
+
+    def test_flat_fielding_without_stacks_fails_before_processing(self):
+        with self.assertRaisesRegex(ValueError, "flat_before is required"):
+            plan_pipeline([ARITHMETIC, FLAT_FIELD])
+
+    def test_run_flat_fielding_matches_filter_func(self):
+        images, flat_before, dark_before = generate_images(), generate_images(), generate_images()
+        expected = images.copy()
+        FlatFieldFilter.filter_func(expected,
+                                    flat_before=flat_before,
+                                    dark_before=dark_before,
+                                    selected_flat_fielding="Only Before")
+
+        result = run_pipeline(images, [FLAT_FIELD],
+                              stacks={
+                                  "flat_before": flat_before,
+                                  "dark_before": dark_before,
+                                  "flat_after": None,
+                                  "dark_after": None
+                              })
+
+        npt.assert_allclose(result.data, expected.data, rtol=1e-6)
+        self.assertEqual(result.metadata[const.OPERATION_HISTORY][0][const.OPERATION_KEYWORD_ARGS],
+                         FLAT_FIELD.filter_kwargs)
+
+    def test_run_flat_fielding_of_wrong_shape_fails_before_processing(self):
+        images = generate_images()
+        stacks = {"flat_before": generate_images((2, 4, 4)), "dark_before": generate_images((2, 4, 4))}
+        original = images.data.copy()
+
+        with self.assertRaisesRegex(ValueError, "Not all images are the expected shape"):
+            run_pipeline(images, [ARITHMETIC, FLAT_FIELD], stacks=stacks)
+
+        npt.assert_array_equal(images.data, original)
+        self.assertFalse(images.is_processed)
+
+    def test_fused_stage_after_barrier_checked_before_it_runs(self):
+        images = generate_images()
+        stacks = {"flat_before": generate_images((2, 4, 4)), "dark_before": generate_images((2, 4, 4))}
+        stages = plan_pipeline([CROP, ARITHMETIC, FLAT_FIELD], stacks=stacks)
+        cropped = stages[0].run(images)
+        self.assertEqual(cropped.data.shape[1:], (4, 5))
+        original = cropped.data.copy()
+
+        with self.assertRaisesRegex(ValueError, "Not all images are the expected shape"):
+            stages[1].run(cropped)
+
+        npt.assert_array_equal(cropped.data, original)
+
+    def test_run_checks_data_stack(self):
+        with self.assertRaisesRegex(ValueError, "3 dimensions"):
+            run_pipeline(generate_images((8, 10)), [ARITHMETIC])
+
+    def test_stages_report_to_the_progress(self):
+        images = generate_images()
+        progress = Progress()
+
+        run_pipeline(images, [ARITHMETIC, CROP], progress)
+
+        messages = [entry.msg.split(" | ")[0] for entry in progress.progress_history]
+        self.assertIn("Arithmetic", messages)
+        self.assertIn("Crop Coordinates", messages)
+        # The fused stage reports each image it processes, not just the end of the stage
+        self.assertGreater(messages.index("Crop Coordinates") - messages.index("Arithmetic"), 1)
+        self.assertTrue(progress.complete)
+
+    def test_replay_history_skips_record_only_entries(self):
+        source = generate_images()
+        source.record_operation(ARITHMETIC.filter_name, ARITHMETIC.display_name, **ARITHMETIC.filter_kwargs)
+        source.record_operation(const.OPERATION_NAME_COR_TILT_FINDING, "Calculated COR/Tilt", rotation_centre=5.0)
+        images = generate_images()
+        expected = images.copy()
+        ArithmeticFilter.filter_func(expected, mult_val=2.0, add_val=1.0)
+
+        result = replay_history(images, source.metadata)
+
+        npt.assert_array_equal(result.data, expected.data)
+        history = result.metadata[const.OPERATION_HISTORY]
+        self.assertEqual([entry[const.OPERATION_NAME] for entry in history], ["ArithmeticFilter"])
+
+    def test_run_matches_running_filters_one_at_a_time(self):
+        images = generate_images()
+        expected = images.copy()
+        ArithmeticFilter.filter_func(expected, mult_val=2.0, add_val=1.0)
+        ClipValuesFilter.filter_func(expected, clip_min=0.5, clip_max=2.0)
+        CropCoordinatesFilter.filter_func(expected, region_of_interest=[0, 0, 5, 4])
+        ArithmeticFilter.filter_func(expected, mult_val=2.0, add_val=1.0)
+
+        result = run_pipeline(images, [ARITHMETIC, CLIP, CROP, ARITHMETIC])
+
+        npt.assert_array_equal(result.data, expected.data)
+
+    def test_run_records_operations(self):
+        images = generate_images()
+
+        result = run_pipeline(images, [ARITHMETIC, CLIP])
+
+        history = result.metadata[const.OPERATION_HISTORY]
+        self.assertEqual([entry[const.OPERATION_NAME] for entry in history], ["ArithmeticFilter", "ClipValuesFilter"])
+        self.assertEqual(history[0][const.OPERATION_KEYWORD_ARGS], ARITHMETIC.filter_kwargs)
+
+    def test_run_without_recording(self):
+        images = generate_images()
+
+        result = run_pipeline(images, [ARITHMETIC], record=False)
+
+        self.assertNotIn(const.OPERATION_HISTORY, result.metadata)
+
+    def test_fused_stage_streams_stack_once(self):
+        images = generate_images()
+
+        with mock.patch("mantidimaging.core.operation_history.pipeline.ps.run_compute_func") as run_compute_func:
+            run_pipeline(images, [ARITHMETIC, CLIP, ARITHMETIC])
+
+        run_compute_func.assert_called_once()
+        self.assertEqual(len(run_compute_func.call_args.args[3]["stages"]), 3)
+
+    def test_run_axes_swap(self):
+        images = generate_images()
+        expected = np.swapaxes(images.data, 0, 1).copy()
+
+        result = run_pipeline(images, [ImageOperation(const.OPERATION_NAME_AXES_SWAP, {}, "Axes Swapped")])
+
+        npt.assert_array_equal(result.data, expected)
+        self.assertTrue(result.is_sinograms)
+
+    def test_run_axes_swap_of_square_stack_is_in_place(self):
+        images = generate_images((8, 8, 5))
+        expected = np.swapaxes(images.data, 0, 1).copy()
+        shared_array = images.shared_array
+
+        result = run_pipeline(images, [ImageOperation(const.OPERATION_NAME_AXES_SWAP, {}, "Axes Swapped")])
+
+        self.assertIs(result, images)
+        self.assertIs(result.shared_array, shared_array)
+        npt.assert_array_equal(result.data, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,9 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from collections.abc import Callable
 
-from mantidimaging.gui.utility.qt_helpers import add_property_to_form, MAX_SPIN_BOX, Type
 from mantidimaging.core.operations.base_filter import BaseFilter
 from mantidimaging.core.parallel import shared as ps
 
@@ -13,6 +12,7 @@ if TYPE_CHECKING:
     import numpy as np
     from mantidimaging.gui.mvp_base import BaseMainWindowView
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
     from PyQt5.QtWidgets import QFormLayout, QWidget, QDoubleSpinBox
 
 
@@ -25,6 +25,7 @@ class ArithmeticFilter(BaseFilter):
 
     """
     filter_name = "Arithmetic"
+    thread_safe = True
 
     @staticmethod
     def filter_func(images: ImageStack,
@@ -43,14 +44,28 @@ class ArithmeticFilter(BaseFilter):
         :param progress: The Progress object isn't used.
         :return: The processed ImageStack object.
         """
+        compute_func, params = ArithmeticFilter.projection_compute(div_val=div_val,
+                                                                   mult_val=mult_val,
+                                                                   add_val=add_val,
+                                                                   sub_val=sub_val)
+        ps.run_compute_func(compute_func,
+                            images.data.shape[0],
+                            images.shared_array,
+                            params,
+                            progress,
+                            thread_safe=ArithmeticFilter.thread_safe)
+
+        return images
+
+    @staticmethod
+    def projection_compute(div_val: float = 1.0,
+                           mult_val: float = 1.0,
+                           add_val: float = 0.0,
+                           sub_val: float = 0.0) -> tuple[ComputeFuncType, dict[str, Any]]:
         if div_val == 0 or mult_val == 0:
             raise ValueError("Unable to proceed with operation because division/multiplication value is zero.")
 
-        params = {'div': div_val, 'mult': mult_val, 'add': add_val, 'sub': sub_val}
-        ps.run_compute_func(ArithmeticFilter.compute_function, images.data.shape[0], images.shared_array, params,
-                            progress)
-
-        return images
+        return ArithmeticFilter.compute_function, {'div': div_val, 'mult': mult_val, 'add': add_val, 'sub': sub_val}
 
     @staticmethod
     def compute_function(i: int, array: np.ndarray, params: dict[str, float]):
@@ -58,6 +73,8 @@ class ArithmeticFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form: QFormLayout, on_change: Callable, view: BaseMainWindowView) -> dict[str, QWidget]:
+        from mantidimaging.gui.utility.qt_helpers import add_property_to_form, MAX_SPIN_BOX, Type
+
         _, mult_input_widget = add_property_to_form('Multiply',
                                                     Type.FLOAT,
                                                     form=form,
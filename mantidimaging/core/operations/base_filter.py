@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from PyQt5.QtWidgets import QFormLayout, QWidget  # noqa: F401   # pragma: no cover
     from mantidimaging.gui.mvp_base import BaseMainWindowView  # pragma: no cover
     from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
+    from mantidimaging.core.parallel.shared import ComputeFuncType
 
 
 class FilterGroup(Enum):
@@ -29,6 +30,8 @@ class BaseFilter:
     show_negative_overlay = True
     operate_on_sinograms = False
     allow_for_180_projection = True
+    # The compute function mostly runs code that releases the GIL and is safe to run on threads sharing the data
+    thread_safe = False
 
     SINOGRAM_FILTER_INFO = "This filter will work on a\nsinogram view of the data."
 
@@ -52,6 +55,31 @@ class BaseFilter:
         raise_not_implemented("filter_func")
         return ImageStack(np.asarray([]))
 
+    @staticmethod
+    def projection_compute(**kwargs) -> tuple[ComputeFuncType, dict[str, Any]] | None:
+        """
+        Gets the per-image compute function and its params for the given filter_func kwargs.
+
+        Only filters that process each image independently and in place provide this, so that they can be fused with
+        their neighbours by the operation pipeline. Filters that change the shape of the data, need the whole stack or
+        work on sinograms return None and are run through filter_func instead.
+
+        :param kwargs: the same keyword arguments that filter_func takes, without the data and progress
+        :return: the compute function and params to run it with, or None if the filter can not be fused
+        """
+        return None
+
+    @staticmethod
+    def check_projection_compute(images: ImageStack, params: dict[str, Any]) -> None:
+        """
+        Checks that the params from projection_compute can be used on the images, raising a ValueError if not. The
+        operation pipeline calls this before running a fused stage, so that no operation of the stage has changed the
+        images when a later one fails.
+
+        :param images: the images the compute function will be run on
+        :param params: the params from projection_compute
+        """
+
     @staticmethod
     def execute_wrapper(args) -> partial:
         """
@@ -9,7 +9,6 @@ import numpy as np
 import tomopy
 from mantidimaging.core.parallel import shared as ps
 from mantidimaging.core.operations.base_filter import BaseFilter
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
@@ -57,6 +56,7 @@ class CircularMaskFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         _, radius_field = add_property_to_form('Radius',
@@ -12,6 +12,7 @@ from mantidimaging.core.parallel import shared as ps
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
 
 
 class ClipValuesFilter(BaseFilter):
@@ -54,6 +55,19 @@ class ClipValuesFilter(BaseFilter):
 
         :return: The processed 3D numpy.ndarray.
         """
+        compute_func, params = ClipValuesFilter.projection_compute(clip_min=clip_min,
+                                                                   clip_max=clip_max,
+                                                                   clip_min_new_value=clip_min_new_value,
+                                                                   clip_max_new_value=clip_max_new_value)
+        ps.run_compute_func(compute_func, data.data.shape[0], [data.shared_array], params, progress)
+
+        return data
+
+    @staticmethod
+    def projection_compute(clip_min=None,
+                           clip_max=None,
+                           clip_min_new_value=None,
+                           clip_max_new_value=None) -> tuple[ComputeFuncType, dict[str, Any]]:
         # We're using is None because 0.0 is a valid value
         if clip_min is None and clip_max is None:
             raise ValueError('At least one of clip_min or clip_max must be supplied')
@@ -63,11 +77,7 @@ class ClipValuesFilter(BaseFilter):
             'clip_min_new_value': clip_min_new_value,
             'clip_max_new_value': clip_max_new_value
         }
-
-        ps.run_compute_func(ClipValuesFilter.compute_function, data.data.shape[0], [data.shared_array], params,
-                            progress)
-
-        return data
+        return ClipValuesFilter.compute_function, params
 
     @staticmethod
     def compute_function(i: int, array: np.ndarray, params: dict[str, Any]):
@@ -10,7 +10,6 @@ from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import utility as pu
 from mantidimaging.core.utility.progress_reporting import Progress
 from mantidimaging.core.utility.sensible_roi import SensibleROI
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
@@ -75,6 +74,7 @@ class CropCoordinatesFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
         label, roi_field = add_property_to_form("ROI",
                                                 Type.STR,
@@ -11,7 +11,6 @@ import numpy as np
 
 from mantidimaging.core.parallel import shared as ps
 from mantidimaging.core.operations.base_filter import BaseFilter
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from PyQt5.QtWidgets import QFormLayout, QDoubleSpinBox, QComboBox
@@ -59,6 +58,7 @@ class DivideFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form: QFormLayout, on_change: Callable, view: BasePresenter) -> dict[str, Any]:
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         _, value_widget = add_property_to_form("Divide by",
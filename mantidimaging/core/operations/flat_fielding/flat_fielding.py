@@ -4,18 +4,18 @@ from __future__ import annotations
 
 from functools import partial
 from typing import Any, TYPE_CHECKING
-from PyQt5.QtWidgets import QComboBox, QCheckBox
 
 import numpy as np
 
 from mantidimaging import helper as h
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility.qt_helpers import Type
-from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
+    from PyQt5.QtWidgets import QComboBox, QCheckBox
+    from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
 
 # The smallest and largest allowed pixel value
 MINIMUM_PIXEL_VALUE = 1e-9
@@ -85,6 +85,23 @@ class FlatFieldFilter(BaseFilter):
         :return: Filtered data (stack of images)
         """
         h.check_data_stack(images)
+        compute_func, params = FlatFieldFilter.projection_compute(flat_before, flat_after, dark_before, dark_after,
+                                                                  selected_flat_fielding, use_dark)
+        FlatFieldFilter.check_projection_compute(images, params)
+
+        params = {name: value.astype(images.data.dtype, copy=False) for name, value in params.items()}
+        ps.run_compute_func(compute_func, len(images.data), [images.shared_array], params, progress)
+
+        h.check_data_stack(images)
+        return images
+
+    @staticmethod
+    def projection_compute(flat_before: ImageStack | None = None,
+                           flat_after: ImageStack | None = None,
+                           dark_before: ImageStack | None = None,
+                           dark_after: ImageStack | None = None,
+                           selected_flat_fielding: str | None = None,
+                           use_dark: bool = True) -> tuple[ComputeFuncType, dict[str, Any]]:
         if selected_flat_fielding not in ["Both, concatenated", "Only Before", "Only After"]:
             raise ValueError(f"Invalid flat fielding method: {selected_flat_fielding}")
 
@@ -122,33 +139,47 @@ class FlatFieldFilter(BaseFilter):
         if dark_avg is None:
             dark_avg = np.zeros_like(flat_avg)
 
-        if flat_avg is not None and dark_avg is not None:
-            if flat_avg.ndim != 2 or dark_avg.ndim != 2:
-                raise ValueError(
-                    f"Incorrect shape of the flat image ({flat_avg.shape}) or dark image ({dark_avg.shape}) "
-                    f"which should match the shape of the sample images ({images.data.shape[1:]})")
-            if not (images.data.shape[1:] == flat_avg.shape == dark_avg.shape):
-                raise ValueError(f"Not all images are the expected shape: {images.data.shape[1:]}, instead "
-                                 f"flat had shape: {flat_avg.shape}, and dark had shape: {dark_avg.shape}")
-
-        params = {'flat_avg': flat_avg, 'dark_avg': dark_avg}
-        ps.run_compute_func(FlatFieldFilter._compute_flat_field, len(images.data), [images.shared_array], params)
-
-        h.check_data_stack(images)
-        return images
+        if flat_avg.ndim != 2 or dark_avg.ndim != 2:
+            raise ValueError(f"Incorrect shape of the flat image ({flat_avg.shape}) or dark image ({dark_avg.shape}) "
+                             "which should match the shape of the sample images")
+        if flat_avg.shape != dark_avg.shape:
+            raise ValueError(f"The flat image has shape {flat_avg.shape}, but the dark image has shape "
+                             f"{dark_avg.shape}")
+
+        # Stacks are loaded as float32, filter_func casts these to the dtype of the images it is given
+        params = {
+            'dark_avg': dark_avg.astype(np.float32, copy=False),
+            'norm_reciprocal': FlatFieldFilter._calculate_norm_reciprocal(flat_avg, dark_avg, np.float32)
+        }
+        return FlatFieldFilter._compute_flat_field, params
 
     @staticmethod
-    def _compute_flat_field(index: int, array: np.ndarray, params: dict):
-        flat_avg = params['flat_avg']
-        dark_avg = params['dark_avg']
+    def check_projection_compute(images: ImageStack, params: dict[str, Any]) -> None:
+        if not (images.data.shape[1:] == params['dark_avg'].shape):
+            raise ValueError(f"Not all images are the expected shape: {images.data.shape[1:]}, instead "
+                             f"flat and dark had shape: {params['dark_avg'].shape}")
 
+    @staticmethod
+    def _calculate_norm_reciprocal(flat_avg: np.ndarray, dark_avg: np.ndarray, dtype) -> np.ndarray:
+        """
+        Calculate 1 / (flat - dark) once for the whole stack, so that each projection only needs a multiply.
+        Pixels where the flat and dark are equal use :data:`MINIMUM_PIXEL_VALUE` as the denominator.
+        """
         norm_divide = flat_avg - dark_avg
         norm_divide[norm_divide == 0] = MINIMUM_PIXEL_VALUE
-        array[index] -= dark_avg
-        array[index] /= norm_divide
+        return np.reciprocal(norm_divide, out=norm_divide).astype(dtype, copy=False)
+
+    @staticmethod
+    def _compute_flat_field(index: int, array: np.ndarray, params: dict):
+        image = array[index]
+        np.subtract(image, params['dark_avg'], out=image)
+        np.multiply(image, params['norm_reciprocal'], out=image)
 
     @staticmethod
     def register_gui(form, on_change, view) -> dict[str, Any]:
+        from PyQt5.QtWidgets import QComboBox, QCheckBox
+        from mantidimaging.gui.utility.qt_helpers import Type
+        from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
         from mantidimaging.gui.utility import add_property_to_form
 
         _, selected_flat_fielding_widget = add_property_to_form("Flat Fielding Method",
@@ -264,6 +295,8 @@ class FlatFieldFilter(BaseFilter):
 
     @staticmethod
     def validate_execute_kwargs(kwargs):
+        from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
+
         # Validate something is in both path text inputs
         if 'selected_flat_fielding_widget' not in kwargs:
             return False
@@ -11,7 +11,7 @@ import numpy as np
 import numpy.testing as npt
 
 import mantidimaging.test_helpers.unit_test_helper as th
-from mantidimaging.core.operations.flat_fielding.flat_fielding import enable_correct_fields_only
+from mantidimaging.core.operations.flat_fielding.flat_fielding import enable_correct_fields_only, MINIMUM_PIXEL_VALUE
 from mantidimaging.core.operations.flat_fielding import FlatFieldFilter
 
 if TYPE_CHECKING:
@@ -99,6 +99,50 @@ class FlatFieldingTest(unittest.TestCase):
 
         npt.assert_almost_equal(result.data, expected, 7)
 
+    def test_equal_flat_and_dark_uses_minimum_pixel_value(self):
+        images, flat_before, dark_before, _, _ = self._make_images()
+        images.data[:] = 6.
+        flat_before.data[:] = 5.
+        dark_before.data[:] = 5.
+
+        result = FlatFieldFilter.filter_func(images,
+                                             flat_before=flat_before,
+                                             dark_before=dark_before,
+                                             selected_flat_fielding="Only Before")
+
+        npt.assert_allclose(result.data, 1 / MINIMUM_PIXEL_VALUE, rtol=1e-6)
+
+    def test_projection_compute_matches_filter_func(self):
+        images, flat_before, dark_before, _, _ = self._make_images()
+        expected = images.copy()
+        FlatFieldFilter.filter_func(expected,
+                                    flat_before=flat_before,
+                                    dark_before=dark_before,
+                                    selected_flat_fielding="Only Before")
+
+        compute_func, params = FlatFieldFilter.projection_compute(flat_before=flat_before,
+                                                                  dark_before=dark_before,
+                                                                  selected_flat_fielding="Only Before")
+        for i in range(images.num_images):
+            compute_func(i, images.data, params)
+
+        npt.assert_array_equal(images.data, expected.data)
+
+    def test_projection_compute_raises_for_missing_stack(self):
+        with self.assertRaisesRegex(ValueError, "flat_after is required"):
+            FlatFieldFilter.projection_compute(selected_flat_fielding="Only After")
+
+    def test_raises_for_flat_of_wrong_shape(self):
+        images, flat_before, dark_before, _, _ = self._make_images()
+        flat_before = th.generate_images((2, 4, 4))
+        dark_before = th.generate_images((2, 4, 4))
+
+        with self.assertRaisesRegex(ValueError, "Not all images are the expected shape"):
+            FlatFieldFilter.filter_func(images,
+                                        flat_before=flat_before,
+                                        dark_before=dark_before,
+                                        selected_flat_fielding="Only Before")
+
     def test_execute_wrapper_return_is_runnable(self):
         """
         Test that the partial returned by execute_wrapper can be executed (kwargs are named correctly)
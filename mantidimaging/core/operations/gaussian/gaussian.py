@@ -3,18 +3,17 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import scipy.ndimage as scipy_ndimage
 
 from mantidimaging import helper as h
 from mantidimaging.core.operations.base_filter import BaseFilter
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility import add_property_to_form
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
     import numpy as np
 
 
@@ -27,6 +26,7 @@ class GaussianFilter(BaseFilter):
     """
     filter_name = "Gaussian"
     link_histograms = True
+    thread_safe = True
 
     @staticmethod
     def filter_func(data: ImageStack, size=None, mode=None, order=None, progress=None):
@@ -49,15 +49,24 @@ class GaussianFilter(BaseFilter):
         """
         h.check_data_stack(data)
 
-        if not size or not size > 1:
-            raise ValueError(f'Size parameter must be greater than 1, but value provided was {size}')
-
-        params = {'size': size, 'mode': mode, 'order': order}
-        ps.run_compute_func(GaussianFilter.compute_function, data.data.shape[0], data.shared_array, params, progress)
+        compute_func, params = GaussianFilter.projection_compute(size=size, mode=mode, order=order)
+        ps.run_compute_func(compute_func,
+                            data.data.shape[0],
+                            data.shared_array,
+                            params,
+                            progress,
+                            thread_safe=GaussianFilter.thread_safe)
 
         h.check_data_stack(data)
         return data
 
+    @staticmethod
+    def projection_compute(size=None, mode=None, order=None) -> tuple[ComputeFuncType, dict[str, Any]]:
+        if not size or not size > 1:
+            raise ValueError(f'Size parameter must be greater than 1, but value provided was {size}')
+
+        return GaussianFilter.compute_function, {'size': size, 'mode': mode, 'order': order}
+
     @staticmethod
     def compute_function(i: int, array: np.ndarray, params):
         scipy_ndimage.gaussian_filter(array[i],
@@ -68,6 +77,9 @@ class GaussianFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility import add_property_to_form
+        from mantidimaging.gui.utility.qt_helpers import Type
+
         _, size_field = add_property_to_form('Kernel Size',
                                              Type.INT,
                                              3, (2, 1000),
@@ -1,10 +1,9 @@
 # Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
+import importlib
 import os
 import pkgutil
-import sys
-from importlib.util import module_from_spec
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,25 +15,13 @@ _OPERATION_MODULES_LIST: list[BaseFilterClass] = []
 
 def _find_operation_modules() -> list[BaseFilterClass]:
     module_list: list[BaseFilterClass] = []
-    for finder, module_name, ispkg in pkgutil.walk_packages([os.path.dirname(__file__)]):
-        if not ispkg:
+    for _, module_name, ispkg in pkgutil.iter_modules([os.path.dirname(__file__)]):
+        if not ispkg or module_name == "test":
             continue
 
-        if getattr(sys, 'frozen', False):
-            # Need to prevent importing standard library test modules found by pkgutil
-            if "test.support" in module_name:
-                continue
-            # If we're running a PyInstaller executable then we need to use a full module path
-            module_name = f'mantidimaging.core.operations.{module_name}'
-
-        # near impossible to type check as find can be a pyinstaller specific type that we can't normally import
-        spec = finder.find_spec(module_name)  # type: ignore[call-arg]
-
-        assert spec is not None
-        assert spec.loader is not None
-        module = module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
+        # Always import with the full module path. The compute functions are pickled by module name when they are sent
+        # to the process pool, so the workers can then import just the operations they need
+        module = importlib.import_module(f'{__package__}.{module_name}')
         if hasattr(module, 'FILTER_CLASS'):
             module_list.append(module.FILTER_CLASS)
 
@@ -8,9 +8,6 @@ from typing import Any, TYPE_CHECKING
 from collections.abc import Callable
 
 import numpy as np
-from PyQt5.QtGui import QValidator
-from PyQt5.QtWidgets import QSpinBox, QLabel, QSizePolicy
-
 import scipy.ndimage as scipy_ndimage
 
 from mantidimaging import helper as h
@@ -18,43 +15,11 @@ from mantidimaging.core.gpu import utility as gpu
 from mantidimaging.core.operations.base_filter import BaseFilter
 from mantidimaging.core.parallel import shared as ps
 from mantidimaging.core.utility.progress_reporting import Progress
-from mantidimaging.gui.utility import add_property_to_form
-from mantidimaging.gui.utility.qt_helpers import Type, on_change_and_disable
 
 if TYPE_CHECKING:
     from PyQt5.QtWidgets import QFormLayout  # pragma: no cover
     from mantidimaging.core.data import ImageStack
-
-KERNEL_SIZE_TOOLTIP = "Size of the median filter kernel"
-
-
-class KernelSpinBox(QSpinBox):
-
-    def __init__(self, on_change: Callable):
-        """
-        Spin box for entering kernel sizes that only accepts odd numbers.
-        :param on_change: The function to be called when the value changes.
-        """
-        super().__init__()
-        self.setMinimum(3)
-        self.setMaximum(999)
-        self.setSingleStep(2)
-        self.setKeyboardTracking(False)
-        self.setToolTip(KERNEL_SIZE_TOOLTIP)
-        self.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
-        self.valueChanged.connect(lambda: on_change_and_disable(self, on_change))
-
-    def validate(self, input: str, pos: int) -> tuple[QValidator.State, str, int]:
-        """
-        Validate the spin box input. Returns as Intermediate state if the input is empty or contains an even number,
-        otherwise it returns Acceptable.
-        """
-        if not input:
-            return QValidator.State.Intermediate, input, pos
-        kernel_size = int(input)
-        if kernel_size % 2 != 0:
-            return QValidator.State.Acceptable, input, pos
-        return QValidator.State.Intermediate, input, pos
+    from mantidimaging.core.parallel.shared import ComputeFuncType
 
 
 class MedianFilter(BaseFilter):
@@ -69,6 +34,7 @@ class MedianFilter(BaseFilter):
     """
     filter_name = "Median"
     link_histograms = True
+    thread_safe = True
 
     @staticmethod
     def filter_func(data: ImageStack, size=None, mode="reflect", progress=None, force_cpu=True):
@@ -90,13 +56,28 @@ class MedianFilter(BaseFilter):
         if size is None or size <= 1:
             raise ValueError(f'Size parameter must be greater than 1, but value provided was {size}')
 
-        params = {'mode': mode, 'size': size, 'force_cpu': force_cpu}
         if force_cpu:
-            ps.run_compute_func(MedianFilter.compute_function, data.data.shape[0], data.shared_array, params, progress)
+            compute_func, params = MedianFilter.projection_compute(size=size, mode=mode)
+            ps.run_compute_func(compute_func,
+                                data.data.shape[0],
+                                data.shared_array,
+                                params,
+                                progress,
+                                thread_safe=MedianFilter.thread_safe)
         else:
             _execute_gpu(data.data, size, mode, progress=None)
         return data
 
+    @staticmethod
+    def projection_compute(size=None, mode="reflect", force_cpu=True) -> tuple[ComputeFuncType, dict[str, Any]] | None:
+        if not force_cpu:
+            # The GPU implementation runs on the whole stack at once
+            return None
+        if size is None or size <= 1:
+            raise ValueError(f'Size parameter must be greater than 1, but value provided was {size}')
+
+        return MedianFilter.compute_function, {'mode': mode, 'size': size}
+
     @staticmethod
     def compute_function(i: int, array: np.ndarray, params: dict[str, Any]):
         mode = params['mode']
@@ -106,6 +87,10 @@ class MedianFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form: QFormLayout, on_change: Callable, view) -> dict[str, Any]:
+        from PyQt5.QtWidgets import QLabel
+        from mantidimaging.gui.utility import add_property_to_form
+        from mantidimaging.gui.utility.qt_helpers import Type
+        from mantidimaging.gui.widgets.kernel_spin_box.kernel_spin_box import KernelSpinBox, KERNEL_SIZE_TOOLTIP
 
         # Create a spin box for kernel size without add_property_to_form in order to allow a custom validate method
         size_field = KernelSpinBox(on_change)
@@ -10,11 +10,11 @@ from scipy.ndimage import median_filter
 
 from mantidimaging.core.operations.base_filter import BaseFilter
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from PyQt5.QtWidgets import QFormLayout, QWidget
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
     from mantidimaging.gui.mvp_base import BaseMainWindowView
     from collections.abc import Callable
 
@@ -49,18 +49,20 @@ class NaNRemovalFilter(BaseFilter):
         :return: The ImageStack object with the NaNs replaced.
         """
 
+        compute_func, params = NaNRemovalFilter.projection_compute(replace_value=replace_value, mode_value=mode_value)
+        ps.run_compute_func(compute_func, data.data.shape[0], data.shared_array, params, progress)
+
+        return data
+
+    @staticmethod
+    def projection_compute(replace_value=None, mode_value="Constant") -> tuple[ComputeFuncType, dict]:
         if mode_value == "Constant":
-            params = {'replace_value': replace_value}
-            ps.run_compute_func(NaNRemovalFilter.compute_constant_function, data.data.shape[0], data.shared_array,
-                                params, progress)
+            return NaNRemovalFilter.compute_constant_function, {'replace_value': replace_value}
         elif mode_value == "Median":
-            ps.run_compute_func(NaNRemovalFilter.compute_median_function, data.data.shape[0], data.shared_array, {},
-                                progress)
+            return NaNRemovalFilter.compute_median_function, {}
         else:
             raise ValueError(f"Unknown mode: '{mode_value}'. Should be one of {NaNRemovalFilter.MODES}")
 
-        return data
-
     @staticmethod
     def compute_constant_function(i: int, array: np.ndarray, params: dict):
         replace_value = params['replace_value']
@@ -73,6 +75,7 @@ class NaNRemovalFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form: QFormLayout, on_change: Callable, view: BaseMainWindowView) -> dict[str, QWidget]:
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         value_range = (-10000000, 10000000)
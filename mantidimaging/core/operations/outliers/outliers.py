@@ -10,11 +10,10 @@ from scipy.ndimage import median_filter
 
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility import add_property_to_form
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
     from mantidimaging.core.utility.progress_reporting import Progress
 
 OUTLIERS_DARK = 'dark'
@@ -53,17 +52,20 @@ class OutliersFilter(BaseFilter):
 
         :return: The processed 3D numpy.ndarray
         """
+        compute_func, params = OutliersFilter.projection_compute(diff=diff, radius=radius, mode=mode)
+        ps.run_compute_func(compute_func, images.data.shape[0], images.shared_array, params, progress)
+
+        return images
+
+    @staticmethod
+    def projection_compute(diff=None, radius=_default_radius, mode=_default_mode) -> tuple[ComputeFuncType, dict]:
         if not diff or not diff > 0:
             raise ValueError(f'diff parameter must be greater than 0. Value provided was {diff}')
 
         if not radius or not radius > 0:
             raise ValueError(f'radius parameter must be greater than 0. Value provided was {radius}')
 
-        params = {'diff': diff, 'radius': radius, 'mode': mode}
-        ps.run_compute_func(OutliersFilter.compute_function, images.data.shape[0], images.shared_array, params,
-                            progress)
-
-        return images
+        return OutliersFilter.compute_function, {'diff': diff, 'radius': radius, 'mode': mode}
 
     @staticmethod
     def compute_function(i: int, array: np.ndarray, params):
@@ -79,6 +81,9 @@ class OutliersFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility import add_property_to_form
+        from mantidimaging.gui.utility.qt_helpers import Type
+
         _, diff_field = add_property_to_form('Difference',
                                              'float',
                                              1000,
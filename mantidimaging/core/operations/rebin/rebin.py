@@ -10,8 +10,6 @@ from skimage.transform import resize
 
 from mantidimaging.core.operations.base_filter import BaseFilter
 from mantidimaging.core.parallel import utility as pu, shared as ps
-from mantidimaging.gui.utility import add_property_to_form
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
@@ -69,6 +67,9 @@ class RebinFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility import add_property_to_form
+        from mantidimaging.gui.utility.qt_helpers import Type
+
         # Rebin by uniform factor options
         _, factor = add_property_to_form('Factor',
                                          'float',
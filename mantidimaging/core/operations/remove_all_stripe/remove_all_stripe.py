@@ -9,7 +9,6 @@ from algotom.prep.removal import remove_all_stripe
 
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from numpy import ndarray
@@ -34,6 +33,7 @@ class RemoveAllStripesFilter(BaseFilter):
     filter_name = "Remove all stripes"
     link_histograms = True
     operate_on_sinograms = True
+    thread_safe = True
 
     @staticmethod
     def filter_func(images: ImageStack, snr=3, la_size=61, sm_size=21, dim=1, progress=None):
@@ -56,7 +56,12 @@ class RemoveAllStripesFilter(BaseFilter):
         else:
             compute_func = RemoveAllStripesFilter.compute_function
 
-        ps.run_compute_func(compute_func, images.num_sinograms, images.shared_array, params, progress)
+        ps.run_compute_func(compute_func,
+                            images.num_sinograms,
+                            images.shared_array,
+                            params,
+                            progress,
+                            thread_safe=RemoveAllStripesFilter.thread_safe)
         return images
 
     @staticmethod
@@ -69,6 +74,7 @@ class RemoveAllStripesFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         label, _ = add_property_to_form(BaseFilter.SINOGRAM_FILTER_INFO, Type.LABEL, form=form, on_change=on_change)
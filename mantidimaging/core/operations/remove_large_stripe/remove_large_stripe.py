@@ -9,7 +9,6 @@ from algotom.prep.removal import remove_large_stripe
 
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data.imagestack import ImageStack
@@ -34,6 +33,7 @@ class RemoveLargeStripesFilter(BaseFilter):
     filter_name = "Remove large stripes"
     link_histograms = True
     operate_on_sinograms = True
+    thread_safe = True
 
     @staticmethod
     def filter_func(images: ImageStack, snr=3, la_size=61, progress=None):
@@ -48,7 +48,12 @@ class RemoveLargeStripesFilter(BaseFilter):
             compute_func = RemoveLargeStripesFilter.compute_function_sino
         else:
             compute_func = RemoveLargeStripesFilter.compute_function
-        ps.run_compute_func(compute_func, images.num_sinograms, images.shared_array, params, progress)
+        ps.run_compute_func(compute_func,
+                            images.num_sinograms,
+                            images.shared_array,
+                            params,
+                            progress,
+                            thread_safe=RemoveLargeStripesFilter.thread_safe)
         return images
 
     @staticmethod
@@ -61,6 +66,7 @@ class RemoveLargeStripesFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
         label, _ = add_property_to_form(BaseFilter.SINOGRAM_FILTER_INFO, Type.LABEL, form=form, on_change=on_change)
 
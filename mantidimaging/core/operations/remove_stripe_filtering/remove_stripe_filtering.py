@@ -9,7 +9,6 @@ from algotom.prep.removal import remove_stripe_based_filtering, remove_stripe_ba
 
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from numpy import ndarray
@@ -34,6 +33,7 @@ class RemoveStripeFilteringFilter(BaseFilter):
     filter_name = "Remove stripes with filtering"
     link_histograms = True
     operate_on_sinograms = True
+    thread_safe = True
 
     @staticmethod
     def filter_func(images: ImageStack, sigma=3, size=21, window_dim=1, filtering_dim=1, progress=None):
@@ -65,7 +65,12 @@ class RemoveStripeFilteringFilter(BaseFilter):
             else:
                 compute_func = RemoveStripeFilteringFilter.compute_function_2d
 
-        ps.run_compute_func(compute_func, images.num_sinograms, images.shared_array, params, progress)
+        ps.run_compute_func(compute_func,
+                            images.num_sinograms,
+                            images.shared_array,
+                            params,
+                            progress,
+                            thread_safe=RemoveStripeFilteringFilter.thread_safe)
         return images
 
     @staticmethod
@@ -86,6 +91,7 @@ class RemoveStripeFilteringFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         label, _ = add_property_to_form(BaseFilter.SINOGRAM_FILTER_INFO, Type.LABEL, form=form, on_change=on_change)
@@ -9,7 +9,6 @@ from algotom.prep.removal import remove_stripe_based_fitting
 
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from numpy import ndarray
@@ -34,6 +33,7 @@ class RemoveStripeSortingFittingFilter(BaseFilter):
     filter_name = "Remove stripes with sorting and fitting"
     link_histograms = True
     operate_on_sinograms = True
+    thread_safe = True
 
     @staticmethod
     def filter_func(images: ImageStack, order=1, sigma=3, progress=None):
@@ -52,7 +52,12 @@ class RemoveStripeSortingFittingFilter(BaseFilter):
             compute_func = RemoveStripeSortingFittingFilter.compute_function_sino
         else:
             compute_func = RemoveStripeSortingFittingFilter.compute_function
-        ps.run_compute_func(compute_func, images.num_sinograms, images.shared_array, params, progress)
+        ps.run_compute_func(compute_func,
+                            images.num_sinograms,
+                            images.shared_array,
+                            params,
+                            progress,
+                            thread_safe=RemoveStripeSortingFittingFilter.thread_safe)
 
         return images
 
@@ -66,6 +71,7 @@ class RemoveStripeSortingFittingFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         label, _ = add_property_to_form(BaseFilter.SINOGRAM_FILTER_INFO, Type.LABEL, form=form, on_change=on_change)
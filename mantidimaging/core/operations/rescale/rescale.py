@@ -8,10 +8,10 @@ from typing import Any, TYPE_CHECKING
 import numpy as np
 from mantidimaging.core.parallel import shared as ps
 from mantidimaging.core.operations.base_filter import BaseFilter
-from mantidimaging.gui.utility.qt_helpers import Type
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.parallel.shared import ComputeFuncType
     from mantidimaging.gui.windows.operations import FiltersWindowView
     from PyQt5.QtWidgets import QComboBox, QDoubleSpinBox
 
@@ -42,10 +42,19 @@ class RescaleFilter(BaseFilter):
         :return: The ImageStack object scaled to a new range.
         """
 
-        params = {'min_input': min_input, 'max_input': max_input, 'max_output': max_output}
-        ps.run_compute_func(RescaleFilter.compute_function, len(images.data), [images.shared_array], params)
+        compute_func, params = RescaleFilter.projection_compute(min_input=min_input,
+                                                                max_input=max_input,
+                                                                max_output=max_output)
+        ps.run_compute_func(compute_func, len(images.data), [images.shared_array], params)
         return images
 
+    @staticmethod
+    def projection_compute(min_input: float = 0.0,
+                           max_input: float = 10000.0,
+                           max_output: float = 256.0) -> tuple[ComputeFuncType, dict[str, Any]]:
+        params = {'min_input': min_input, 'max_input': max_input, 'max_output': max_output}
+        return RescaleFilter.compute_function, params
+
     @staticmethod
     def compute_function(index: int, array: np.ndarray, params: dict):
         min_input, max_input, max_output = params['min_input'], params['max_input'], params['max_output']
@@ -58,6 +67,7 @@ class RescaleFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view: FiltersWindowView) -> dict[str, Any]:
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
         _, min_input_widget = add_property_to_form('Min input',
                                                    Type.FLOAT,
@@ -10,9 +10,6 @@ from mantidimaging import helper as h
 from mantidimaging.core.operations.base_filter import BaseFilter, FilterGroup
 from mantidimaging.core.parallel import shared as ps
 from mantidimaging.core.utility.sensible_roi import SensibleROI
-from mantidimaging.gui.utility import add_property_to_form
-from mantidimaging.gui.utility.qt_helpers import Type
-from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
@@ -107,6 +104,10 @@ class RoiNormalisationFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from mantidimaging.gui.utility import add_property_to_form
+        from mantidimaging.gui.utility.qt_helpers import Type
+        from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
+
         label, roi_field = add_property_to_form("Air Region",
                                                 Type.STR,
                                                 form=form,
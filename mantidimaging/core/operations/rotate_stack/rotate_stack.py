@@ -5,14 +5,12 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING
 from skimage.transform import rotate
-from PyQt5.QtWidgets import QComboBox
 
 from mantidimaging import helper as h
 from mantidimaging.core.operations.base_filter import BaseFilter
 from mantidimaging.core.parallel import shared as ps
 from mantidimaging.core.utility.progress_reporting import Progress
 from mantidimaging.core.parallel import utility as pu
-from mantidimaging.gui.utility.qt_helpers import Type
 
 import numpy as np
 
@@ -53,6 +51,8 @@ class RotateFilter(BaseFilter):
 
     @staticmethod
     def register_gui(form, on_change, view):
+        from PyQt5.QtWidgets import QComboBox
+        from mantidimaging.gui.utility.qt_helpers import Type
         from mantidimaging.gui.utility import add_property_to_form
 
         dropdown = QComboBox()
@@ -2,6 +2,8 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import subprocess
+import sys
 from typing import TYPE_CHECKING
 import unittest
 from unittest import mock
@@ -50,6 +52,18 @@ class OperationsTest(unittest.TestCase):
     def test_load_filters(self):
         self.assertGreater(len(self.filters), 10)
 
+    def test_filters_are_loaded_from_full_module_path(self):
+        for filter in self.filters:
+            self.assertTrue(filter.__module__.startswith("mantidimaging.core.operations."), filter.__module__)
+
+    def test_loading_filters_does_not_import_gui(self):
+        # The process pool workers import operations, they should not need to load any widgets
+        code = ("import sys; from mantidimaging.core.operations.loader import load_filter_packages; "
+                "load_filter_packages(); "
+                "print([m for m in sys.modules if m.startswith(('mantidimaging.gui', 'PyQt5.QtWidgets'))])")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual("[]", result.stdout.strip())
+
     def test_operation_works_inplace(self):
         for filter in self.filters:
             filter_name = filter.filter_name
@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import get_context
 import os
 import uuid
 from logging import getLogger
+from threading import BrokenBarrierError, Lock, Thread
 from typing import TYPE_CHECKING
+from collections.abc import Callable
 
 import psutil
 from psutil import NoSuchProcess, AccessDenied
 
-from mantidimaging.core.operations.loader import load_filter_packages
-
 if TYPE_CHECKING:
     from multiprocessing.pool import Pool
+    from multiprocessing.synchronize import Barrier
 
 MEM_PREFIX = 'MI'
 MEM_DIR_LINUX = '/dev/shm'
@@ -26,6 +28,14 @@ perf_logger = getLogger("perf." + __name__)
 
 cores: int = 1
 pool: Pool | None = None
+# For operations that release the GIL, and so can run on threads in this process instead of the process pool
+thread_pool: ThreadPoolExecutor | None = None
+_thread_pool_lock = Lock()
+
+# Seconds a pool process waits for the others to take their task of a broadcast, see run_on_every_worker
+BROADCAST_TIMEOUT = 30
+# Set in each pool process by worker_setup
+_broadcast_barrier: Barrier | None = None
 
 
 def create_and_start_pool(process_count: int) -> None:
@@ -38,21 +48,86 @@ def create_and_start_pool(process_count: int) -> None:
         cores = process_count
     global pool
     LOG.info(f'Creating process pool with {cores} processes')
-    pool = context.Pool(cores, initializer=worker_setup)
+    pool = context.Pool(cores, initializer=worker_setup, initargs=(context.Barrier(cores), ))
 
     if perf_logger.isEnabledFor(1):
         perf_logger.info(f"Process pool started in {time.monotonic() - t0}")
 
+    # The worker processes finish starting up and warm up in the background, e.g. while the main window is shown
+    Thread(target=_warm_up_pool, args=(pool, t0), name="ProcessPoolWarmUp", daemon=True).start()
+
+
+def worker_setup(broadcast_barrier: Barrier | None = None):
+    # Operation modules are not imported here. They are imported on demand when a compute function is unpickled,
+    # and do not import any GUI modules, so the workers only load what the operations they run need.
+    global _broadcast_barrier
+    _broadcast_barrier = broadcast_barrier
+
+
+def _warm_up_worker() -> None:
+    # Every job sends a worker from the shared module, and most operations use scipy.ndimage, so import them while
+    # the pool is otherwise idle instead of when the first operation is run
+    import mantidimaging.core.parallel.shared  # noqa: F401
+    import scipy.ndimage  # noqa: F401
+
 
-def worker_setup():
-    # Required to import modules for running operations
-    load_filter_packages()
+def _warm_up_pool(started_pool: Pool, t0: float) -> None:
+    try:
+        started_pool.map(_BroadcastTask(_warm_up_worker), range(cores), chunksize=1)
+    except ValueError:
+        # The pool was closed before it finished starting
+        return
+    if perf_logger.isEnabledFor(1):
+        perf_logger.info(f"Process pool ready in {time.monotonic() - t0}")
+
+
+class _BroadcastTask:
+
+    def __init__(self, func: Callable[[], None]):
+        self.func = func
+
+    def __call__(self, _: int) -> None:
+        self.func()
+        if _broadcast_barrier is None:
+            return
+        try:
+            # Hold on to this process until every other one has taken a task, so that no process takes two
+            _broadcast_barrier.wait(BROADCAST_TIMEOUT)
+        except BrokenBarrierError:
+            LOG.warning("Not every pool process took part in a broadcast, one was busy for too long")
+            _broadcast_barrier.reset()
+
+
+def run_on_every_worker(func: Callable[[], None]) -> None:
+    """
+    Run func once in every process of the pool, without waiting for it to finish. A process that is busy runs it
+    once it finishes its current task.
+    """
+    if pool is not None:
+        pool.map_async(_BroadcastTask(func), range(cores), chunksize=1)
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Get the thread pool used for GIL releasing operations, creating it with one thread per core on first use
+    """
+    global thread_pool
+    with _thread_pool_lock:
+        if thread_pool is None:
+            LOG.info(f'Creating thread pool with {cores} threads')
+            thread_pool = ThreadPoolExecutor(max_workers=cores, thread_name_prefix="mi_compute")
+        return thread_pool
 
 
 def end_pool():
+    global pool, thread_pool
     if pool:
         pool.close()
         pool.terminate()
+    pool = None
+    if thread_pool:
+        thread_pool.shutdown(wait=False, cancel_futures=True)
+    thread_pool = None
 
 
 def generate_mi_shared_mem_name() -> str:
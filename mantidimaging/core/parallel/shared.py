@@ -2,9 +2,13 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import uuid
 from typing import Any, TYPE_CHECKING
 from collections.abc import Callable
 
+import numpy as np
+
+from mantidimaging.core.parallel import manager as pm
 from mantidimaging.core.parallel import utility as pu
 
 if TYPE_CHECKING:
@@ -14,31 +18,158 @@ ComputeFuncType = (Callable[[int, list['ndarray'], dict[str, Any]], None]
                    | Callable[[int, 'ndarray', dict[str, Any]], None])
 
 
+# ndarray parameters at least this large are placed in shared memory once per job,
+# instead of being pickled again with every task sent to the pool
+SHARED_PARAM_MIN_BYTES = 1024**2
+
+
+class _JobParams:
+    """
+    Per-process cache of the parameters for the job that is currently running. Parameters that were moved into shared
+    memory are attached the first time a task from a job arrives and reused for the rest of that job.
+
+    They are released, along with the shared memory attachments and any registered per-job caches, when the job ends,
+    see run_compute_func. A pool process only runs one task at a time, so they are also released if a task from a new
+    job arrives first.
+    """
+
+    def __init__(self):
+        self.job_id: str | None = None
+        self.proxies: dict[str, pu.SharedArrayProxy] = {}
+        self.resolved: dict[str, Any] = {}
+
+    def get(self, job_id: str, params: dict[str, Any]) -> dict[str, Any]:
+        if job_id != self.job_id:
+            self.release()
+            self.proxies = {k: v for k, v in params.items() if isinstance(v, pu.SharedArrayProxy)}
+            self.resolved = {k: v.array if k in self.proxies else v for k, v in params.items()}
+            self.job_id = job_id
+        return self.resolved
+
+    def release(self) -> None:
+        # Drop the views before the proxies, so the shared memory is not closed while it is still referenced
+        self.resolved = {}
+        self.proxies = {}
+        self.job_id = None
+        for release_cache in _job_cache_releases:
+            release_cache()
+        pu.release_attached_arrays()
+
+
+# Functions releasing per-process caches that are only valid for a single job, see register_job_cache
+_job_cache_releases: list[Callable[[], None]] = []
+
+
+def release_job_caches() -> None:
+    """
+    Release what this process has cached for the last job it ran. For work sent to the pool without run_compute_func,
+    which does not tell the pool processes when it has finished.
+    """
+    _job_params.release()
+
+
+def register_job_cache(release: Callable[[], None]) -> None:
+    """
+    Register a function that releases a per-process cache used by a compute function. Pool processes call it when
+    a job ends, so the cache can be kept for every task of a job.
+    """
+    if release not in _job_cache_releases:
+        _job_cache_releases.append(release)
+
+
+_job_params = _JobParams()
+
+
 class _Worker:
 
-    def __init__(self, func: ComputeFuncType, arrays: list[pu.SharedArray] | list[pu.SharedArrayProxy],
-                 params: dict[str, Any]):
+    def __init__(self,
+                 func: ComputeFuncType,
+                 arrays: list[pu.SharedArray] | list[pu.SharedArrayProxy],
+                 params: dict[str, Any],
+                 job_id: str | None = None):
         self.func = func
         self.arrays = arrays
         self.params = params
+        self.job_id = job_id
 
     def __call__(self, index: int):
+        params = _job_params.get(self.job_id, self.params) if self.job_id is not None else self.params
         ndarrays = [sa.array for sa in self.arrays]
         if len(ndarrays) == 1:
             ndarrays = ndarrays[0]  # type: ignore[assignment]
-        self.func(index, ndarrays, self.params)  # type: ignore[arg-type]
+        self.func(index, ndarrays, params)  # type: ignore[arg-type]
 
 
 def run_compute_func(func: ComputeFuncType,
                      num_operations: int,
                      arrays: list[pu.SharedArray] | pu.SharedArray,
                      params: dict[str, Any],
-                     progress=None) -> None:
+                     progress=None,
+                     thread_safe: bool = False) -> None:
+    """
+    Run ``func(index, arrays, params)`` for every index in ``range(num_operations)``.
+
+    :param thread_safe: The compute function spends most of its time in code that releases the GIL and can safely
+                        run concurrently on the same arrays. It will be run on threads in this process instead of the
+                        process pool, which avoids IPC and does not need the arrays to be in shared memory.
+    """
     if isinstance(arrays, pu.SharedArray):
         arrays = [arrays]
+    if thread_safe:
+        # Threads see the same memory as this process, so the arrays and params are used directly
+        pu.run_compute_func_threaded_impl(_Worker(func, arrays, params),
+                                          num_operations,
+                                          progress,
+                                          bytes_per_operation=_bytes_per_operation(arrays, num_operations))
+        return
     all_data_in_shared_memory, data = _check_shared_mem_and_get_data(arrays)
-    worker_func = _Worker(func, data, params)
-    pu.run_compute_func_impl(worker_func, num_operations, all_data_in_shared_memory, progress)
+    shared_params: dict[str, pu.SharedArray] = {}
+    if pm.pool is not None and pu.multiprocessing_necessary(num_operations, all_data_in_shared_memory):
+        # The job id lets each pool process tell when it has moved on to another job and can drop what it cached
+        shared_params, worker_params = _share_large_params(params)
+        worker_func = _Worker(func, data, worker_params, job_id=str(uuid.uuid4()))
+    else:
+        # Running in this process, so the arrays and params are used directly without attaching to them
+        worker_func = _Worker(func, arrays, params)
+    try:
+        pu.run_compute_func_impl(worker_func,
+                                 num_operations,
+                                 all_data_in_shared_memory,
+                                 progress,
+                                 bytes_per_operation=_bytes_per_operation(arrays, num_operations))
+    finally:
+        if worker_func.job_id is not None:
+            # Otherwise idle pool processes would keep the arrays attached, so closing a stack would not free them
+            pm.run_on_every_worker(release_job_caches)
+    # The shared params are only freed once every task of the job has finished
+    del shared_params
+
+
+def _share_large_params(params: dict[str, Any]) -> tuple[dict[str, pu.SharedArray], dict[str, Any]]:
+    """
+    Copy any large ndarray parameters into shared memory.
+
+    :return: The SharedArrays that were created, and the params to send to the workers with those arrays replaced by
+             proxies. Other parameters are passed through unchanged.
+    """
+    shared_params = {
+        key: pu.copy_into_shared_memory(value)
+        for key, value in params.items() if isinstance(value, np.ndarray) and value.nbytes >= SHARED_PARAM_MIN_BYTES
+    }
+    worker_params = {
+        key: shared_params[key].array_proxy if key in shared_params else value
+        for key, value in params.items()
+    }
+    return shared_params, worker_params
+
+
+def _bytes_per_operation(arrays: list[pu.SharedArray], num_operations: int) -> int:
+    """
+    Estimate how much data is touched by processing a single index, used to size the chunks sent to the pool
+    """
+    if num_operations <= 0:
+        return 0
+    return sum(shared_array.array.nbytes for shared_array in arrays) // num_operations
 
 
 def _check_shared_mem_and_get_data(
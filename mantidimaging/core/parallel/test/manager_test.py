@@ -2,6 +2,8 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 import unittest
+from threading import BrokenBarrierError
+from unittest import mock
 from unittest.mock import patch
 
 import psutil
@@ -59,3 +61,67 @@ class ParallelManagerTest(unittest.TestCase):
         _mock_getmtime.return_value = psutil.Process().create_time() - 3600
 
         self.assertEqual(files_to_remove, pm.find_memory_from_previous_process_linux())
+
+    @patch('mantidimaging.core.parallel.manager.cores', 3)
+    def test_run_on_every_worker_sends_one_task_per_process(self):
+        func = mock.Mock()
+        with patch('mantidimaging.core.parallel.manager.pool') as pool:
+            pm.run_on_every_worker(func)
+
+        task, indices = pool.map_async.call_args.args
+        self.assertEqual(list(indices), [0, 1, 2])
+        self.assertEqual(pool.map_async.call_args.kwargs, {"chunksize": 1})
+        task(0)
+        func.assert_called_once_with()
+
+    @patch('mantidimaging.core.parallel.manager.pool', None)
+    def test_run_on_every_worker_without_pool(self):
+        func = mock.Mock()
+        pm.run_on_every_worker(func)
+        func.assert_not_called()
+
+    def test_broadcast_task_waits_for_the_other_processes(self):
+        func = mock.Mock()
+        barrier = mock.Mock()
+        with patch('mantidimaging.core.parallel.manager._broadcast_barrier', barrier):
+            pm._BroadcastTask(func)(0)
+
+        func.assert_called_once_with()
+        barrier.wait.assert_called_once_with(pm.BROADCAST_TIMEOUT)
+
+    def test_broadcast_task_resets_broken_barrier(self):
+        barrier = mock.Mock()
+        barrier.wait.side_effect = BrokenBarrierError
+        with patch('mantidimaging.core.parallel.manager._broadcast_barrier', barrier):
+            with self.assertLogs(pm.LOG, "WARNING"):
+                pm._BroadcastTask(mock.Mock())(0)
+
+        barrier.reset.assert_called_once()
+
+    @patch('mantidimaging.core.parallel.manager.cores', 3)
+    def test_warm_up_pool_runs_warm_up_on_every_process(self):
+        pool = mock.Mock()
+        pm._warm_up_pool(pool, 0.0)
+
+        task, indices = pool.map.call_args.args
+        self.assertEqual(list(indices), [0, 1, 2])
+        self.assertEqual(pool.map.call_args.kwargs, {"chunksize": 1})
+        self.assertIs(task.func, pm._warm_up_worker)
+
+    def test_warm_up_pool_stops_when_pool_closed(self):
+        pool = mock.Mock()
+        pool.map.side_effect = ValueError("Pool not running")
+        pm._warm_up_pool(pool, 0.0)
+
+    @patch('mantidimaging.core.parallel.manager.Thread')
+    @patch('mantidimaging.core.parallel.manager.get_context')
+    def test_create_and_start_pool_warms_up_in_background(self, get_context: mock.Mock, thread: mock.Mock):
+        with patch('mantidimaging.core.parallel.manager.pool', None), \
+                patch('mantidimaging.core.parallel.manager.cores', 1):
+            pm.create_and_start_pool(2)
+            pool = pm.pool
+
+        self.assertIs(pool, get_context.return_value.Pool.return_value)
+        self.assertIs(thread.call_args.kwargs["target"], pm._warm_up_pool)
+        self.assertIs(thread.call_args.kwargs["args"][0], pool)
+        thread.return_value.start.assert_called_once_with()
@@ -1,11 +1,23 @@
 # Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
+import sys
+import time
 import unittest
 from unittest import mock
 
+import numpy as np
+import numpy.testing as npt
+
+from mantidimaging.core.parallel import manager as pm
 from mantidimaging.core.parallel import shared as ps
-from mantidimaging.core.parallel.utility import SharedArrayProxy
+from mantidimaging.core.parallel.manager import end_pool
+from mantidimaging.core.parallel.utility import SharedArray, SharedArrayProxy, _attached_arrays, copy_into_shared_memory
+from mantidimaging.test_helpers.start_qapplication import start_multiprocessing_pool
+
+
+def _add_index(index, array, params):
+    array[index] += index
 
 
 class SharedTest(unittest.TestCase):
@@ -31,6 +43,121 @@ class SharedTest(unittest.TestCase):
         self.assertTrue(len(data) == 5)
         self.assertTrue(isinstance(data[0], mock.Mock))
 
+    def test_share_large_params_only_moves_large_arrays(self):
+        large = np.ones((ps.SHARED_PARAM_MIN_BYTES // 4, ), dtype=np.float32)
+        small = np.ones((4, ), dtype=np.float32)
+        shared_params, worker_params = ps._share_large_params({"large": large, "small": small, "value": 3})
+
+        self.assertEqual(["large"], list(shared_params))
+        self.assertIsInstance(worker_params["large"], SharedArrayProxy)
+        self.assertIs(small, worker_params["small"])
+        self.assertEqual(3, worker_params["value"])
+        npt.assert_equal(large, worker_params["large"].array)
+
+    def test_job_params_are_resolved_once_per_job(self):
+        shared_array = copy_into_shared_memory(np.arange(10, dtype=np.float32))
+        params = {"array": shared_array.array_proxy, "value": 2}
+        job_params = ps._JobParams()
+
+        resolved = job_params.get("job1", params)
+        npt.assert_equal(shared_array.array, resolved["array"])
+        self.assertEqual(2, resolved["value"])
+        self.assertIs(resolved, job_params.get("job1", params))
+        self.assertIsNot(resolved, job_params.get("job2", params))
+
+        job_params.release()
+        self.assertIsNone(job_params.job_id)
+
+    def test_new_job_releases_previous_job_caches(self):
+        shared_array = copy_into_shared_memory(np.arange(10, dtype=np.float32))
+        params = {"array": shared_array.array_proxy}
+        job_params = ps._JobParams()
+        release_cache = mock.Mock()
+
+        with mock.patch.object(ps, "_job_cache_releases", []):
+            ps.register_job_cache(release_cache)
+            ps.register_job_cache(release_cache)
+            job_params.get("job1", params)
+            self.assertIn(shared_array._shared_memory.name, [key[0] for key in _attached_arrays])
+            job_params.get("job1", params)
+            release_cache.assert_called_once()
+
+            job_params.get("job2", {"value": 1})
+
+        self.assertEqual(2, release_cache.call_count)
+        self.assertNotIn(shared_array._shared_memory.name, [key[0] for key in _attached_arrays])
+
+    def test_run_compute_func_passes_shared_params_to_compute_function(self):
+        shared_array = copy_into_shared_memory(np.zeros((3, 2, 2), dtype=np.float32))
+        offset = np.full((ps.SHARED_PARAM_MIN_BYTES // 4, ), 5, dtype=np.float32)
+
+        def compute_function(index, array, params):
+            self.assertIsInstance(params["offset"], np.ndarray)
+            array[index] += params["offset"][index]
+
+        ps.run_compute_func(compute_function, 3, shared_array, {"offset": offset})
+
+        npt.assert_equal(5, shared_array.array)
+        self.assertIsNone(ps._job_params.job_id)
+
+    @mock.patch('mantidimaging.core.parallel.manager.pool', None)
+    def test_run_compute_func_without_pool_uses_arrays_directly(self):
+        shared_array = copy_into_shared_memory(np.zeros((20, 2, 2), dtype=np.float32))
+
+        def compute_function(index, array, params):
+            self.assertIs(array.base, shared_array.array.base)
+            array[index] = index
+
+        with mock.patch("mantidimaging.core.parallel.shared._share_large_params") as share_large_params:
+            ps.run_compute_func(compute_function, 20, shared_array, {})
+
+        share_large_params.assert_not_called()
+        npt.assert_equal(np.arange(20), shared_array.array[:, 0, 0])
+        self.assertNotIn(shared_array._shared_memory.name, [key[0] for key in _attached_arrays])
+
+    @mock.patch('mantidimaging.core.parallel.manager.pool')
+    def test_run_compute_func_on_pool_sends_job_id(self, mock_pool):
+        shared_array = copy_into_shared_memory(np.zeros((20, 2, 2), dtype=np.float32))
+        mock_pool.imap.return_value = [20]
+
+        ps.run_compute_func(mock.Mock(), 20, shared_array, {})
+
+        chunk_worker = mock_pool.imap.call_args.args[0]
+        self.assertIsNotNone(chunk_worker.worker_func.job_id)
+        self.assertIsInstance(chunk_worker.worker_func.arrays[0], SharedArrayProxy)
+
+    @mock.patch('mantidimaging.core.parallel.shared.pm.run_on_every_worker')
+    @mock.patch('mantidimaging.core.parallel.manager.pool')
+    def test_run_compute_func_on_pool_releases_workers_when_job_ends(self, mock_pool, run_on_every_worker):
+        shared_array = copy_into_shared_memory(np.zeros((20, 2, 2), dtype=np.float32))
+        mock_pool.imap.side_effect = RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            ps.run_compute_func(mock.Mock(), 20, shared_array, {})
+
+        run_on_every_worker.assert_called_once_with(ps.release_job_caches)
+
+    @mock.patch('mantidimaging.core.parallel.shared.pm.run_on_every_worker')
+    @mock.patch('mantidimaging.core.parallel.manager.pool', None)
+    def test_run_compute_func_without_pool_does_not_release_workers(self, run_on_every_worker):
+        ps.run_compute_func(mock.Mock(), 20, copy_into_shared_memory(np.zeros((20, 2, 2))), {})
+
+        run_on_every_worker.assert_not_called()
+
+    @mock.patch('mantidimaging.core.parallel.manager.cores', 2)
+    def test_run_compute_func_thread_safe_works_without_shared_memory(self):
+        array = SharedArray(np.zeros((20, 2, 2), dtype=np.float32), None)
+
+        def compute_function(index, array, params):
+            array[index] = index + params["offset"]
+
+        try:
+            ps.run_compute_func(compute_function, 20, array, {"offset": 1}, thread_safe=True)
+        finally:
+            end_pool()
+
+        npt.assert_equal(np.arange(1, 21), array.array[:, 0, 0])
+
     def _create_array_list(self, num_arrays, has_shared_mem):
         array_list = []
         for _ in range(num_arrays):
@@ -39,3 +166,28 @@ class SharedTest(unittest.TestCase):
             mock_array.array_proxy = SharedArrayProxy(None, (2, 2), 'float32') if has_shared_mem else mock.Mock()
             array_list.append(mock_array)
         return array_list
+
+
+@start_multiprocessing_pool
+@unittest.skipUnless(sys.platform == "linux", "Reads the memory maps of the pool processes from /proc")
+class SharedPoolTest(unittest.TestCase):
+
+    def _workers_mapping(self, mem_name: str) -> list[int]:
+        pids = []
+        for process in pm.pool._pool:  # type: ignore[union-attr]
+            with open(f"/proc/{process.pid}/maps") as maps:
+                if mem_name in maps.read():
+                    pids.append(process.pid)
+        return pids
+
+    def test_idle_workers_release_arrays_when_job_ends(self):
+        shared_array = copy_into_shared_memory(np.zeros((100, 2, 2), dtype=np.float32))
+        mem_name = shared_array._shared_memory.name
+
+        ps.run_compute_func(_add_index, 100, shared_array, {})
+
+        npt.assert_equal(shared_array.array[:, 0, 0], np.arange(100))
+        deadline = time.monotonic() + 10
+        while self._workers_mapping(mem_name) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(self._workers_mapping(mem_name), [])
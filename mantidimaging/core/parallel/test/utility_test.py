@@ -2,6 +2,9 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import os
+import pickle
+
 import numpy as np
 from unittest import mock
 
@@ -10,7 +13,9 @@ import numpy.testing as npt
 
 from mantidimaging.test_helpers import unit_test_helper as th
 from mantidimaging.core.parallel.utility import _create_shared_array, execute_impl, multiprocessing_necessary,\
-    copy_into_shared_memory
+    copy_into_shared_memory, calculate_chunksize, chunk_ranges, run_compute_func_impl, _ChunkWorker, _attached_arrays,\
+    release_attached_arrays, run_compute_func_threaded_impl, create_memory_mapped_array, create_array,\
+    swap_axes_into, swap_axes_in_place
 
 
 @pytest.mark.parametrize(
@@ -43,6 +48,68 @@ def test_execute_impl_par(mock_pool):
     assert mock_progress.update.call_count == 15
 
 
+@pytest.mark.parametrize(
+    'cores,num_operations,bytes_per_operation,expected',
+    (
+        [8, 3000, 0, 1],  # unknown cost falls back to one index per task
+        [8, 0, 1024, 1],  # nothing to do
+        [8, 3000, 16 * 1024**2, 4],  # 2k x 2k float32 images, limited by the cost model
+        [8, 3000, 512 * 512 * 4, 64],  # 512 x 512 float32 images, limited by the cost model
+        [8, 3000, 64 * 64 * 4, 93],  # tiny images, limited by load balancing
+        [64, 100, 1024, 1],  # more cores than chunks
+    ))
+def test_calculate_chunksize(cores, num_operations, bytes_per_operation, expected):
+    assert calculate_chunksize(cores, num_operations, bytes_per_operation) == expected
+
+
+def test_chunk_ranges_cover_all_indices():
+    assert chunk_ranges(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert chunk_ranges(0, 4) == []
+
+
+def test_chunk_worker_runs_range():
+    mock_worker = mock.Mock()
+    assert _ChunkWorker(mock_worker)((3, 6)) == 3
+    assert mock_worker.call_args_list == [mock.call(3), mock.call(4), mock.call(5)]
+
+
+@mock.patch('mantidimaging.core.parallel.utility.pm')
+def test_run_compute_func_impl_par_uses_chunks(mock_pm):
+    mock_pm.cores = 2
+    mock_pm.pool.imap.side_effect = lambda func, ranges: map(func, ranges)
+    mock_worker = mock.Mock()
+    mock_progress = mock.Mock()
+    run_compute_func_impl(mock_worker, 40, True, mock_progress, "Test", bytes_per_operation=1024)
+
+    mock_pm.pool.imap.assert_called_once()
+    assert [c.args[0] for c in mock_worker.call_args_list] == list(range(40))
+    # 40 operations on 2 cores are balanced into 8 chunks of 5
+    assert mock_progress.update.call_args_list == [mock.call(5, "Test")] * 8
+
+
+@mock.patch('mantidimaging.core.parallel.utility.pm')
+def test_run_compute_func_threaded_impl_uses_thread_pool(mock_pm):
+    mock_pm.cores = 2
+    mock_pm.get_thread_pool.return_value.map.side_effect = map
+    mock_worker = mock.Mock()
+    mock_progress = mock.Mock()
+    run_compute_func_threaded_impl(mock_worker, 16, mock_progress, "Test", bytes_per_operation=1024)
+
+    mock_pm.pool.imap.assert_not_called()
+    assert [c.args[0] for c in mock_worker.call_args_list] == list(range(16))
+    assert sum(c.args[0] for c in mock_progress.update.call_args_list) == 16
+
+
+@mock.patch('mantidimaging.core.parallel.utility.pm')
+def test_run_compute_func_threaded_impl_single_core_is_sequential(mock_pm):
+    mock_pm.cores = 1
+    mock_worker = mock.Mock()
+    run_compute_func_threaded_impl(mock_worker, 3, mock.Mock(), "Test")
+
+    mock_pm.get_thread_pool.assert_not_called()
+    assert mock_worker.call_count == 3
+
+
 @pytest.mark.parametrize('dtype,expected_dtype', [
     [np.uint8, np.uint8],
     ['uint8', np.uint8],
@@ -91,7 +158,134 @@ def test_looking_up_shared_array_from_proxy():
     assert shared_array._shared_memory.name == proxy._shared_array._shared_memory.name
 
 
+def test_proxies_reuse_attached_shared_array():
+    shared_array = copy_into_shared_memory(np.zeros((5, 5), np.float32))
+    first = shared_array.array_proxy
+    second = shared_array.array_proxy
+
+    first.array[0, 0] = 3
+    assert second.array[0, 0] == 3
+    assert first._shared_array is second._shared_array
+    release_attached_arrays()
+
+
+def test_attached_shared_array_invalidated_when_freed():
+    shared_array = copy_into_shared_memory(np.zeros((5, 5), np.float32))
+    mem_name = shared_array._shared_memory.name
+    proxy = shared_array.array_proxy
+    proxy.array
+    del proxy
+    assert any(key[0] == mem_name for key in _attached_arrays)
+
+    del shared_array
+    assert not any(key[0] == mem_name for key in _attached_arrays)
+
+
+def test_pickled_proxy_does_not_include_attached_array():
+    shared_array = copy_into_shared_memory(np.zeros((5, 5), np.float32))
+    proxy = shared_array.array_proxy
+    proxy.array
+    assert proxy.__getstate__()['_shared_array'] is None
+    release_attached_arrays()
+
+
+def test_create_memory_mapped_array(tmp_path):
+    shared_array = create_memory_mapped_array((3, 4, 5), np.float32, str(tmp_path))
+    path = shared_array.mmap_path
+
+    assert shared_array.is_memory_mapped
+    assert shared_array.has_shared_memory
+    assert os.path.dirname(path) == str(tmp_path)
+    assert shared_array.array.shape == (3, 4, 5)
+
+    del shared_array
+    assert not os.path.exists(path)
+
+
+def test_create_memory_mapped_array_uses_scratch_dir_env_var(tmp_path):
+    with mock.patch.dict(os.environ, {"MANTIDIMAGING_SCRATCH_DIR": str(tmp_path)}):
+        shared_array = create_memory_mapped_array((2, 2), np.float32)
+    assert os.path.dirname(shared_array.mmap_path) == str(tmp_path)
+
+
+def test_create_memory_mapped_array_not_enough_space(tmp_path):
+    with mock.patch("mantidimaging.core.parallel.utility.shutil.disk_usage") as disk_usage:
+        disk_usage.return_value.free = 10
+        with pytest.raises(RuntimeError):
+            create_memory_mapped_array((3, 4, 5), np.float32, str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_proxy_attaches_to_memory_mapped_array_by_path(tmp_path):
+    shared_array = create_memory_mapped_array((3, 4, 5), np.float32, str(tmp_path))
+    shared_array.array[:] = th.gen_img_numpy_rand((3, 4, 5))
+
+    # A proxy sent to another process only carries the path to the file
+    proxy = pickle.loads(pickle.dumps(shared_array.array_proxy))
+    npt.assert_equal(proxy.array, shared_array.array)
+
+    proxy.array[1] = 7
+    npt.assert_equal(shared_array.array[1], 7)
+    assert not proxy._shared_array._free_mem_on_del
+    release_attached_arrays()
+
+
+@mock.patch("mantidimaging.core.parallel.utility.enough_memory", return_value=False)
+def test_create_array_not_enough_memory(_):
+    with pytest.raises(RuntimeError):
+        create_array((3, 4, 5), np.float32)
+
+
+@mock.patch("mantidimaging.core.parallel.utility.enough_memory", return_value=False)
+def test_create_array_falls_back_to_memory_mapped_array(_, tmp_path):
+    with mock.patch.dict(os.environ, {"MANTIDIMAGING_SCRATCH_DIR": str(tmp_path)}):
+        shared_array = create_array((3, 4, 5), np.float32, allow_memory_mapped=True)
+
+    assert shared_array.is_memory_mapped
+    assert os.path.dirname(shared_array.mmap_path) == str(tmp_path)
+    assert shared_array.array.shape == (3, 4, 5)
+
+
 if __name__ == "__main__":
     import pytest
 
     pytest.main([__file__])
+
+
+@pytest.mark.parametrize('shape', [(7, 13, 5), (13, 7, 5), (1, 9, 3), (40, 40, 4)])
+@pytest.mark.parametrize('cores', [1, 3])
+def test_swap_axes_into(shape, cores):
+    array = np.random.random(shape).astype(np.float32)
+    out = np.empty((shape[1], shape[0], shape[2]), dtype=np.float32)
+
+    # Small tiles so that every stack is split into several blocks
+    with mock.patch("mantidimaging.core.parallel.utility.SWAP_AXES_TILE_BYTES", 4 * shape[2] * 9), \
+            mock.patch("mantidimaging.core.parallel.utility.pm.cores", cores):
+        result = swap_axes_into(array, out)
+
+    assert result is out
+    npt.assert_array_equal(out, np.swapaxes(array, 0, 1))
+
+
+def test_swap_axes_into_wrong_shape():
+    with pytest.raises(ValueError, match="expected"):
+        swap_axes_into(np.zeros((2, 3, 4)), np.zeros((2, 3, 4)))
+
+
+@pytest.mark.parametrize('size', [1, 7, 40])
+@pytest.mark.parametrize('cores', [1, 3])
+def test_swap_axes_in_place(size, cores):
+    array = np.random.random((size, size, 5)).astype(np.float32)
+    expected = np.swapaxes(array, 0, 1).copy()
+
+    with mock.patch("mantidimaging.core.parallel.utility.SWAP_AXES_TILE_BYTES", 4 * 5 * 9), \
+            mock.patch("mantidimaging.core.parallel.utility.pm.cores", cores):
+        result = swap_axes_in_place(array)
+
+    assert result is array
+    npt.assert_array_equal(array, expected)
+
+
+def test_swap_axes_in_place_needs_square_stack():
+    with pytest.raises(ValueError, match="in place"):
+        swap_axes_in_place(np.zeros((2, 3, 4)))
@@ -2,7 +2,10 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
+import math
 import os
+import shutil
+import tempfile
 from logging import getLogger
 from multiprocessing import shared_memory
 from typing import TYPE_CHECKING
@@ -27,15 +30,23 @@ def enough_memory(shape, dtype) -> bool:
     return full_size_KB(shape=shape, dtype=dtype) < system_free_memory().kb()
 
 
-def create_array(shape: tuple[int, ...], dtype: npt.DTypeLike = np.float32) -> SharedArray:
+def create_array(shape: tuple[int, ...],
+                 dtype: npt.DTypeLike = np.float32,
+                 allow_memory_mapped: bool = False) -> SharedArray:
     """
     Create an array in shared memory
 
     :param shape: Shape of the array
     :param dtype: Dtype of the array
+    :param allow_memory_mapped: If there is not enough physical memory, create the array in a memory mapped file in
+                                the scratch directory instead of failing. Used when loading data larger than RAM.
     :return: The created SharedArray
     """
     if not enough_memory(shape, dtype):
+        if allow_memory_mapped:
+            LOG.warning(f"Not enough physical memory for shape={shape}, dtype={dtype}. "
+                        f"Using a memory mapped file in {scratch_directory()} instead")
+            return create_memory_mapped_array(shape, dtype)
         raise RuntimeError(
             "The machine does not have enough physical memory available to allocate space for this data.")
 
@@ -64,24 +75,96 @@ def copy_into_shared_memory(array: np.ndarray) -> SharedArray:
     return shared_array
 
 
-def calculate_chunksize(cores):
+# Directory used for memory mapped arrays when none is given, defaults to the system temporary directory
+SCRATCH_DIR_ENV_VAR = "MANTIDIMAGING_SCRATCH_DIR"
+
+
+def scratch_directory() -> str:
+    """
+    The directory for temporary files that hold stack data, see :data:`SCRATCH_DIR_ENV_VAR`
+    """
+    return os.environ.get(SCRATCH_DIR_ENV_VAR) or tempfile.gettempdir()
+
+
+def create_memory_mapped_array(shape: tuple[int, ...],
+                               dtype: npt.DTypeLike = np.float32,
+                               directory: str | None = None) -> SharedArray:
+    """
+    Create an array backed by a temporary .npy file instead of RAM, for data that does not fit in memory.
+    Worker processes attach to it by path, and the file is deleted when the returned SharedArray is freed.
+
+    :param shape: Shape of the array
+    :param dtype: Dtype of the array
+    :param directory: Scratch directory for the file, this should be on fast local storage
+    :return: The created SharedArray
+    """
+    if directory is None:
+        directory = scratch_directory()
+    size = full_size_bytes(shape, dtype)
+    if size >= shutil.disk_usage(directory).free:
+        raise RuntimeError(f"The scratch directory {directory} does not have enough free space for this data.")
+
+    LOG.info(f'Requested memory mapped array with shape={shape}, size={size}, dtype={dtype} in {directory}')
+
+    fd, path = tempfile.mkstemp(suffix=".npy", prefix=pm.generate_mi_shared_mem_name() + "_", dir=directory)
+    os.close(fd)
+    array = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    return SharedArray(array, None, mmap_path=path, mmap_offset=array.offset)
+
+
+def _map_file(path: str, offset: int, shape: tuple[int, ...], dtype: npt.DTypeLike,
+              free_mem_on_delete: bool) -> SharedArray:
+    # Maps read-write, so it must only be used for the scratch files from create_memory_mapped_array, never user data
+    array = np.memmap(path, dtype=dtype, mode="r+", offset=offset, shape=shape)
+    return SharedArray(array, None, free_mem_on_del=free_mem_on_delete, mmap_path=path, mmap_offset=offset)
+
+
+# Amount of data each pool task should cover before the per-task pickling/IPC overhead stops being significant
+TARGET_CHUNK_BYTES = 64 * 1024**2
+# Minimum number of tasks per core, so that uneven task times can still be balanced between the workers
+MIN_CHUNKS_PER_CORE = 4
+
+
+def calculate_chunksize(cores: int, num_operations: int = 0, bytes_per_operation: int = 0) -> int:
+    """
+    Calculate how many consecutive indices to hand to a worker in a single pool task.
+
+    Each task has a fixed cost (pickling the worker, IPC, looking up the shared memory), so cheap operations
+    on small images want large chunks. This is capped so that there are still at least
+    :data:`MIN_CHUNKS_PER_CORE` chunks for each core, otherwise a slow chunk would leave the other cores idle.
+
+    :param cores: Number of processes in the pool
+    :param num_operations: Total number of indices that will be processed
+    :param bytes_per_operation: Approximate amount of data touched by processing a single index
+    :return: The number of indices in each chunk, at least 1
+    """
+    if num_operations <= 0 or bytes_per_operation <= 0:
+        return 1
+    by_cost = math.ceil(TARGET_CHUNK_BYTES / bytes_per_operation)
+    by_balance = num_operations // (max(cores, 1) * MIN_CHUNKS_PER_CORE)
+    return max(1, min(by_cost, by_balance))
+
+
+def chunk_ranges(num_operations: int, chunksize: int) -> list[tuple[int, int]]:
+    """
+    Split ``range(num_operations)`` into contiguous ``(start, stop)`` ranges of at most ``chunksize`` indices
     """
-    TODO possible proper calculation of chunksize, although best performance has been with 1
-    From performance tests, the chunksize doesn't seem to make much of a
-    difference, but having larger chunks usually led to slower performance:
+    return [(start, min(start + chunksize, num_operations)) for start in range(0, num_operations, chunksize)]
+
 
-    Shape: (50,512,512)
-    1 chunk 3.06s
-    2 chunks 3.05s
-    3 chunks 3.07s
-    4 chunks 3.06s
-    5 chunks 3.16s
-    6 chunks 3.06s
-    7 chunks 3.058s
-    8 chunks 3.25s
-    9 chunks 3.45s
+class _ChunkWorker:
     """
-    return 1
+    Runs a per-index worker function over a contiguous range of indices inside a single pool task
+    """
+
+    def __init__(self, worker_func: Callable[[int], None]):
+        self.worker_func = worker_func
+
+    def __call__(self, index_range: tuple[int, int]) -> int:
+        start, stop = index_range
+        for index in range(start, stop):
+            self.worker_func(index)
+        return stop - start
 
 
 def multiprocessing_necessary(shape: int, is_shared_data: bool) -> bool:
@@ -128,14 +211,18 @@ def run_compute_func_impl(worker_func: Callable[[int], None],
                           num_operations: int,
                           is_shared_data: bool,
                           progress=None,
-                          msg: str = "") -> None:
+                          msg: str = "",
+                          bytes_per_operation: int = 0) -> None:
     task_name = f"{msg}"
     progress = Progress.ensure_instance(progress, num_steps=num_operations, task_name=task_name)
     indices_list = range(num_operations)
     if multiprocessing_necessary(num_operations, is_shared_data) and pm.pool:
-        LOG.info(f"Running async on {pm.cores} cores")
-        for _ in pm.pool.imap(worker_func, indices_list, chunksize=calculate_chunksize(pm.cores)):
-            progress.update(1, msg)
+        chunksize = calculate_chunksize(pm.cores, num_operations, bytes_per_operation)
+        LOG.info(f"Running async on {pm.cores} cores with chunks of {chunksize}")
+        # Each task processes a contiguous range of indices, so the pickling and IPC cost is paid once per chunk
+        # rather than once per image. imap keeps the chunks in order, and progress is reported as each one finishes.
+        for num_done in pm.pool.imap(_ChunkWorker(worker_func), chunk_ranges(num_operations, chunksize)):
+            progress.update(num_done, msg)
     else:
         LOG.info("Running synchronously on 1 core")
         for ind in indices_list:
@@ -144,44 +231,255 @@ def run_compute_func_impl(worker_func: Callable[[int], None],
     progress.mark_complete()
 
 
+def run_compute_func_threaded_impl(worker_func: Callable[[int], None],
+                                   num_operations: int,
+                                   progress=None,
+                                   msg: str = "",
+                                   bytes_per_operation: int = 0) -> None:
+    task_name = f"{msg}"
+    progress = Progress.ensure_instance(progress, num_steps=num_operations, task_name=task_name)
+    if pm.cores > 1 and num_operations > 1:
+        chunksize = calculate_chunksize(pm.cores, num_operations, bytes_per_operation)
+        LOG.info(f"Running on {pm.cores} threads with chunks of {chunksize}")
+        for num_done in pm.get_thread_pool().map(_ChunkWorker(worker_func), chunk_ranges(num_operations, chunksize)):
+            progress.update(num_done, msg)
+    else:
+        LOG.info("Running synchronously on 1 core")
+        for ind in range(num_operations):
+            worker_func(ind)
+            progress.update(1, msg)
+    progress.mark_complete()
+
+
+# Size of the tiles moved by the axes swap, small enough that the rows read and written for a tile stay in cache
+SWAP_AXES_TILE_BYTES = 2 * 1024**2
+
+
+def _swap_axes_block(shape: tuple[int, ...], itemsize: int) -> int:
+    row_bytes = max(math.prod(shape[2:]) * itemsize, 1)
+    return max(1, math.isqrt(SWAP_AXES_TILE_BYTES // row_bytes))
+
+
+class _SwapAxesWorker:
+    """
+    Fills a block of rows of the output, one tile at a time
+    """
+
+    def __init__(self, array: np.ndarray, out: np.ndarray, block: int):
+        self.array = array
+        self.out = out
+        self.block = block
+
+    def __call__(self, block_index: int) -> None:
+        j0 = block_index * self.block
+        j1 = min(j0 + self.block, self.out.shape[0])
+        for i0 in range(0, self.array.shape[0], self.block):
+            i1 = min(i0 + self.block, self.array.shape[0])
+            self.out[j0:j1, i0:i1] = self.array[i0:i1, j0:j1].swapaxes(0, 1)
+
+
+class _SwapAxesInPlaceWorker:
+    """
+    Transposes the tile on the diagonal of a block of rows, and exchanges the tiles to the right of it with their
+    mirror images below the diagonal
+    """
+
+    def __init__(self, array: np.ndarray, block: int):
+        self.array = array
+        self.block = block
+
+    def __call__(self, block_index: int) -> None:
+        size = self.array.shape[0]
+        i0 = block_index * self.block
+        i1 = min(i0 + self.block, size)
+        diagonal = self.array[i0:i1, i0:i1]
+        diagonal[:] = diagonal.swapaxes(0, 1).copy()
+        for j0 in range(i1, size, self.block):
+            j1 = min(j0 + self.block, size)
+            tile = self.array[i0:i1, j0:j1].copy()
+            self.array[i0:i1, j0:j1] = self.array[j0:j1, i0:i1].swapaxes(0, 1)
+            self.array[j0:j1, i0:i1] = tile.swapaxes(0, 1)
+
+
+def swap_axes_into(array: np.ndarray, out: np.ndarray, progress: Progress | None = None) -> np.ndarray:
+    """
+    Copy a stack into out with its first two axes swapped, e.g. from projections to sinograms.
+
+    A single ``np.swapaxes`` copy walks one of the arrays with a stride of a whole image, so almost every row is a
+    cache miss. Instead the copy is done in small square tiles, and blocks of output rows are filled on the compute
+    thread pool.
+
+    :param array: The stack to copy
+    :param out: The array to copy into, with the first two axes of array swapped
+    :param progress: Progress updated as each block of output rows is filled
+    :return: out
+    """
+    expected_shape = (array.shape[1], array.shape[0], *array.shape[2:])
+    if out.shape != expected_shape:
+        raise ValueError(f"Output has shape {out.shape}, expected {expected_shape}")
+
+    block = _swap_axes_block(array.shape, array.itemsize)
+    num_blocks = math.ceil(out.shape[0] / block)
+    run_compute_func_threaded_impl(_SwapAxesWorker(array, out, block),
+                                   num_blocks,
+                                   progress,
+                                   "Swap axes",
+                                   bytes_per_operation=array.nbytes // max(num_blocks, 1))
+    return out
+
+
+def swap_axes_in_place(array: np.ndarray, progress: Progress | None = None) -> np.ndarray:
+    """
+    Swap the first two axes of a stack without a second copy of the data. Only possible when they are the same size.
+
+    :param array: The stack to transpose, its first two axes must be the same size
+    :param progress: Progress updated as each block of rows is finished
+    :return: array
+    """
+    if array.shape[0] != array.shape[1]:
+        raise ValueError(f"Can not swap the axes of an array with shape {array.shape} in place")
+
+    block = _swap_axes_block(array.shape, array.itemsize)
+    num_blocks = math.ceil(array.shape[0] / block)
+    run_compute_func_threaded_impl(_SwapAxesInPlaceWorker(array, block),
+                                   num_blocks,
+                                   progress,
+                                   "Swap axes",
+                                   bytes_per_operation=array.nbytes // max(num_blocks, 1))
+    return array
+
+
 class SharedArray:
 
-    def __init__(self, array: np.ndarray, shared_memory: SharedMemory | None, free_mem_on_del: bool = True):
+    def __init__(self,
+                 array: np.ndarray,
+                 shared_memory: SharedMemory | None,
+                 free_mem_on_del: bool = True,
+                 mmap_path: str | None = None,
+                 mmap_offset: int = 0):
+        """
+        :param array: The array, using the shared memory or memory mapped file as its buffer if there is one
+        :param shared_memory: The shared memory holding the array, if it is in shared memory
+        :param free_mem_on_del: Unlink the shared memory, or delete the memory mapped file, when this is deleted
+        :param mmap_path: The file holding the array, if it is memory mapped
+        :param mmap_offset: Offset of the array data within the memory mapped file
+        """
         self.array = array
         self._shared_memory = shared_memory
         self._free_mem_on_del = free_mem_on_del
+        self._mmap_path = mmap_path
+        self._mmap_offset = mmap_offset
 
     def __del__(self):
-        if self.has_shared_memory:
+        if self._shared_memory is not None:
             self._shared_memory.close()
             if self._free_mem_on_del:
+                invalidate_attached_array(self._shared_memory.name)
                 try:
                     self._shared_memory.unlink()
                 except FileNotFoundError:
                     # Do nothing, memory has already been freed
                     pass
+        elif self._mmap_path is not None and self._free_mem_on_del:
+            invalidate_attached_array(self._mmap_path)
+            try:
+                os.remove(self._mmap_path)
+            except FileNotFoundError:
+                pass
 
     @property
     def has_shared_memory(self) -> bool:
-        return self._shared_memory is not None
+        """
+        True if the array can be attached to from other processes, either in shared memory or a memory mapped file
+        """
+        return self._shared_memory is not None or self._mmap_path is not None
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        return self._mmap_path is not None
+
+    @property
+    def mmap_path(self) -> str | None:
+        return self._mmap_path
 
     @property
     def array_proxy(self) -> SharedArrayProxy:
         mem_name = self._shared_memory.name if self._shared_memory else None
-        return SharedArrayProxy(mem_name=mem_name, shape=self.array.shape, dtype=self.array.dtype)
+        return SharedArrayProxy(mem_name=mem_name,
+                                shape=self.array.shape,
+                                dtype=self.array.dtype,
+                                mmap_path=self._mmap_path,
+                                mmap_offset=self._mmap_offset)
 
 
 class SharedArrayProxy:
 
-    def __init__(self, mem_name: str | None, shape: tuple[int, ...], dtype: npt.DTypeLike):
+    def __init__(self,
+                 mem_name: str | None,
+                 shape: tuple[int, ...],
+                 dtype: npt.DTypeLike,
+                 mmap_path: str | None = None,
+                 mmap_offset: int = 0):
         self._mem_name = mem_name
         self._shape = shape
         self._dtype = dtype
+        self._mmap_path = mmap_path
+        self._mmap_offset = mmap_offset
         self._shared_array: SharedArray | None = None
 
     @property
     def array(self) -> np.ndarray:
         if self._shared_array is None:
-            mem = shared_memory.SharedMemory(name=self._mem_name)
-            self._shared_array = _read_array_from_shared_memory(self._shape, self._dtype, mem, False)
+            if self._mmap_path is not None:
+                self._shared_array = _attach_memory_mapped_array(self._mmap_path, self._mmap_offset, self._shape,
+                                                                 self._dtype)
+            else:
+                self._shared_array = _attach_shared_array(self._mem_name, self._shape, self._dtype)
         return self._shared_array.array
+
+    def __getstate__(self) -> dict:
+        # Only the description of the memory is sent to other processes, they attach to it themselves
+        state = self.__dict__.copy()
+        state['_shared_array'] = None
+        return state
+
+
+# Shared memory and memory mapped files attached by SharedArrayProxy in this process, keyed by memory name or path.
+# Proxies are recreated for every task sent to the pool, so attachments are kept here to avoid opening and mapping the
+# same memory again for each task. Entries are removed when the owner frees the memory, and workers release all of
+# theirs at the end of each job.
+_attached_arrays: dict[tuple[str | None, tuple[int, ...], str], SharedArray] = {}
+
+
+def _attach_shared_array(mem_name: str | None, shape: tuple[int, ...], dtype: npt.DTypeLike) -> SharedArray:
+    key = (mem_name, tuple(shape), np.dtype(dtype).str)
+    shared_array = _attached_arrays.get(key)
+    if shared_array is None:
+        mem = shared_memory.SharedMemory(name=mem_name)
+        shared_array = _read_array_from_shared_memory(shape, dtype, mem, False)
+        _attached_arrays[key] = shared_array
+    return shared_array
+
+
+def _attach_memory_mapped_array(path: str, offset: int, shape: tuple[int, ...], dtype: npt.DTypeLike) -> SharedArray:
+    key = (path, tuple(shape), np.dtype(dtype).str)
+    shared_array = _attached_arrays.get(key)
+    if shared_array is None:
+        shared_array = _map_file(path, offset, shape, dtype, free_mem_on_delete=False)
+        _attached_arrays[key] = shared_array
+    return shared_array
+
+
+def invalidate_attached_array(mem_name: str) -> None:
+    """
+    Forget any attachments to the named shared memory, or memory mapped file path, held by this process
+    """
+    for key in [key for key in _attached_arrays if key[0] == mem_name]:
+        del _attached_arrays[key]
+
+
+def release_attached_arrays() -> None:
+    """
+    Forget all attachments to shared memory held by this process
+    """
+    _attached_arrays.clear()
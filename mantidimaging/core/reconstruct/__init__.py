@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .astra_recon import AstraRecon
+from .fbp_recon import FBP_CPU_ALGORITHM, FBPRecon
 from .tomopy_recon import TomopyRecon
 from .cil_recon import CILRecon
 
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 def get_reconstructor_for(algorithm: str) -> BaseRecon:
     if algorithm == "gridrec":
         return TomopyRecon()
+    if algorithm == FBP_CPU_ALGORITHM:
+        return FBPRecon()
     if algorithm.startswith("CIL"):
         return CILRecon()
     else:
@@ -5,7 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-from numpy.polynomial import Polynomial
+
+from mantidimaging.core.parallel import utility as pu
 
 if TYPE_CHECKING:
     from mantidimaging.core.data import ImageStack
@@ -20,18 +21,47 @@ class BaseRecon:
         raise NotImplementedError("Base class call")
 
     @staticmethod
-    def prepare_sinogram(data: np.ndarray, recon_params: ReconstructionParameters) -> np.ndarray:
-        logged_data = BaseRecon.negative_log(data)
-        if recon_params.beam_hardening_coefs is not None:
-            coefs = np.array([0.0, 1.0] + recon_params.beam_hardening_coefs)
-            bhc_poly = Polynomial(coefs.astype(data.dtype))
-            return bhc_poly(logged_data)
-        else:
-            return logged_data
+    def find_cor_runs_on_one_cpu() -> bool:
+        """
+        True if find_cor only uses a single CPU core and no GPU, so that the CoR of several slices can be searched for
+        at the same time in separate processes
+        """
+        return False
 
     @staticmethod
-    def negative_log(data: np.ndarray) -> np.ndarray:
-        return -np.log(data)
+    def prepare_sinogram(data: np.ndarray,
+                         recon_params: ReconstructionParameters,
+                         out: np.ndarray | None = None,
+                         progress: Progress | None = None) -> np.ndarray:
+        """
+        Take the negative log of the data and apply the beam hardening correction, one image at a time so that the
+        only temporary array is the size of a single image.
+
+        :param data: A single sinogram, or a stack of sinograms or projections
+        :param recon_params: Reconstruction parameters with the beam hardening coefficients
+        :param out: Array to write the result to, which can be data itself to prepare it in place. If given, the
+                    images are prepared on the thread pool, otherwise one after the other on this thread.
+        :param progress: Optional progress reporter, only used when out is given
+        :return: out, or a new array if out is not given
+        """
+        if out is None:
+            out = np.empty(data.shape, dtype=np.result_type(data.dtype, np.float32))
+            if data.ndim < 3:
+                _prepare_image(data, out, recon_params.beam_hardening_coefs)
+            else:
+                for index in range(data.shape[0]):
+                    _prepare_image(data[index], out[index], recon_params.beam_hardening_coefs)
+            return out
+        if out.shape != data.shape:
+            raise ValueError(f"Output shape {out.shape} does not match data shape {data.shape}")
+
+        worker = _PrepareSinogramWorker(data, out, recon_params.beam_hardening_coefs)
+        pu.run_compute_func_threaded_impl(worker,
+                                          data.shape[0],
+                                          progress,
+                                          "Preparing sinograms",
+                                          bytes_per_operation=out[0].nbytes)
+        return out
 
     @staticmethod
     def single_sino(sino: np.ndarray,
@@ -71,3 +101,31 @@ class BaseRecon:
     @staticmethod
     def allowed_filters() -> list[str]:
         return []
+
+
+def _prepare_image(data: np.ndarray, out: np.ndarray, beam_hardening_coefs: list[float] | None) -> None:
+    np.log(data, out=out)
+    np.negative(out, out=out)
+    if beam_hardening_coefs is None:
+        return
+    # x + c2 x^2 + c3 x^3 + ... by Horner's method, which only needs one temporary the size of the image
+    coefs = np.array([1.0] + beam_hardening_coefs, dtype=out.dtype)
+    result = np.full_like(out, coefs[-1])
+    for coef in coefs[-2::-1]:
+        result *= out
+        result += coef
+    np.multiply(result, out, out=out)
+
+
+class _PrepareSinogramWorker:
+    """
+    Prepares a single image of the data, the ufuncs release the GIL so the images can be prepared on threads
+    """
+
+    def __init__(self, data: np.ndarray, out: np.ndarray, beam_hardening_coefs: list[float] | None):
+        self.data = data
+        self.out = out
+        self.beam_hardening_coefs = beam_hardening_coefs
+
+    def __call__(self, index: int) -> None:
+        _prepare_image(self.data[index], self.out[index], self.beam_hardening_coefs)
@@ -394,8 +394,8 @@ class CILRecon(BaseRecon):
             ag.set_angles(angles=angles, angle_unit='radian')
             ag.set_labels(data_order)
 
-            data = CILRecon.get_data(BaseRecon.prepare_sinogram(images.data, recon_params), ag, recon_params,
-                                     num_subsets)
+            sinos = BaseRecon.prepare_sinogram(images.data, recon_params, out=np.empty(images.data.shape, np.float32))
+            data = CILRecon.get_data(sinos, ag, recon_params, num_subsets)
 
             ig = ag.get_ImageGeometry()
 
@@ -0,0 +1,209 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+"""
+Filtered back projection on the CPU using NumPy and SciPy, for machines without CUDA
+"""
+from __future__ import annotations
+
+import math
+from logging import getLogger
+from typing import Any
+
+import numpy as np
+from scipy import fft
+from scipy.optimize import minimize
+
+from mantidimaging.core.data import ImageStack
+from mantidimaging.core.parallel import manager as pm
+from mantidimaging.core.parallel import shared as ps
+from mantidimaging.core.parallel import utility as pu
+from mantidimaging.core.reconstruct.base_recon import BaseRecon
+from mantidimaging.core.utility.data_containers import ProjectionAngles, ReconstructionParameters, ScalarCoR
+from mantidimaging.core.utility.progress_reporting import Progress
+
+LOG = getLogger(__name__)
+
+FBP_CPU_ALGORITHM = "FBP_CPU"
+
+
+def fourier_filter(size: int, filter_name: str) -> np.ndarray:
+    """
+    The ramp filter with a window applied, for the non-negative frequencies of a real FFT of the given size.
+    The ramp is built from its sampled spatial form, so it does not shift the mean of the slice.
+
+    :param size: Length of the padded detector rows that will be filtered
+    :param filter_name: One of :meth:`FBPRecon.allowed_filters`
+    """
+    if filter_name == 'none':
+        return np.ones(size // 2 + 1)
+
+    n = np.concatenate((np.arange(1, size // 2 + 1, 2), np.arange(size // 2 - 1, 0, -2)))
+    spatial = np.zeros(size)
+    spatial[0] = 0.25
+    spatial[1::2] = -1 / (np.pi * n)**2
+    ramp = 2 * np.real(fft.fft(spatial))
+
+    omega = 2 * np.pi * fft.fftfreq(size)
+    if filter_name == 'ram-lak':
+        window = np.ones(size)
+    elif filter_name == 'shepp-logan':
+        window = np.sinc(omega / (2 * np.pi))
+    elif filter_name == 'cosine':
+        window = np.cos(omega / 2)
+    elif filter_name == 'hamming':
+        window = 0.54 + 0.46 * np.cos(omega)
+    elif filter_name == 'hann':
+        window = 0.5 + 0.5 * np.cos(omega)
+    else:
+        raise ValueError(f"Unknown filter for {FBP_CPU_ALGORITHM}: {filter_name}")
+    return (ramp * window)[:size // 2 + 1]
+
+
+def filter_sinograms(sinos: np.ndarray, filter_name: str) -> np.ndarray:
+    """
+    Filter the detector rows of a block of sinograms together, zero padding them to avoid wrap around
+
+    :param sinos: Sinograms with shape (slices, angles, detector width)
+    :return: The filtered sinograms, with the same shape
+    """
+    width = sinos.shape[-1]
+    size = max(64, 1 << math.ceil(math.log2(2 * width)))
+    spectrum = fft.rfft(sinos, n=size, axis=-1)
+    spectrum *= fourier_filter(size, filter_name)
+    return fft.irfft(spectrum, n=size, axis=-1)[..., :width].astype(np.float32, copy=False)
+
+
+def back_project(filtered: np.ndarray, angles: np.ndarray, cors: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Back project a block of filtered sinograms with linear interpolation between detector pixels. Each slice can
+    have its own CoR, which is how the tilt of the rotation axis is followed.
+
+    :param filtered: Filtered sinograms with shape (slices, angles, detector width)
+    :param angles: Projection angles in radians
+    :param cors: CoR of every slice, as a position along the detector
+    :param out: Output with shape (slices, width, width), overwritten with the reconstructed slices
+    """
+    num_slices, num_angles, width = filtered.shape
+    coords = np.arange(width, dtype=np.float32) - (width - 1) / 2
+    x = coords[np.newaxis, :]
+    y = -coords[:, np.newaxis]
+    # A zero either side of the detector, so rays that miss it read zeros rather than needing a mask
+    padded = np.zeros((num_slices, num_angles, width + 3), dtype=np.float32)
+    padded[..., 1:width + 1] = filtered
+    steps = np.diff(padded, axis=-1)
+    # Slices with the same CoR sample the detector at the same positions, so the positions are worked out once for
+    # each CoR in the block. Without tilt that is once for the whole block.
+    offsets, slice_groups = np.unique(np.asarray(cors, dtype=np.float32), return_inverse=True)
+    groups = [(np.float32(offset + 0.5), np.flatnonzero(slice_groups == i)) for i, offset in enumerate(offsets)]
+
+    out[:] = 0
+    flat_out = out.reshape(num_slices, -1)
+    position = np.empty(width * width, dtype=np.float32)
+    left = np.empty(width * width, dtype=np.intp)
+    sample = np.empty(width * width, dtype=np.float32)
+    for angle_idx, theta in enumerate(angles):
+        base = (x * np.float32(np.cos(theta)) + y * np.float32(np.sin(theta))).ravel()
+        for offset, members in groups:
+            # Index into the padded rows, 0 being the zero before the first pixel
+            np.add(base, offset, out=position)
+            np.clip(position, 0, width + 1, out=position)
+            left[:] = position
+            position -= left
+            for i in members:
+                # Taking from a single row is much faster than fancy indexing the rows of all the slices at once
+                np.take(steps[i, angle_idx], left, out=sample)
+                sample *= position
+                flat_out[i] += sample
+                flat_out[i] += np.take(padded[i, angle_idx], left)
+    out *= np.float32(np.pi / (2 * num_angles))
+    return out
+
+
+def _reconstruct_block(index: int, arrays: list[np.ndarray], params: dict[str, Any]) -> None:
+    images, output = arrays
+    start = index * params['block_size']
+    stop = min(start + params['block_size'], output.shape[0])
+    sinos = images[start:stop] if params['is_sinograms'] else np.swapaxes(images[:, start:stop], 0, 1)
+    recon_params: ReconstructionParameters = params['recon_params']
+    filtered = filter_sinograms(BaseRecon.prepare_sinogram(sinos, recon_params), recon_params.filter_name)
+    back_project(filtered, params['angles'], params['cors'][start:stop], output[start:stop])
+
+
+class FBPRecon(BaseRecon):
+    """
+    Filtered back projection that runs on the CPU without any optional dependencies. Full reconstructions are split
+    into blocks of slices that are filtered together and run on the process pool.
+    """
+
+    @staticmethod
+    def find_cor(images: ImageStack, slice_idx: int, start_cor: float | np.ndarray,
+                 recon_params: ReconstructionParameters) -> float:
+        """
+        Find the best CoR for this slice by maximising the squared sum of the reconstructed slice
+        """
+        proj_angles = images.projection_angles(recon_params.max_projection_angle)
+        sino = images.sino(slice_idx)
+
+        def minimizer_function(cor: float | np.ndarray) -> float:
+            if isinstance(cor, np.ndarray):
+                cor = float(cor[0])
+            return -float(np.sum(FBPRecon.single_sino(sino, ScalarCoR(cor), proj_angles, recon_params)**2))
+
+        return minimize(minimizer_function, start_cor, method='nelder-mead', tol=0.1).x[0]
+
+    @staticmethod
+    def find_cor_runs_on_one_cpu() -> bool:
+        return True
+
+    @staticmethod
+    def single_sino(sino: np.ndarray,
+                    cor: ScalarCoR,
+                    proj_angles: ProjectionAngles,
+                    recon_params: ReconstructionParameters,
+                    progress: Progress | None = None) -> np.ndarray:
+        assert sino.ndim == 2, "Sinogram must be a 2D image"
+
+        sinos = BaseRecon.prepare_sinogram(sino[np.newaxis], recon_params)
+        output = np.empty((1, sino.shape[1], sino.shape[1]), dtype=np.float32)
+        filtered = filter_sinograms(sinos, recon_params.filter_name)
+        return back_project(filtered, proj_angles.value, np.array([cor.value]), output)[0]
+
+    @staticmethod
+    def full(images: ImageStack,
+             cors: list[ScalarCoR],
+             recon_params: ReconstructionParameters,
+             progress: Progress | None = None) -> ImageStack:
+        num_slices = images.num_sinograms
+        width = images.width
+        # A block holds the padded filtered sinograms, their differences and the output slices
+        bytes_per_slice = (2 * images.num_projections * width + width * width) * np.dtype(np.float32).itemsize
+        block_size = pu.calculate_chunksize(pm.cores, num_slices, bytes_per_slice)
+        num_blocks = math.ceil(num_slices / block_size)
+        progress = Progress.ensure_instance(progress, num_steps=num_blocks, task_name=FBP_CPU_ALGORITHM)
+
+        output_images = ImageStack.create_empty_image_stack((num_slices, width, width),
+                                                            np.float32,
+                                                            images.metadata,
+                                                            memory_mapped=images.is_memory_mapped)
+        output_images.record_operation('FBPRecon.full', 'Volume Reconstruction', **recon_params.to_dict())
+        params = {
+            'block_size': block_size,
+            'cors': np.array([cor.value for cor in cors[:num_slices]]),
+            'angles': images.projection_angles(recon_params.max_projection_angle).value,
+            'recon_params': recon_params,
+            'is_sinograms': images.is_sinograms
+        }
+        LOG.info(f"Reconstructing {num_slices} slices in blocks of {block_size}")
+        ps.run_compute_func(_reconstruct_block,
+                            num_blocks, [images.shared_array, output_images.shared_array],
+                            params,
+                            progress=progress)
+        return output_images
+
+    @staticmethod
+    def allowed_filters() -> list[str]:
+        return ['ram-lak', 'shepp-logan', 'cosine', 'hamming', 'hann', 'none']
+
+
+def allowed_recon_kwargs() -> dict:
+    return {FBP_CPU_ALGORITHM: ['filter_name']}
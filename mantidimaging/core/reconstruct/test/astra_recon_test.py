@@ -0,0 +1,187 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import astra
+import numpy as np
+import numpy.testing as npt
+from parameterized import parameterized
+
+from mantidimaging.core.data import ImageStack
+from mantidimaging.core.parallel import utility as pu
+from mantidimaging.core.reconstruct import astra_recon
+from mantidimaging.core.reconstruct.astra_recon import AstraRecon, _ProjectorCache, vec_geom_init2d
+from mantidimaging.core.utility.data_containers import ProjectionAngles, ReconstructionParameters, ScalarCoR
+from mantidimaging.core.utility.progress_reporting import Progress
+from mantidimaging.test_helpers.phantom import PHANTOM_WIDTH, generate_phantom, generate_phantom_projections
+
+def rotation_matrix2d(theta: float) -> np.ndarray:
+    return np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
+
+
+class VecGeomTest(unittest.TestCase):
+
+    def test_vec_geom_init2d_matches_rotation_matrices(self):
+        angles = np.linspace(0, 2 * np.pi, 37)
+
+        vectors = vec_geom_init2d(ProjectionAngles(angles), 1.5, -2.25)
+
+        for theta, row in zip(angles, vectors, strict=True):
+            rotation = rotation_matrix2d(theta)
+            npt.assert_allclose(row[0:2], rotation @ [0.0, -1.0], atol=1e-12)
+            npt.assert_allclose(row[2:4], rotation @ [-2.25, 0.0], atol=1e-12)
+            npt.assert_allclose(row[4:6], rotation @ [1.5, 0.0], atol=1e-12)
+
+
+class ProjectorCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.cache = _ProjectorCache(maxsize=2)
+        self.addCleanup(self.cache.clear)
+        self.angles = ProjectionAngles(np.linspace(0, np.pi, 10))
+
+    def test_same_geometry_reuses_projector(self):
+        first = self.cache.get(self.angles, PHANTOM_WIDTH, 0.5, 'line')
+
+        self.assertIs(self.cache.get(self.angles, PHANTOM_WIDTH, 0.5, 'line'), first)
+        self.assertIsNot(self.cache.get(ProjectionAngles(self.angles.value * 2), PHANTOM_WIDTH, 0.5, 'line'), first)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_least_recently_used_projector_deleted(self):
+        first = self.cache.get(self.angles, PHANTOM_WIDTH, 0.5, 'line')
+        second = self.cache.get(self.angles, PHANTOM_WIDTH, 1.0, 'line')
+        self.cache.get(self.angles, PHANTOM_WIDTH, 0.5, 'line')
+
+        with mock.patch("mantidimaging.core.reconstruct.astra_recon.astra.projector.delete",
+                        wraps=astra.projector.delete) as delete:
+            self.cache.get(self.angles, PHANTOM_WIDTH, 1.5, 'line')
+
+        delete.assert_called_once_with(second.proj_id)
+        self.assertIs(self.cache.get(self.angles, PHANTOM_WIDTH, 0.5, 'line'), first)
+
+    def test_no_cor_gives_parallel_geometry(self):
+        geometry = self.cache.get(self.angles, PHANTOM_WIDTH, None, 'line')
+
+        self.assertEqual(geometry.proj_geom['type'], 'parallel')
+        self.assertIs(self.cache.get(self.angles, PHANTOM_WIDTH, None, 'line'), geometry)
+        self.assertEqual(self.cache.get(self.angles, PHANTOM_WIDTH, 0.0, 'line').proj_geom['type'], 'parallel_vec')
+
+    def test_clear_deletes_projectors(self):
+        geometry = self.cache.get(self.angles, PHANTOM_WIDTH, 0.5, 'line')
+
+        with mock.patch("mantidimaging.core.reconstruct.astra_recon.astra.projector.delete") as delete:
+            self.cache.clear()
+
+        delete.assert_called_once_with(geometry.proj_id)
+        self.assertEqual(len(self.cache), 0)
+        astra.projector.delete(geometry.proj_id)
+
+
+class AstraReconCpuTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        cuda_patcher = mock.patch("mantidimaging.core.reconstruct.astra_recon.CudaChecker.cuda_is_present",
+                                  return_value=False)
+        cuda_patcher.start()
+        self.addCleanup(cuda_patcher.stop)
+        self.cors = [ScalarCoR(16.0), ScalarCoR(16.0), ScalarCoR(14.5), ScalarCoR(17.0)]
+        self.images = generate_phantom_projections(self.cors)
+
+    def _assert_phantom(self, result: ImageStack) -> None:
+        self.assertEqual(result.data.shape, (len(self.cors), PHANTOM_WIDTH, PHANTOM_WIDTH))
+        for i, recon in enumerate(result.data):
+            self.assertGreater(np.corrcoef(recon.ravel(), generate_phantom().ravel())[0, 1], 0.9, f"slice {i}")
+
+    @parameterized.expand([("FBP", "FBP", 1), ("FBP_CUDA", "FBP_CUDA", 1), ("SIRT", "SIRT", 200)])
+    def test_full_reconstructs_each_slice_about_its_cor(self, _, algorithm, num_iter):
+        result = AstraRecon.full(self.images, self.cors, ReconstructionParameters(algorithm, "ram-lak", num_iter))
+
+        self._assert_phantom(result)
+        self.assertIsNone(astra_recon._cpu_context.geometry)
+        self.assertEqual(len(astra_recon._projector_cache), 0)
+
+    def test_full_matches_single_sino(self):
+        recon_params = ReconstructionParameters("SIRT", "ram-lak", 10)
+        proj_angles = self.images.projection_angles()
+
+        result = AstraRecon.full(self.images, self.cors, recon_params)
+
+        for i, cor in enumerate(self.cors):
+            npt.assert_allclose(result.data[i],
+                                AstraRecon.single_sino(self.images.sino(i), cor, proj_angles, recon_params),
+                                rtol=1e-5,
+                                atol=1e-6)
+
+    def test_single_sino_reuses_geometry(self):
+        recon_params = ReconstructionParameters("SIRT", "ram-lak", 10)
+        proj_angles = self.images.projection_angles()
+        sino = self.images.sino(2)
+
+        with mock.patch("mantidimaging.core.reconstruct.astra_recon._projector_cache", _ProjectorCache()) as cache:
+            first = AstraRecon.single_sino(sino, self.cors[2], proj_angles, recon_params)
+            second = AstraRecon.single_sino(sino, self.cors[2], proj_angles, recon_params)
+            self.assertEqual(len(cache), 1)
+            cache.clear()
+
+        npt.assert_array_equal(first, second)
+
+    @parameterized.expand([("FBP", "FBP", 1), ("SIRT", "SIRT", 1)])
+    def test_cpu_context_uses_projector_cache(self, _, algorithm, num_iter):
+        recon_params = ReconstructionParameters(algorithm, "ram-lak", num_iter)
+        proj_angles = self.images.projection_angles()
+        context = astra_recon._CpuReconContext()
+
+        with mock.patch("mantidimaging.core.reconstruct.astra_recon._projector_cache", _ProjectorCache()) as cache:
+            self.addCleanup(cache.clear)
+            self.addCleanup(context.release)
+            for i in (0, 1):
+                context.reconstruct(self.images.sino(i), self.cors[i], proj_angles, recon_params)
+            geometry = context.geometry
+
+            cor_vec = None if algorithm == "FBP" else self.cors[0].to_vec(PHANTOM_WIDTH).value
+            self.assertEqual(len(cache), 1)
+            self.assertIs(cache.get(proj_angles, PHANTOM_WIDTH, cor_vec, 'line'), geometry)
+
+    def test_full_of_sinograms(self):
+        self.images.swap_axes()
+
+        result = AstraRecon.full(self.images, self.cors, ReconstructionParameters("FBP", "ram-lak"))
+
+        self._assert_phantom(result)
+
+    def test_full_of_memory_mapped_stack_is_memory_mapped(self):
+        images = ImageStack(pu.create_memory_mapped_array(self.images.data.shape, self.images.dtype))
+        images.data[:] = self.images.data
+
+        result = AstraRecon.full(images, self.cors, ReconstructionParameters("FBP", "ram-lak"))
+
+        self.assertTrue(result.is_memory_mapped)
+        self._assert_phantom(result)
+
+    def test_full_reports_progress(self):
+        progress = Progress()
+
+        AstraRecon.full(self.images, self.cors, ReconstructionParameters("FBP", "ram-lak"), progress)
+
+        self.assertTrue(progress.is_completed())
+        self.assertEqual([entry.step for entry in progress.progress_history[1:len(self.cors) + 1]], [1, 2, 3, 4])
+
+    def test_find_cor_runs_on_one_cpu_without_cuda(self):
+        self.assertTrue(AstraRecon.find_cor_runs_on_one_cpu())
+        with mock.patch("mantidimaging.core.reconstruct.astra_recon.CudaChecker.cuda_is_present", return_value=True):
+            self.assertFalse(AstraRecon.find_cor_runs_on_one_cpu())
+
+    def test_full_cancelled(self):
+        progress = Progress()
+        progress.cancel()
+
+        with self.assertRaises(StopIteration):
+            AstraRecon.full(self.images, self.cors, ReconstructionParameters("FBP", "ram-lak"), progress)
+        self.assertIsNone(astra_recon._cpu_context.geometry)
+
+
+if __name__ == "__main__":
+    unittest.main()
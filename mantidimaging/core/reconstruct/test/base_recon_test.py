@@ -6,10 +6,13 @@ import unittest
 from unittest import mock
 
 import numpy as np
+import numpy.testing as npt
 from parameterized import parameterized
 
+from mantidimaging.core.reconstruct import base_recon
 from mantidimaging.core.reconstruct.base_recon import BaseRecon
 from mantidimaging.core.utility.data_containers import ReconstructionParameters
+from mantidimaging.core.utility.progress_reporting import Progress
 
 
 class BaseReconTest(unittest.TestCase):
@@ -30,3 +33,57 @@ class BaseReconTest(unittest.TestCase):
         self.assertEqual(data.shape, result.shape)
         self.assertEqual(data.dtype, result.dtype)
         self.assertAlmostEqual(output, result[0, 0], 4)
+
+    @parameterized.expand([("no_bhc", None), ("bhc", [0.5, -0.25, 0.1])])
+    def test_prepare_into_out(self, _, coefs):
+        data = np.random.default_rng(3).uniform(0.1, 1.0, (12, 5, 6)).astype(np.float32)
+        recon_params = ReconstructionParameters("FBP_CUDA", "ram-lak", beam_hardening_coefs=coefs)
+        expected = BaseRecon.prepare_sinogram(data, recon_params)
+        out = np.empty_like(data)
+        progress = Progress()
+
+        result = BaseRecon.prepare_sinogram(data, recon_params, out=out, progress=progress)
+
+        self.assertIs(result, out)
+        npt.assert_allclose(out, expected, rtol=1e-6)
+        self.assertTrue(progress.is_completed())
+
+    def test_prepare_without_out_one_image_at_a_time(self):
+        data = np.random.default_rng(3).uniform(0.1, 1.0, (4, 5, 6)).astype(np.float32)
+        recon_params = ReconstructionParameters("FBP_CUDA", "ram-lak", beam_hardening_coefs=[0.5, 0.2])
+
+        with mock.patch("mantidimaging.core.reconstruct.base_recon._prepare_image",
+                        wraps=base_recon._prepare_image) as prepare_image:
+            result = BaseRecon.prepare_sinogram(data, recon_params)
+
+        self.assertEqual(prepare_image.call_count, data.shape[0])
+        for call in prepare_image.call_args_list:
+            self.assertEqual(call.args[0].shape, data.shape[1:])
+        logged = -np.log(data)
+        npt.assert_allclose(result, logged + 0.5 * logged**2 + 0.2 * logged**3, rtol=1e-5)
+
+    def test_prepare_in_place(self):
+        data = np.random.default_rng(3).uniform(0.1, 1.0, (12, 5, 6)).astype(np.float32)
+        recon_params = ReconstructionParameters("FBP_CUDA", "ram-lak", beam_hardening_coefs=[0.5, 0.2])
+        logged = -np.log(data)
+        expected = logged + 0.5 * logged**2 + 0.2 * logged**3
+
+        result = BaseRecon.prepare_sinogram(data, recon_params, out=data)
+
+        self.assertIs(result, data)
+        npt.assert_allclose(data, expected, rtol=1e-5)
+
+    def test_prepare_integer_data(self):
+        data = np.full((3, 4), 2, dtype=np.uint16)
+        recon_params = ReconstructionParameters("FBP_CUDA", "ram-lak")
+
+        result = BaseRecon.prepare_sinogram(data, recon_params)
+
+        self.assertEqual(result.dtype, np.float32)
+        npt.assert_allclose(result, -np.log(2), rtol=1e-6)
+
+    def test_prepare_into_wrong_shape(self):
+        recon_params = ReconstructionParameters("FBP_CUDA", "ram-lak")
+
+        with self.assertRaisesRegex(ValueError, "shape"):
+            BaseRecon.prepare_sinogram(np.ones((3, 4, 5)), recon_params, out=np.empty((3, 4, 4)))
@@ -0,0 +1,104 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+from parameterized import parameterized
+
+from mantidimaging.core.reconstruct import get_reconstructor_for
+from mantidimaging.core.reconstruct.fbp_recon import FBPRecon, fourier_filter
+from mantidimaging.core.utility.data_containers import ReconstructionParameters, ScalarCoR
+from mantidimaging.core.utility.progress_reporting import Progress
+from mantidimaging.test_helpers.phantom import generate_phantom, generate_phantom_projections
+
+
+class FourierFilterTest(unittest.TestCase):
+
+    def test_ramp(self):
+        ramp = fourier_filter(64, 'ram-lak')
+
+        self.assertEqual(ramp.shape, (33, ))
+        self.assertLess(abs(ramp[0]), 0.01)
+        self.assertTrue(np.all(np.diff(ramp) > 0))
+        self.assertAlmostEqual(ramp[-1], 1.0, delta=0.01)
+
+    @parameterized.expand([("shepp-logan", ), ("cosine", ), ("hamming", ), ("hann", )])
+    def test_windows_reduce_high_frequencies(self, filter_name):
+        ramp = fourier_filter(64, 'ram-lak')
+
+        windowed = fourier_filter(64, filter_name)
+
+        self.assertTrue(np.all(windowed <= ramp + 1e-12))
+        self.assertLess(windowed[-1], 0.7 * ramp[-1])
+
+    def test_none(self):
+        npt.assert_array_equal(fourier_filter(64, 'none'), np.ones(33))
+
+    def test_unknown_filter(self):
+        self.assertRaises(ValueError, fourier_filter, 64, 'kaiser')
+
+
+class FBPReconTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # The CoR moves along the slices, as it does for a tilted rotation axis
+        self.cors = [ScalarCoR(16.0), ScalarCoR(15.5), ScalarCoR(15.0), ScalarCoR(15.0), ScalarCoR(14.5)]
+        self.images = generate_phantom_projections(self.cors)
+        self.recon_params = ReconstructionParameters("FBP_CPU", "ram-lak")
+
+    def _assert_phantom(self, recon: np.ndarray) -> None:
+        self.assertGreater(np.corrcoef(recon.ravel(), generate_phantom().ravel())[0, 1], 0.95)
+        # The projections were of 0.1 times the phantom
+        self.assertAlmostEqual(float(recon.max()), 0.1, delta=0.02)
+
+    def test_registered(self):
+        self.assertIsInstance(get_reconstructor_for("FBP_CPU"), FBPRecon)
+
+    @parameterized.expand([("ram-lak", ), ("shepp-logan", ), ("cosine", ), ("hamming", ), ("hann", )])
+    def test_single_sino(self, filter_name):
+        recon_params = ReconstructionParameters("FBP_CPU", filter_name)
+
+        recon = FBPRecon.single_sino(self.images.sino(4), self.cors[4], self.images.projection_angles(), recon_params)
+
+        self.assertEqual(recon.shape, (32, 32))
+        self._assert_phantom(recon)
+
+    def test_full_matches_single_sino_per_slice_cor(self):
+        proj_angles = self.images.projection_angles()
+
+        result = FBPRecon.full(self.images, self.cors, self.recon_params)
+
+        self.assertEqual(result.data.shape, (5, 32, 32))
+        for i, cor in enumerate(self.cors):
+            npt.assert_allclose(result.data[i],
+                                FBPRecon.single_sino(self.images.sino(i), cor, proj_angles, self.recon_params),
+                                rtol=1e-5,
+                                atol=1e-6)
+            self._assert_phantom(result.data[i])
+
+    def test_full_of_sinograms(self):
+        self.images.swap_axes()
+
+        result = FBPRecon.full(self.images, self.cors, self.recon_params)
+
+        for recon in result.data:
+            self._assert_phantom(recon)
+
+    def test_full_reports_progress(self):
+        progress = Progress()
+
+        FBPRecon.full(self.images, self.cors, self.recon_params, progress)
+
+        self.assertTrue(progress.is_completed())
+
+    def test_find_cor(self):
+        cor = FBPRecon.find_cor(self.images, 0, 15.0, self.recon_params)
+
+        self.assertAlmostEqual(cor, 16.0, delta=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
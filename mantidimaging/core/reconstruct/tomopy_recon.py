@@ -69,7 +69,7 @@ class TomopyRecon(BaseRecon):
 
         kwargs = {
             'ncore': ncores,
-            'tomo': BaseRecon.prepare_sinogram(images.data, recon_params),
+            'tomo': BaseRecon.prepare_sinogram(images.data, recon_params, out=np.empty(images.data.shape, np.float32)),
             'sinogram_order': images._is_sinograms,
             'theta': images.projection_angles(recon_params.max_projection_angle).value,
             'center': [cor.value for cor in cors],
@@ -0,0 +1,100 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import queue
+from logging import getLogger
+from typing import TYPE_CHECKING
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+from mantidimaging.core.data import ImageStack
+from mantidimaging.core.parallel import manager as pm
+from mantidimaging.core.parallel import shared as ps
+from mantidimaging.core.utility.progress_reporting import Progress
+
+if TYPE_CHECKING:
+    from mantidimaging.core.reconstruct.base_recon import BaseRecon
+    from mantidimaging.core.utility.data_containers import ProjectionAngles, ReconstructionParameters
+
+LOG = getLogger(__name__)
+
+
+def _find_cor_of_sinogram(reconstructor: BaseRecon, sino: np.ndarray, proj_angles: ProjectionAngles,
+                          start_cor: float, recon_params: ReconstructionParameters) -> float:
+    # Only the slice being searched is sent to the worker, as a stack with a single row
+    images = ImageStack(sino[:, np.newaxis, :])
+    images.set_projection_angles(proj_angles)
+    try:
+        return float(reconstructor.find_cor(images, 0, start_cor, recon_params))
+    finally:
+        # Nothing tells the pool process when the last search has finished, so drop what this one cached
+        ps.release_job_caches()
+
+
+def find_cors(reconstructor: BaseRecon,
+              images: ImageStack,
+              slices: Sequence[int],
+              initial_cors: Sequence[float],
+              recon_params: ReconstructionParameters,
+              progress: Progress | None = None,
+              on_cor_found: Callable[[int, float], None] | None = None) -> list[float]:
+    """
+    Find the CoR of each slice with the reconstructor's minimisation of the squared sum of the reconstructed slice.
+    If the reconstructor's search runs on a single CPU core, the slices are searched at the same time on the process
+    pool, each worker reconstructing only its own slice. Otherwise, e.g. for searches using the GPU or several threads,
+    they are searched one after another.
+
+    :param reconstructor: Reconstructor whose find_cor is used
+    :param images: The stack to search
+    :param slices: Indices of the slices to search
+    :param initial_cors: Starting CoR of each slice
+    :param recon_params: Reconstruction parameters
+    :param progress: Progress updated as each search finishes. Cancelling it stops any searches that have not started.
+    :param on_cor_found: Called with the slice index and CoR as each search finishes, which may not be in the order
+                         of the slices. Called on the thread that called this function.
+    :return: The CoR of each slice, in the order of the slices
+    """
+    progress = Progress.ensure_instance(progress, num_steps=len(slices), task_name="Minimise square sum")
+    cors: list[float] = [0.0] * len(slices)
+
+    def found(idx: int, cor: float) -> None:
+        cors[idx] = cor
+        if on_cor_found is not None:
+            on_cor_found(slices[idx], cor)
+        progress.update(msg=f"Found COR for slice {slices[idx]}")
+
+    with progress:
+        if pm.pool is None or len(slices) < 2 or not reconstructor.find_cor_runs_on_one_cpu():
+            for idx, slice_idx in enumerate(slices):
+                found(idx, float(reconstructor.find_cor(images, slice_idx, initial_cors[idx], recon_params)))
+            return cors
+
+        proj_angles = images.projection_angles(recon_params.max_projection_angle)
+        results: queue.Queue[tuple[int, float | None, BaseException | None]] = queue.Queue()
+
+        def submit(idx: int) -> None:
+            assert pm.pool is not None
+            args = (reconstructor, np.ascontiguousarray(images.sino(slices[idx])), proj_angles, initial_cors[idx],
+                    recon_params)
+            pm.pool.apply_async(_find_cor_of_sinogram,
+                                args,
+                                callback=lambda cor: results.put((idx, cor, None)),
+                                error_callback=lambda error: results.put((idx, None, error)))
+
+        # Only one search per process is queued at a time, so that cancelling does not leave the rest to run
+        next_idx = min(pm.cores, len(slices))
+        for idx in range(next_idx):
+            submit(idx)
+        LOG.info(f"Searching for the COR of {len(slices)} slices on {pm.cores} processes")
+        for _ in range(len(slices)):
+            idx, cor, error = results.get()
+            if error is not None:
+                raise error
+            assert cor is not None
+            found(idx, cor)
+            if next_idx < len(slices):
+                submit(next_idx)
+                next_idx += 1
+    return cors
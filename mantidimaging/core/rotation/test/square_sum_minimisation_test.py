@@ -0,0 +1,139 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import unittest
+from multiprocessing.pool import ThreadPool
+from unittest import mock
+
+import numpy.testing as npt
+
+from mantidimaging.core.reconstruct.base_recon import BaseRecon
+from mantidimaging.core.reconstruct.fbp_recon import FBPRecon
+from mantidimaging.core.rotation.square_sum_minimisation import find_cors
+from mantidimaging.core.utility.data_containers import ReconstructionParameters, ScalarCoR
+from mantidimaging.core.utility.progress_reporting import Progress
+from mantidimaging.test_helpers.phantom import generate_phantom_projections
+from mantidimaging.test_helpers.start_qapplication import start_multiprocessing_pool
+from mantidimaging.test_helpers.unit_test_helper import generate_images
+
+
+class FindCorsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.images = generate_images((10, 8, 12), seed=6)
+        self.slices = [1, 3, 5, 7]
+        self.recon_params = ReconstructionParameters("FBP_CPU", "ram-lak")
+        self.reconstructor = mock.create_autospec(BaseRecon, instance=True)
+        self.reconstructor.find_cor.side_effect = self._find_cor
+        self.reconstructor.find_cor_runs_on_one_cpu.return_value = True
+        self.searched: list[tuple] = []
+
+    def _find_cor(self, images, slice_idx, start_cor, recon_params):
+        sino = images.sino(slice_idx)
+        self.searched.append((sino.copy(), images.projection_angles(recon_params.max_projection_angle).value))
+        return start_cor + float(sino.sum())
+
+    def _expected(self, initial_cors: list[float]) -> list[float]:
+        return [
+            cor + float(self.images.sino(slice_idx).sum())
+            for slice_idx, cor in zip(self.slices, initial_cors, strict=True)
+        ]
+
+    def _use_pool(self, cores: int = 2) -> None:
+        pool = ThreadPool(cores)
+        self.addCleanup(pool.terminate)
+        for name, value in (("pool", pool), ("cores", cores)):
+            patcher = mock.patch(f"mantidimaging.core.rotation.square_sum_minimisation.pm.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_find_cors_without_pool(self):
+        initial_cors = [4.0, 5.0, 6.0, 7.0]
+        found = mock.Mock()
+
+        cors = find_cors(self.reconstructor, self.images, self.slices, initial_cors, self.recon_params, None, found)
+
+        npt.assert_allclose(cors, self._expected(initial_cors), rtol=1e-6)
+        self.assertEqual([c.args[0] for c in found.call_args_list], self.slices)
+
+    def test_find_cors_on_pool(self):
+        self._use_pool()
+        initial_cors = [4.0, 5.0, 6.0, 7.0]
+        found = mock.Mock()
+        progress = Progress()
+
+        cors = find_cors(self.reconstructor, self.images, self.slices, initial_cors, self.recon_params, progress, found)
+
+        npt.assert_allclose(cors, self._expected(initial_cors), rtol=1e-6)
+        self.assertCountEqual([c.args[0] for c in found.call_args_list], self.slices)
+        for slice_idx, cor in (c.args for c in found.call_args_list):
+            self.assertEqual(cors[self.slices.index(slice_idx)], cor)
+        self.assertTrue(progress.is_completed())
+
+    def test_workers_only_get_their_slice(self):
+        self._use_pool()
+
+        find_cors(self.reconstructor, self.images, self.slices, [4.0] * 4, self.recon_params)
+
+        self.assertEqual(len(self.searched), len(self.slices))
+        sinos = sorted((sino for sino, _ in self.searched), key=lambda s: float(s.sum()))
+        expected = sorted((self.images.sino(i) for i in self.slices), key=lambda s: float(s.sum()))
+        for sino, expected_sino in zip(sinos, expected, strict=True):
+            npt.assert_array_equal(sino, expected_sino)
+        for _, angles in self.searched:
+            npt.assert_array_equal(angles, self.images.projection_angles().value)
+
+    def test_gpu_search_does_not_use_pool(self):
+        self._use_pool()
+        self.reconstructor.find_cor_runs_on_one_cpu.return_value = False
+
+        with mock.patch("mantidimaging.core.rotation.square_sum_minimisation.pm.pool.apply_async") as apply_async:
+            cors = find_cors(self.reconstructor, self.images, self.slices, [4.0] * 4, self.recon_params)
+
+        apply_async.assert_not_called()
+        npt.assert_allclose(cors, self._expected([4.0] * 4), rtol=1e-6)
+
+    def test_worker_caches_released_after_search(self):
+        self._use_pool()
+
+        with mock.patch("mantidimaging.core.rotation.square_sum_minimisation.ps.release_job_caches") as release:
+            find_cors(self.reconstructor, self.images, self.slices, [4.0] * 4, self.recon_params)
+
+        self.assertEqual(release.call_count, len(self.slices))
+
+    def test_error_is_raised(self):
+        self._use_pool()
+        self.reconstructor.find_cor.side_effect = RuntimeError("search failed")
+
+        with self.assertRaisesRegex(RuntimeError, "search failed"):
+            find_cors(self.reconstructor, self.images, self.slices, [4.0] * 4, self.recon_params)
+
+    def test_cancel_stops_queued_searches(self):
+        self._use_pool(cores=1)
+        progress = Progress()
+
+        with self.assertRaises(StopIteration):
+            find_cors(self.reconstructor, self.images, self.slices, [4.0] * 4, self.recon_params, progress,
+                      lambda *_: progress.cancel())
+
+        self.assertLess(len(self.searched), len(self.slices))
+
+
+@start_multiprocessing_pool
+class FindCorsOnProcessPoolTest(unittest.TestCase):
+
+    def test_matches_sequential_search(self):
+        images = generate_phantom_projections([ScalarCoR(16.0), ScalarCoR(15.0), ScalarCoR(14.5)])
+        recon_params = ReconstructionParameters("FBP_CPU", "ram-lak")
+        found = mock.Mock()
+
+        cors = find_cors(FBPRecon(), images, [0, 1, 2], [15.5] * 3, recon_params, on_cor_found=found)
+
+        expected = [FBPRecon.find_cor(images, i, 15.5, recon_params) for i in range(3)]
+        npt.assert_allclose(cors, expected)
+        self.assertEqual(found.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from mantidimaging.eyes_tests.base_eyes import BaseEyesTest, NEXUS_SAMPLE
+from mantidimaging.test_helpers.qt_test_helpers import wait_until
 
 
 class NexusLoadDialogTest(BaseEyesTest):
@@ -25,5 +26,6 @@ class NexusLoadDialogTest(BaseEyesTest):
 
         self.imaging.nexus_load_dialog.presenter.scan_nexus_file()
         self.imaging.presenter.load_nexus_file()
+        wait_until(lambda: len(self.imaging.presenter.datasets) > 0, max_retry=600)
 
         self.check_target(widget=self.imaging)
@@ -14,6 +14,7 @@ from PyQt5.QtWidgets import QFormLayout, QLabel, QWidget, QPushButton
 from mantidimaging.gui.widgets.roi_selector.view import ROISelectorView
 from mantidimaging.gui.windows.stack_choice.presenter import StackChoicePresenter
 from mantidimaging.core.data import ImageStack
+from mantidimaging.core.data.snapshot import SnapshotFrames
 from mantidimaging.gui.test.gui_system_base import GuiSystemBase, SHOW_DELAY, SHORT_DELAY
 from mantidimaging.gui.windows.operations.view import FiltersWindowView
 from mantidimaging.test_helpers.qt_test_helpers import wait_until
@@ -149,7 +150,8 @@ class TestGuiSystemOperations(GuiSystemBase):
 
         def mock_wait_for_stack_choice(self, new_stack: ImageStack, stack_uuid: UUID):
             print("mock_wait_for_stack_choice")
-            stack_choice = StackChoicePresenter(self.original_images_stack[stack_uuid], new_stack, self)
+            snapshot = self.snapshots.latest(stack_uuid)
+            stack_choice = StackChoicePresenter(SnapshotFrames(snapshot), new_stack, self)
             stack_choice.show()
             QTest.qWait(SHOW_DELAY)
             if keep_stack == "new":
@@ -0,0 +1,44 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PyQt5.QtGui import QValidator
+from PyQt5.QtWidgets import QSpinBox, QSizePolicy
+
+from mantidimaging.gui.utility.qt_helpers import on_change_and_disable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+KERNEL_SIZE_TOOLTIP = "Size of the median filter kernel"
+
+
+class KernelSpinBox(QSpinBox):
+
+    def __init__(self, on_change: Callable):
+        """
+        Spin box for entering kernel sizes that only accepts odd numbers.
+        :param on_change: The function to be called when the value changes.
+        """
+        super().__init__()
+        self.setMinimum(3)
+        self.setMaximum(999)
+        self.setSingleStep(2)
+        self.setKeyboardTracking(False)
+        self.setToolTip(KERNEL_SIZE_TOOLTIP)
+        self.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
+        self.valueChanged.connect(lambda: on_change_and_disable(self, on_change))
+
+    def validate(self, input: str, pos: int) -> tuple[QValidator.State, str, int]:
+        """
+        Validate the spin box input. Returns as Intermediate state if the input is empty or contains an even number,
+        otherwise it returns Acceptable.
+        """
+        if not input:
+            return QValidator.State.Intermediate, input, pos
+        kernel_size = int(input)
+        if kernel_size % 2 != 0:
+            return QValidator.State.Acceptable, input, pos
+        return QValidator.State.Intermediate, input, pos
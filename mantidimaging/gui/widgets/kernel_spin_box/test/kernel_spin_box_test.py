@@ -8,7 +8,7 @@ from unittest import mock
 from PyQt5.QtCore import Qt
 from PyQt5.QtTest import QTest
 
-from mantidimaging.core.operations.median_filter.median_filter import KernelSpinBox
+from mantidimaging.gui.widgets.kernel_spin_box.kernel_spin_box import KernelSpinBox
 from mantidimaging.test_helpers import start_qapplication
 
 
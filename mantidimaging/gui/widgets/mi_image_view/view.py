@@ -44,6 +44,9 @@ def clip(value, lower, upper):
 # we need keep a reference to the dead objects.
 graveyard = []
 
+# Frames of lazily read data that are used to estimate its levels
+QUICK_MIN_MAX_FRAMES = 5
+
 
 class MIImageView(ImageView, BadDataOverlay, AutoColorMenu):
     details: QLabel
@@ -166,6 +169,14 @@ class MIImageView(ImageView, BadDataOverlay, AutoColorMenu):
             self.set_roi(self.default_roi())
         self.angles = None
 
+    def quickMinMax(self, data):
+        if not isinstance(data, np.ndarray) and data.ndim == 3:
+            # Frames of data that is not an array, like a snapshot, are read when indexed. Estimate the levels from a
+            # few of them, rather than reading every frame to subsample them.
+            indices = np.unique(np.linspace(0, data.shape[0] - 1, QUICK_MIN_MAX_FRAMES).astype(int))
+            data = data[indices]
+        return super().quickMinMax(data)
+
     def toggle_jumping_frame(self, images_to_jump_by=None) -> None:
         if not self.shifting_through_images and images_to_jump_by is not None:
             self.shifting_through_images = True
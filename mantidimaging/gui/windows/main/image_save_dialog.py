@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import QDialogButtonBox
 
 from mantidimaging.core.io.filenames import IMAGE_FORMAT_EXTENSIONS
+from mantidimaging.core.io.saver import STACK_FORMATS
 from mantidimaging.core.io.utility import DEFAULT_IO_FILE_FORMAT
 from mantidimaging.gui.mvp_base import BaseDialogView
 from mantidimaging.gui.utility import select_directory
@@ -35,11 +36,13 @@ class ImageSaveDialog(BaseDialogView):
         self.buttonBox.button(QDialogButtonBox.StandardButton.SaveAll).clicked.connect(self.save_all)
 
         # dynamically add all the supported formats
-        formats = IMAGE_FORMAT_EXTENSIONS
+        formats = IMAGE_FORMAT_EXTENSIONS + list(STACK_FORMATS)
         self.formats.addItems(formats)
+        self.formats.currentTextChanged.connect(self._update_compression_types)
 
         # set the default to tiff
         self.formats.setCurrentIndex(formats.index(DEFAULT_IO_FILE_FORMAT))
+        self._update_compression_types()
 
         if stack_list:  # we will just show an empty drop down if no stacks
             # Sort stacknames using Recon and Tomo as preference
@@ -77,3 +80,23 @@ class ImageSaveDialog(BaseDialogView):
 
     def pixel_depth(self) -> str:
         return str(self.pixelDepth.currentText())
+
+    def compression(self) -> str | None:
+        """
+            :return: The compression for single file stack formats, or None if the data will not be compressed
+        """
+        return self.compressionTypes.currentData() if self.compressionTypes.isEnabled() else None
+
+    def _update_compression_types(self) -> None:
+        """
+        Lists the compression that can be used with the selected format. Formats with a file per image can not be
+        compressed.
+        """
+        self.compressionTypes.clear()
+        stack_format = STACK_FORMATS.get(self.image_format())
+        if stack_format is None:
+            self.compressionTypes.setEnabled(False)
+            return
+        for compression in stack_format.compression_types:
+            self.compressionTypes.addItem(compression or "None", compression)
+        self.compressionTypes.setEnabled(True)
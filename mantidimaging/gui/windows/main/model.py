@@ -72,8 +72,15 @@ class MainWindowModel:
         images = loader.load_stack_from_group(group, progress)
         return images
 
-    def do_images_saving(self, images_id: uuid.UUID, output_dir: str, name_prefix: str, image_format: str,
-                         overwrite: bool, pixel_depth: str, progress: Progress) -> bool:
+    def do_images_saving(self,
+                         images_id: uuid.UUID,
+                         output_dir: str,
+                         name_prefix: str,
+                         image_format: str,
+                         overwrite: bool,
+                         pixel_depth: str,
+                         progress: Progress,
+                         compression: str | None = None) -> bool:
         images = self.get_images_by_uuid(images_id)
         if images is None:
             self.raise_error_when_images_not_found(images_id)
@@ -83,17 +90,26 @@ class MainWindowModel:
                                      overwrite_all=overwrite,
                                      out_format=image_format,
                                      pixel_depth=pixel_depth,
-                                     progress=progress)
-        images.filenames = filenames
+                                     progress=progress,
+                                     compression=compression)
+        # Single file stack formats do not have a file per image
+        if image_format not in saver.STACK_FORMATS:
+            images.filenames = filenames
         return True
 
-    def do_nexus_saving(self, dataset_id: uuid.UUID, path: str, sample_name: str, save_as_float: bool) -> bool:
+    def do_nexus_saving(self,
+                        dataset_id: uuid.UUID,
+                        path: str,
+                        sample_name: str,
+                        save_as_float: bool,
+                        compression: str | None = None,
+                        progress: Progress | None = None) -> bool:
         dataset = self.datasets.get(dataset_id)
         if not dataset:
             raise RuntimeError(f"Failed to get Dataset with ID {dataset_id}")
         if not dataset.sample:
             raise RuntimeError(f"Dataset with ID {dataset_id} does not have a sample")
-        saver.nexus_save(dataset, path, sample_name, save_as_float)
+        saver.nexus_save(dataset, path, sample_name, save_as_float, compression, progress)
         return True
 
     def get_existing_180_id(self, dataset_id: uuid.UUID) -> uuid.UUID | None:
@@ -140,10 +140,9 @@ class MainWindowPresenter(BasePresenter):
 
     def load_nexus_file(self) -> None:
         assert self.view.nexus_load_dialog is not None
-        dataset, _ = self.view.nexus_load_dialog.presenter.get_dataset()
-        self.model.add_dataset_to_model(dataset)
-        self._add_dataset_to_view(dataset)
-        self.view.model_changed.emit()
+        nexus_load_presenter = self.view.nexus_load_dialog.presenter
+        start_async_task_view(self.view, nexus_load_presenter.get_dataset, self._on_nexus_load_done,
+                              nexus_load_presenter.get_load_parameters())
 
     def save_nexus_file(self) -> None:
         assert self.view.nexus_save_dialog is not None
@@ -154,9 +153,9 @@ class MainWindowPresenter(BasePresenter):
                                   'dataset_id': dataset_id,
                                   'path': self.view.nexus_save_dialog.save_path(),
                                   'sample_name': self.view.nexus_save_dialog.sample_name(),
-                                  'save_as_float': self.view.nexus_save_dialog.save_as_float
-                              },
-                              busy=True)
+                                  'save_as_float': self.view.nexus_save_dialog.save_as_float,
+                                  'compression': self.view.nexus_save_dialog.compression
+                              })
 
     def load_image_stack(self, file_path: str) -> None:
         start_async_task_view(self.view, self.model.load_image_stack_to_new_dataset, self._on_dataset_load_done,
@@ -187,6 +186,17 @@ class MainWindowPresenter(BasePresenter):
         else:
             raise RuntimeError(self.LOAD_ERROR_STRING.format(task.error))
 
+    def _on_nexus_load_done(self, task: TaskWorkerThread) -> None:
+
+        if task.was_successful():
+            dataset, _ = task.result
+            self.model.add_dataset_to_model(dataset)
+            self._add_dataset_to_view(dataset)
+            self.view.model_changed.emit()
+            task.result = None
+        else:
+            raise RuntimeError(self.LOAD_ERROR_STRING.format(task.error))
+
     def _add_dataset_to_view(self, dataset: Dataset) -> None:
         """
         Takes a loaded dataset and tries to find a substitute 180 projection (if required) then creates the stack window
@@ -333,7 +343,8 @@ class MainWindowPresenter(BasePresenter):
             'name_prefix': self.view.image_save_dialog.name_prefix(),
             'image_format': self.view.image_save_dialog.image_format(),
             'overwrite': self.view.image_save_dialog.overwrite(),
-            'pixel_depth': self.view.image_save_dialog.pixel_depth()
+            'pixel_depth': self.view.image_save_dialog.pixel_depth(),
+            'compression': self.view.image_save_dialog.compression()
         }
         start_async_task_view(self.view, self.model.do_images_saving, self._on_save_done, kwargs)
 
@@ -503,6 +514,9 @@ class MainWindowPresenter(BasePresenter):
         for stack_id in removed_stack_ids:
             if stack_id in self.stack_visualisers:
                 self._delete_stack_visualiser(stack_id)
+            if self.view.filters is not None:
+                # Delete the safe apply snapshot files of the stack
+                self.view.filters.presenter.snapshots.discard(stack_id)
 
         # If the container_id provided is not a stack id then we remove the entire container from the tree view,
         # otherwise we remove the individual stacks that were deleted
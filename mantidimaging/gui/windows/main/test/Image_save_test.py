@@ -5,6 +5,7 @@ from __future__ import annotations
 import unittest
 import uuid
 
+from mantidimaging.core.io.saver import BIGTIFF_FORMAT, NXS_FORMAT
 from mantidimaging.gui.windows.main.presenter import StackId
 from mantidimaging.gui.windows.main.image_save_dialog import sort_by_tomo_and_recon, ImageSaveDialog
 from mantidimaging.test_helpers.start_qapplication import start_qapplication
@@ -43,3 +44,18 @@ class SaveDialogQtTest(unittest.TestCase):
         self.assertEqual(mwsd.stack_uuids[0], stack_list[4].id)
         # the Tomo stack is 2nd choice
         self.assertEqual(mwsd.stack_uuids[1], stack_list[3].id)
+
+    def test_compression_only_for_single_file_stack_formats(self):
+        mwsd = ImageSaveDialog(None, [])
+        self.assertIsNone(mwsd.compression())
+
+        mwsd.formats.setCurrentText(BIGTIFF_FORMAT)
+        self.assertEqual(mwsd.compression(), "zlib")
+
+        mwsd.compressionTypes.setCurrentText("zstd")
+        self.assertEqual(mwsd.compression(), "zstd")
+
+        mwsd.formats.setCurrentText(NXS_FORMAT)
+        self.assertIsNone(mwsd.compression())
+        mwsd.compressionTypes.setCurrentText("gzip")
+        self.assertEqual(mwsd.compression(), "gzip")
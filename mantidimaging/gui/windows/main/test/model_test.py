@@ -275,10 +275,30 @@ class MainWindowModelTest(unittest.TestCase):
                                           overwrite_all=overwrite,
                                           out_format=image_format,
                                           pixel_depth=pixel_depth,
-                                          progress=progress)
+                                          progress=progress,
+                                          compression=None)
         self.assertListEqual(images_mock.filenames, filenames)  # type: ignore
         assert result
 
+    @mock.patch("mantidimaging.gui.windows.main.model.saver.image_save")
+    def test_save_image_as_single_file_stack(self, save_mock: mock.MagicMock):
+        images_id, images_mock = self._add_mock_image()
+        images_mock.filenames = original_filenames = ["a.tif", "b.tif"]
+        progress = mock.Mock()
+        save_mock.return_value = ["output/prefix.tiff"]
+
+        self.model.do_images_saving(images_id, "output", "prefix", "bigtiff", True, "float32", progress, "zstd")
+
+        save_mock.assert_called_once_with(images_mock,
+                                          output_dir="output",
+                                          name_prefix="prefix",
+                                          overwrite_all=True,
+                                          out_format="bigtiff",
+                                          pixel_depth="float32",
+                                          progress=progress,
+                                          compression="zstd")
+        self.assertListEqual(images_mock.filenames, original_filenames)
+
     @mock.patch("mantidimaging.gui.windows.main.model.saver.image_save")
     def test_image_save_when_image_not_found(self, save_mock: mock.MagicMock):
         with self.assertRaises(RuntimeError):
@@ -495,5 +515,7 @@ class MainWindowModelTest(unittest.TestCase):
         sample_name = "sample-name"
         save_as_float = True
 
-        self.model.do_nexus_saving(sd.id, path, sample_name, save_as_float)
-        nexus_save.assert_called_once_with(sd, path, sample_name, save_as_float)
+        progress = mock.Mock()
+
+        self.model.do_nexus_saving(sd.id, path, sample_name, save_as_float, "lzf", progress)
+        nexus_save.assert_called_once_with(sd, path, sample_name, save_as_float, "lzf", progress)
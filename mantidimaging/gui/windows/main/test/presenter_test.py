@@ -192,14 +192,35 @@ class MainWindowPresenterTest(unittest.TestCase):
         self.presenter.wizard_action_show_reconstruction()
         self.view.show_recon_window.assert_called_once()
 
+    @mock.patch("mantidimaging.gui.windows.main.presenter.start_async_task_view")
+    def test_load_nexus_file(self, start_async_mock: mock.Mock):
+        self.view.nexus_load_dialog = mock.Mock()
+
+        self.presenter.load_nexus_file()
+
+        nexus_load_presenter = self.view.nexus_load_dialog.presenter
+        start_async_mock.assert_called_once_with(self.view, nexus_load_presenter.get_dataset,
+                                                 self.presenter._on_nexus_load_done,
+                                                 nexus_load_presenter.get_load_parameters.return_value)
+
     @mock.patch("mantidimaging.gui.windows.main.presenter.MainWindowPresenter.add_alternative_180_if_required")
     def test_nexus_load_success_calls_show_information(self, _):
-        self.view.nexus_load_dialog = mock.Mock()
-        data_title = "data tile"
-        self.view.nexus_load_dialog.presenter.get_dataset.return_value = self.dataset, data_title
+        task = TaskWorkerThread()
+        task.result = self.dataset, "data tile"
         self.presenter.create_dataset_stack_visualisers = mock.Mock()
-        self.presenter.load_nexus_file()
+
+        self.presenter._on_nexus_load_done(task)
+
         self.presenter.create_dataset_stack_visualisers.assert_called_once_with(self.dataset)
+        self.view.model_changed.emit.assert_called_once()
+        self.assertIsNone(task.result)
+
+    def test_failed_attempt_to_load_nexus_shows_error(self):
+        task = TaskWorkerThread()
+        task.error = RuntimeError("Unable to read NeXus data from file.nxs")
+
+        self.assertRaisesRegex(RuntimeError, "Unable to read NeXus data", self.presenter._on_nexus_load_done, task)
+        self.view.model_changed.emit.assert_not_called()
 
     def test_get_stack_widget_by_name_success(self):
         stack_window = mock.Mock()
@@ -321,6 +342,15 @@ class MainWindowPresenterTest(unittest.TestCase):
         self.presenter.remove_item_from_tree_view.assert_called_once_with(id_to_remove)
         self.view.model_changed.emit.assert_called_once()
 
+    def test_delete_stacks_discards_their_snapshots(self):
+        ids_to_remove = ["sample-to-remove", "proj_180_to_remove"]
+        self.model.remove_container = mock.Mock(return_value=ids_to_remove)
+        self.presenter.remove_item_from_tree_view = mock.Mock()
+
+        self.presenter._delete_container(ids_to_remove[0])
+
+        self.view.filters.presenter.snapshots.discard.assert_has_calls([call(stack_id) for stack_id in ids_to_remove])
+
     def test_delete_sample_stack_with_180(self):
         ids_to_remove = ["sample-to-remove", "proj_180_to_remove"]
         self.model.remove_container = mock.Mock(return_value=ids_to_remove)
@@ -552,17 +582,17 @@ class MainWindowPresenterTest(unittest.TestCase):
         nexus_save_dialog_mock.sample_name.return_value = sample_name = "sample-name"
         nexus_save_dialog_mock.selected_dataset = dataset_id = "dataset-id"
         nexus_save_dialog_mock.save_as_float = save_as_float = False
+        nexus_save_dialog_mock.compression = compression = "gzip"
 
         self.presenter.notify(Notification.NEXUS_SAVE)
-        start_async_mock.assert_called_once_with(self.presenter.view,
-                                                 self.model.do_nexus_saving,
-                                                 self.presenter._on_save_done, {
-                                                     'dataset_id': dataset_id,
-                                                     'path': save_path,
-                                                     'sample_name': sample_name,
-                                                     'save_as_float': save_as_float
-                                                 },
-                                                 busy=True)
+        start_async_mock.assert_called_once_with(
+            self.presenter.view, self.model.do_nexus_saving, self.presenter._on_save_done, {
+                'dataset_id': dataset_id,
+                'path': save_path,
+                'sample_name': sample_name,
+                'save_as_float': save_as_float,
+                'compression': compression
+            })
 
     def test_get_dataset(self):
         test_ds = Dataset(sample=generate_images())
@@ -5,16 +5,17 @@ import enum
 import traceback
 from enum import auto, Enum
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import h5py
 import numpy as np
 
 from mantidimaging.core.data import ImageStack
 from mantidimaging.core.data.dataset import Dataset
+from mantidimaging.core.io.loader.nexus_loader import image_slabs, read_images
 from mantidimaging.core.io.utility import NEXUS_PROCESSED_DATA_PATH
-from mantidimaging.core.parallel import utility as pu
 from mantidimaging.core.utility.data_containers import ProjectionAngles
+from mantidimaging.core.utility.progress_reporting import Progress
 
 if TYPE_CHECKING:
     from mantidimaging.gui.windows.nexus_load_dialog.view import NexusLoadDialog  # pragma: no cover
@@ -58,19 +59,23 @@ class NexusLoadPresenter:
     def __init__(self, view: NexusLoadDialog):
         self.view = view
         self.nexus_file = None
+        self.file_path = ""
         self.tomo_entry = None
         self.data = None
+        self.data_path = ""
+        self.data_shape: tuple[int, ...] = ()
         self.tomo_path = ""
         self.image_key_dataset: np.ndarray | None = None
         self.rotation_angles: np.ndarray | None = None
         self.title = ""
         self.recon_data: list[np.ndarray] = []
 
-        self.sample_array: np.ndarray | None = None
-        self.dark_before_array: np.ndarray | None = None
-        self.flat_before_array: np.ndarray | None = None
-        self.flat_after_array: np.ndarray | None = None
-        self.dark_after_array: np.ndarray | None = None
+        # Indices into the image data for each type of image. The images are only read when the dataset is created.
+        self.sample_indices: np.ndarray | None = None
+        self.dark_before_indices: np.ndarray | None = None
+        self.flat_before_indices: np.ndarray | None = None
+        self.flat_after_indices: np.ndarray | None = None
+        self.dark_after_indices: np.ndarray | None = None
 
     def notify(self, n: Notification):
         try:
@@ -86,6 +91,7 @@ class NexusLoadPresenter:
         file_path = self.view.filePathLineEdit.text()
         try:
             with h5py.File(file_path, "r") as self.nexus_file:
+                self.file_path = file_path
                 self.tomo_entry = self._look_for_nxtomo_entry()
                 if self.tomo_entry is None:
                     return
@@ -93,6 +99,8 @@ class NexusLoadPresenter:
                 self.data = self._look_for_image_data_and_update_view()
                 if self.data is None:
                     return
+                self.data_path = self.data.name
+                self.data_shape = self.data.shape
 
                 self.image_key_dataset = self._look_for_tomo_data_and_update_view(IMAGE_KEY_PATH, 0)
                 if self.image_key_dataset is None:
@@ -244,36 +252,38 @@ class NexusLoadPresenter:
         """
         Looks for the projection and dark/flat before/after images and update the information on the view.
         """
-        self.sample_array = self._get_images(ImageKeys.Projections)
-        self.view.set_images_found(0, self.sample_array.size != 0, self.sample_array.shape)
-        if self.sample_array.size == 0:
+        self.sample_indices = self._get_image_indices(ImageKeys.Projections)
+        self.view.set_images_found(0, self.sample_indices.size != 0, self._images_shape(self.sample_indices))
+        if self.sample_indices.size == 0:
             self._missing_data_error("projection images")
             self.view.disable_ok_button()
             return
-        self.view.set_projections_increment(self.sample_array.shape[0])
+        self.view.set_projections_increment(self.sample_indices.size)
 
-        self.flat_before_array = self._get_images(ImageKeys.FlatField, True)
-        self.view.set_images_found(1, self.flat_before_array.size != 0, self.flat_before_array.shape)
+        self.flat_before_indices = self._get_image_indices(ImageKeys.FlatField, True)
+        self.view.set_images_found(1, self.flat_before_indices.size != 0, self._images_shape(self.flat_before_indices))
 
-        self.flat_after_array = self._get_images(ImageKeys.FlatField, False)
-        self.view.set_images_found(2, self.flat_after_array.size != 0, self.flat_after_array.shape)
+        self.flat_after_indices = self._get_image_indices(ImageKeys.FlatField, False)
+        self.view.set_images_found(2, self.flat_after_indices.size != 0, self._images_shape(self.flat_after_indices))
 
-        self.dark_before_array = self._get_images(ImageKeys.DarkField, True)
-        self.view.set_images_found(3, self.dark_before_array.size != 0, self.dark_before_array.shape)
+        self.dark_before_indices = self._get_image_indices(ImageKeys.DarkField, True)
+        self.view.set_images_found(3, self.dark_before_indices.size != 0, self._images_shape(self.dark_before_indices))
 
-        self.dark_after_array = self._get_images(ImageKeys.DarkField, False)
-        self.view.set_images_found(4, self.dark_after_array.size != 0, self.dark_after_array.shape)
+        self.dark_after_indices = self._get_image_indices(ImageKeys.DarkField, False)
+        self.view.set_images_found(4, self.dark_after_indices.size != 0, self._images_shape(self.dark_after_indices))
 
-    def _get_images(self, image_key_number: ImageKeys, before: bool | None = None) -> np.ndarray:
+    def _images_shape(self, indices: np.ndarray) -> tuple[int, ...]:
+        return indices.size, *self.data_shape[1:]
+
+    def _get_image_indices(self, image_key_number: ImageKeys, before: bool | None = None) -> np.ndarray:
         """
-        Retrieve images from the data based on an image key number.
+        Find the images in the data that have an image key number.
         :param image_key_number: The image key number.
         :param before: True if the function should return before images, False if the function should return after
                        images. Ignored when getting projection images.
-        :return: The set of images that correspond with a given image key.
+        :return: The indices of the images that correspond with a given image key.
         """
         assert self.image_key_dataset is not None and self.image_key_dataset.size is not None
-        assert self.data is not None
         if image_key_number is ImageKeys.Projections:
             indices = self.image_key_dataset[...] == image_key_number.value
         else:
@@ -282,8 +292,7 @@ class NexusLoadPresenter:
             else:
                 indices = self.image_key_dataset[:] == image_key_number.value
                 indices[:self.image_key_dataset.size // 2] = False
-        # Shouldn't have to use numpy.where but h5py doesn't allow indexing with bool arrays currently
-        return self.data[np.where(indices)]
+        return np.flatnonzero(indices)
 
     def _find_data_title(self) -> str:
         """
@@ -297,79 +306,140 @@ class NexusLoadPresenter:
             logger.info("A valid title couldn't be found. Using 'NeXus Data' instead.")
             return "NeXus Data"
 
-    def get_dataset(self) -> tuple[Dataset, str]:
+    def get_load_parameters(self) -> dict[str, Any]:
+        """
+        Read the choices made in the dialog. This is done on the GUI thread before the images are read on another one,
+        so that the widgets are not touched off the GUI thread and changing them does not affect a running load.
+        :return: The keyword arguments for get_dataset.
+        """
+        projections_slice = slice(self.view.start_widget.value(), self.view.stop_widget.value(),
+                                  self.view.step_widget.value())
+        return {
+            'images_to_read': self._images_to_read(projections_slice),
+            'projections_slice': projections_slice,
+            'pixel_size': int(self.view.pixelSizeSpinBox.value()),
+            'pixel_depth': self.view.pixelDepthComboBox.currentText(),
+        }
+
+    def get_dataset(self,
+                    images_to_read: dict[str, np.ndarray],
+                    projections_slice: slice,
+                    pixel_size: int,
+                    pixel_depth: str,
+                    progress: Progress | None = None) -> tuple[Dataset, str]:
         """
-        Create a LoadingDataset and title using the arrays that have been retrieved from the NeXus file.
+        Create a LoadingDataset and title by reading the images that were found in the NeXus file.
+        :param images_to_read: The indices of the images to read for each image type.
+        :param projections_slice: The range of projections to read.
+        :param pixel_size: The pixel size of the sample images.
+        :param pixel_depth: The dtype to read the images as.
+        :param progress: Progress reported as the images are read, with a stage for each image type.
         :return: A tuple containing the Dataset and the data title string.
         """
-        sample_images = self._create_sample_images()
-        sample_images.name = self.title
-        assert self.flat_before_array is not None and self.flat_after_array is not None
-        assert self.dark_before_array is not None and self.dark_after_array is not None
-        ds = Dataset(sample=sample_images,
-                     flat_before=self._create_images_if_required(self.flat_before_array, "Flat Before",
-                                                                 ImageKeys.FlatField.value),
-                     flat_after=self._create_images_if_required(self.flat_after_array, "Flat After",
-                                                                ImageKeys.FlatField.value),
-                     dark_before=self._create_images_if_required(self.dark_before_array, "Dark Before",
-                                                                 ImageKeys.DarkField.value),
-                     dark_after=self._create_images_if_required(self.dark_after_array, "Dark After",
-                                                                ImageKeys.DarkField.value),
-                     name=self.title)
+        try:
+            with h5py.File(self.file_path, "r") as nexus_file:
+                data = nexus_file[self.data_path]
+                num_slabs = sum(len(image_slabs(data, indices)) for indices in images_to_read.values())
+                progress = Progress.ensure_instance(progress, num_steps=num_slabs, task_name="Loading NeXus data")
+                with progress:
+                    sample_images = self._create_sample_images(data, images_to_read["Projections"],
+                                                               projections_slice, pixel_size, pixel_depth, progress)
+                    sample_images.name = self.title
+                    ds = Dataset(sample=sample_images,
+                                 flat_before=self._create_images_if_required(data, images_to_read, "Flat Before",
+                                                                             ImageKeys.FlatField.value, pixel_depth,
+                                                                             progress),
+                                 flat_after=self._create_images_if_required(data, images_to_read, "Flat After",
+                                                                            ImageKeys.FlatField.value, pixel_depth,
+                                                                            progress),
+                                 dark_before=self._create_images_if_required(data, images_to_read, "Dark Before",
+                                                                             ImageKeys.DarkField.value, pixel_depth,
+                                                                             progress),
+                                 dark_after=self._create_images_if_required(data, images_to_read, "Dark After",
+                                                                            ImageKeys.DarkField.value, pixel_depth,
+                                                                            progress),
+                                 name=self.title)
+        except OSError as err:
+            unable_message = f"Unable to read NeXus data from {self.file_path}"
+            logger.error(unable_message)
+            raise RuntimeError(unable_message) from err
 
         self._add_recons_to_dataset(ds)
 
         return ds, self.title
 
-    def _create_sample_images(self):
+    def _images_to_read(self, projections_slice: slice) -> dict[str, np.ndarray]:
+        """
+        Find the images of each type that will be read, which are the selected range of projections and the flats and
+        darks that were found and that the user checked the "Use?" checkbox for.
+        :param projections_slice: The range of projections to read.
+        :return: A dictionary of the image type names and the indices of their images in the NeXus data.
+        """
+        assert self.sample_indices is not None
+        assert self.flat_before_indices is not None and self.flat_after_indices is not None
+        assert self.dark_before_indices is not None and self.dark_after_indices is not None
+        images_to_read = {"Projections": self.sample_indices[projections_slice]}
+        for name, indices in (("Flat Before", self.flat_before_indices), ("Flat After", self.flat_after_indices),
+                              ("Dark Before", self.dark_before_indices), ("Dark After", self.dark_after_indices)):
+            if indices.size != 0 and self.view.checkboxes[name].isChecked():
+                images_to_read[name] = indices
+        return images_to_read
+
+    def _create_sample_images(self, data: h5py.Dataset, indices: np.ndarray, projections_slice: slice, pixel_size: int,
+                              pixel_depth: str, progress: Progress) -> ImageStack:
         """
         Creates the sample ImageStack object.
+        :param data: The image data in the NeXus file.
+        :param indices: The indices of the projections to read.
+        :param projections_slice: The range of projections to read.
+        :param pixel_size: The pixel size of the sample images.
+        :param pixel_depth: The dtype to read the images as.
+        :param progress: Progress reported as the images are read.
         :return: An ImageStack object containing projections. If given, projection angles, pixel size, and 180deg are
             also set.
         """
-        assert self.sample_array is not None
-
-        # Create sample array and ImageStack object
-        self.sample_array = self.sample_array[self.view.start_widget.value():self.view.stop_widget.value():self.view.
-                                              step_widget.value()]
-        sample_images = self._create_images(self.sample_array, "Projections")
+        sample_images = self._create_images(data, indices, "Projections", pixel_depth, progress)
 
         # Set attributes
-        sample_images.pixel_size = int(self.view.pixelSizeSpinBox.value())
+        sample_images.pixel_size = pixel_size
         projection_angles = self._read_rotation_angles(ImageKeys.Projections.value)
         if projection_angles is not None:
-            sample_images.set_projection_angles(
-                ProjectionAngles(projection_angles[self.view.start_widget.value():self.view.stop_widget.value():self.
-                                                   view.step_widget.value()]))
+            sample_images.set_projection_angles(ProjectionAngles(projection_angles[projections_slice]))
         return sample_images
 
-    def _create_images(self, data_array: np.ndarray, name: str) -> ImageStack:
+    def _create_images(self, data: h5py.Dataset, indices: np.ndarray, name: str, pixel_depth: str,
+                       progress: Progress) -> ImageStack:
         """
-        Use a data array to create an ImageStack object.
-        :param data_array: The images array obtained from the NeXus file.
+        Read images from the NeXus file straight into shared memory to create an ImageStack object.
+        :param data: The image data in the NeXus file.
+        :param indices: The indices of the images to read.
         :param name: The name of the image dataset.
+        :param pixel_depth: The dtype to read the images as.
+        :param progress: Progress reported as the images are read, as a stage named after the images.
         :return: An ImageStack object.
         """
-        data = pu.create_array(data_array.shape, self.view.pixelDepthComboBox.currentText())
-        data.array[:] = data_array
-        return ImageStack(data, [f"{name} {self.title}"])
+        images = read_images(data, indices, pixel_depth, progress, stage=name)
+        return ImageStack(images, [f"{name} {self.title}"])
 
-    def _create_images_if_required(self, data_array: np.ndarray, name: str, image_key: int) -> ImageStack | None:
+    def _create_images_if_required(self, data: h5py.Dataset, images_to_read: dict[str, np.ndarray], name: str,
+                                   image_key: int, pixel_depth: str, progress: Progress) -> ImageStack | None:
         """
         Create the ImageStack objects if the corresponding data was found in the NeXus file, and the user checked the
         "Use?" checkbox.
-        :param data_array: The images data array.
+        :param data: The image data in the NeXus file.
+        :param images_to_read: The indices of the images to read for each image type.
         :param name: The name of the images.
         :param image_key: The image key index for the image type.
+        :param pixel_depth: The dtype to read the images as.
+        :param progress: Progress reported as the images are read.
         :return: An ImageStack object or None.
         """
-        if data_array.size == 0 or not self.view.checkboxes[name].isChecked():
+        if name not in images_to_read:
             return None
-        image_stack = self._create_images(data_array, name)
-        if image_stack is not None:
-            projection_angles = self._read_rotation_angles(image_key, "Before" in name)
-            if projection_angles is not None:
-                image_stack.set_projection_angles(ProjectionAngles(projection_angles))
+        image_stack = self._create_images(data, images_to_read[name], name, pixel_depth, progress)
+        projection_angles = self._read_rotation_angles(image_key, "Before" in name)
+        if projection_angles is not None:
+            image_stack.set_projection_angles(ProjectionAngles(projection_angles))
         return image_stack
 
     def _add_recons_to_dataset(self, ds: Dataset) -> None:
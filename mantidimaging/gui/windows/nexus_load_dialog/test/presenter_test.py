@@ -13,6 +13,7 @@ from mantidimaging.core.io.saver import NEXUS_PROCESSED_DATA_PATH
 from mantidimaging.test_helpers.unit_test_helper import generate_images, gen_img_numpy_rand
 
 from mantidimaging.core.data.dataset import Dataset
+from mantidimaging.core.utility.progress_reporting import Progress
 from mantidimaging.gui.windows.nexus_load_dialog.presenter import _missing_data_message, TOMO_ENTRY, DATA_PATH, \
     IMAGE_KEY_PATH, NexusLoadPresenter, ROTATION_ANGLE_PATH
 from mantidimaging.gui.windows.nexus_load_dialog.presenter import logger as nexus_logger
@@ -72,12 +73,16 @@ class NexusLoaderTest(unittest.TestCase):
 
         self.nexus_load_patcher = mock.patch("mantidimaging.gui.windows.nexus_load_dialog.presenter.h5py.File")
         self.nexus_load_mock = self.nexus_load_patcher.start()
-        self.nexus_load_mock.return_value = self.nexus
+        # The file is opened again to read the images, so leaving the with block must not close the in-memory file
+        self.nexus_load_mock.return_value.__enter__.return_value = self.nexus
 
     def tearDown(self) -> None:
         self.nexus.close()
         self.nexus_load_patcher.stop()
 
+    def _get_dataset(self, progress: Progress | None = None) -> tuple[Dataset, str]:
+        return self.nexus_loader.get_dataset(**self.nexus_loader.get_load_parameters(), progress=progress)
+
     def replace_values_in_image_key(self, name: str, new_value: int):
         """
         Changes values in the image key.
@@ -156,14 +161,14 @@ class NexusLoaderTest(unittest.TestCase):
 
     def test_complete_file_returns_expected_dataset_and_title(self):
         self.nexus_loader.scan_nexus_file()
-        dataset, title = self.nexus_loader.get_dataset()
+        dataset, title = self._get_dataset()
         self.assertIsInstance(dataset, Dataset)
         self.assertEqual(title, self.title)
         self.assertEqual(dataset.sample.pixel_size, self.expected_pixel_size)
 
     def test_dataset_arrays_match_image_key(self):
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         np.testing.assert_array_almost_equal(dataset.flat_before.data, self.flat_before)
         np.testing.assert_array_almost_equal(dataset.dark_before.data, self.dark_before)
         np.testing.assert_array_almost_equal(dataset.sample.data, self.sample)
@@ -173,28 +178,28 @@ class NexusLoaderTest(unittest.TestCase):
     def test_no_flat_before_data(self):
         self.replace_values_in_image_key("Flat Before", 5)
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.flat_before)
         self.view.set_images_found.assert_any_call(1, False, (0, 10, 10))
 
     def test_no_dark_before_data(self):
         self.replace_values_in_image_key("Dark Before", 5)
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.dark_before)
         self.view.set_images_found.assert_any_call(3, False, (0, 10, 10))
 
     def test_no_flat_after_data(self):
         self.replace_values_in_image_key("Flat After", 5)
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.flat_after)
         self.view.set_images_found.assert_any_call(2, False, (0, 10, 10))
 
     def test_no_dark_after_data(self):
         self.replace_values_in_image_key("Dark After", 5)
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.dark_after)
         self.view.set_images_found.assert_any_call(4, False, (0, 10, 10))
 
@@ -211,25 +216,25 @@ class NexusLoaderTest(unittest.TestCase):
     def test_use_flat_before_data_is_false(self):
         self.view.checkboxes["Flat Before"].isChecked.return_value = False
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.flat_before)
 
     def test_use_dark_before_data_is_false(self):
         self.view.checkboxes["Dark Before"].isChecked.return_value = False
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.dark_before)
 
     def test_use_flat_after_data_is_false(self):
         self.view.checkboxes["Flat After"].isChecked.return_value = False
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.flat_after)
 
     def test_use_dark_after_data_is_false(self):
         self.view.checkboxes["Dark After"].isChecked.return_value = False
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertIsNone(dataset.dark_after)
 
     def test_dataset_has_expected_pixel_depth(self):
@@ -238,7 +243,7 @@ class NexusLoaderTest(unittest.TestCase):
         for depth in depths:
             self.view.pixelDepthComboBox.currentText.return_value = depth
             with self.subTest(depth=depth):
-                dataset = self.nexus_loader.get_dataset()[0]
+                dataset = self._get_dataset()[0]
                 self.assertEqual(dataset.sample.dtype, np.dtype(depth))
                 self.assertEqual(dataset.flat_before.dtype, np.dtype(depth))
                 self.assertEqual(dataset.dark_before.dtype, np.dtype(depth))
@@ -250,11 +255,11 @@ class NexusLoaderTest(unittest.TestCase):
         with self.assertLogs(nexus_logger, level="INFO") as log_mock:
             self.nexus_loader.scan_nexus_file()
         self.assertIn("A valid title couldn't be found. Using 'NeXus Data' instead.", log_mock.output[0])
-        assert self.nexus_loader.get_dataset()[1] == "NeXus Data"
+        assert self._get_dataset()[1] == "NeXus Data"
 
     def test_image_names(self):
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         assert dataset.sample.filenames[0] == "Projections " + self.title
         assert dataset.flat_before.filenames[0] == "Flat Before " + self.title
         assert dataset.dark_before.filenames[0] == "Dark Before " + self.title
@@ -272,9 +277,33 @@ class NexusLoaderTest(unittest.TestCase):
     def test_step_load(self):
         self.view.step_widget.value.return_value = 2
         self.nexus_loader.scan_nexus_file()
-        dataset = self.nexus_loader.get_dataset()[0]
+        dataset = self._get_dataset()[0]
         self.assertEqual(dataset.sample.data.shape[0], 1)
 
+    def test_get_load_parameters_reads_the_dialog(self):
+        self.view.step_widget.value.return_value = 2
+        self.view.checkboxes["Dark After"].isChecked.return_value = False
+        self.nexus_loader.scan_nexus_file()
+
+        parameters = self.nexus_loader.get_load_parameters()
+
+        self.assertEqual(parameters["projections_slice"], slice(0, 2, 2))
+        self.assertEqual(parameters["pixel_size"], self.expected_pixel_size)
+        self.assertEqual(parameters["pixel_depth"], self.expected_pixel_depth)
+        self.assertEqual(list(parameters["images_to_read"]),
+                         ["Projections", "Flat Before", "Flat After", "Dark Before"])
+        np.testing.assert_array_equal(parameters["images_to_read"]["Projections"], [4])
+
+    def test_get_dataset_does_not_read_the_dialog(self):
+        self.nexus_loader.scan_nexus_file()
+        parameters = self.nexus_loader.get_load_parameters()
+        self.view.reset_mock()
+
+        dataset = self.nexus_loader.get_dataset(**parameters)[0]
+
+        self.assertEqual(self.view.method_calls, [])
+        self.assertEqual(dataset.sample.data.shape[0], 2)
+
     def test_load_invalid_nexus_file(self):
         self.nexus_load_mock.side_effect = OSError
         unable_message = f"Unable to read NeXus data from {self.file_path}"
@@ -284,6 +313,26 @@ class NexusLoaderTest(unittest.TestCase):
         self.view.show_data_error.assert_called_once_with(unable_message)
         self.view.disable_ok_button.assert_called_once()
 
+    def test_get_dataset_read_error_is_reported(self):
+        self.nexus_loader.scan_nexus_file()
+        self.nexus_load_mock.side_effect = OSError
+        unable_message = f"Unable to read NeXus data from {self.file_path}"
+        with self.assertLogs(nexus_logger, level="ERROR") as log_mock:
+            with self.assertRaisesRegex(RuntimeError, unable_message):
+                self._get_dataset()
+        self.assertIn(unable_message, log_mock.output[0])
+
+    def test_get_dataset_reports_a_progress_stage_for_each_image_type(self):
+        self.nexus_loader.scan_nexus_file()
+        progress = Progress()
+
+        self._get_dataset(progress)
+
+        stages = [entry.msg.split(" slab")[0] for entry in progress.progress_history if " slab" in entry.msg]
+        self.assertEqual(stages, self.image_types)
+        self.assertEqual(progress.progress_history[-2].step, len(self.image_types))
+        self.assertTrue(progress.is_completed())
+
     def test_rotation_angles_is_none(self):
         del self.tomo_entry[ROTATION_ANGLE_PATH]
         with self.assertLogs(nexus_logger, level="WARNING") as log_mock:
@@ -316,7 +365,7 @@ class NexusLoaderTest(unittest.TestCase):
         angle_dataset.attrs.create("units", "radians")
 
         self.nexus_loader.scan_nexus_file()
-        ds, _ = self.nexus_loader.get_dataset()
+        ds, _ = self._get_dataset()
 
         assert np.array_equal(ds.flat_before.projection_angles().value, [0, 1])
         assert np.array_equal(ds.dark_before.projection_angles().value, [2, 3])
@@ -330,7 +379,7 @@ class NexusLoaderTest(unittest.TestCase):
         angle_dataset.attrs.create("units", "radians")
 
         self.nexus_loader.scan_nexus_file()
-        ds, _ = self.nexus_loader.get_dataset()
+        ds, _ = self._get_dataset()
 
         self.assertIsNone(ds.flat_before._projection_angles)
         self.assertIsNone(ds.dark_before._projection_angles)
@@ -347,7 +396,7 @@ class NexusLoaderTest(unittest.TestCase):
         angle_dataset.attrs.create("units", "radians")
 
         self.nexus_loader.scan_nexus_file()
-        ds, _ = self.nexus_loader.get_dataset()
+        ds, _ = self._get_dataset()
 
         self.assertIsNone(ds.flat_before._projection_angles)
         self.assertIsNone(ds.dark_before._projection_angles)
@@ -374,7 +423,7 @@ class NexusLoaderTest(unittest.TestCase):
     def test_get_dataset_creates_recon_list(self):
         self.nexus_loader.recon_data = [generate_images(), generate_images()]
         self.nexus_loader.scan_nexus_file()
-        ds, _ = self.nexus_loader.get_dataset()
+        ds, _ = self._get_dataset()
         self.assertEqual(len(ds.recons), 2)
 
     def test_look_for_image_data_and_update_view_with_nonprocessed_file(self):
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from PyQt5.QtWidgets import QFormLayout  # noqa: F401  # pragma: no cover
     from mantidimaging.gui.windows.operations import FiltersWindowPresenter  # pragma: no cover
     from mantidimaging.core.data import ImageStack
+    from mantidimaging.core.data.snapshot import SnapshotStore
     from mantidimaging.core.operations.loader import BaseFilterClass
 
 
@@ -107,25 +108,41 @@ class FiltersWindowModel:
         self.selected_filter = self.filters[filter_idx]
         self.filter_widget_kwargs = filter_widget_kwargs
 
-    def apply_to_stacks(self, stacks: list[ImageStack], progress=None):
+    def apply_to_stacks(self, stacks: list[ImageStack], progress=None, snapshots: SnapshotStore | None = None):
         """
         Applies the selected filter to a given image stack.
 
         It gets the image reference out of the StackVisualiserView and forwards
         it to the function that actually processes the images.
+
+        :param snapshots: If given, each stack is snapshotted into it before the filter is applied
         """
         for stack in stacks:
+            if snapshots is not None:
+                snapshots.take(stack, progress)
             self.apply_to_images(stack, progress=progress)
 
-    def apply_to_images(self, images: ImageStack, progress=None) -> None:
+    def _execute_func(self) -> partial:
         input_kwarg_widgets = self.filter_widget_kwargs.copy()
 
         # Validate required kwargs are supplied so pre-processing does not happen unnecessarily
         if not self.selected_filter.validate_execute_kwargs(input_kwarg_widgets):
             raise ValueError("Not all required parameters specified")
 
+        return self.selected_filter.execute_wrapper(**input_kwarg_widgets)
+
+    def preview_func(self) -> partial | None:
+        """
+        The selected filter with the parameter values currently in its widgets, so it can be run on preview images
+        away from the GUI thread. None if the filter has no parameter widgets.
+        """
+        if not self.filter_widget_kwargs:
+            return None
+        return self._execute_func()
+
+    def apply_to_images(self, images: ImageStack, progress=None) -> None:
         # Run filter
-        exec_func = self.selected_filter.execute_wrapper(**input_kwarg_widgets)
+        exec_func = self._execute_func()
         exec_func.keywords["progress"] = progress
         exec_func(images)
         # store the executed filter in history if it executed successfully
@@ -135,16 +152,21 @@ class FiltersWindowModel:
             *exec_func.args,
             **exec_func.keywords)
 
-    def do_apply_filter(self, stacks: list[ImageStack], post_filter: Callable[[Any], None]):
+    def do_apply_filter(self,
+                        stacks: list[ImageStack],
+                        post_filter: Callable[[Any], None],
+                        snapshots: SnapshotStore | None = None):
         """
         Applies the selected filter to the selected stack.
+
+        :param snapshots: If given, the stacks are snapshotted into it in the task, before the filter is applied
         """
         if len(stacks) == 0:
             raise ValueError('No stack selected')
 
         # Get auto parameters
         # Generate sub-stack and run filter
-        apply_func = partial(self.apply_to_stacks, stacks)
+        apply_func = partial(self.apply_to_stacks, stacks, snapshots=snapshots)
         start_async_task_view(self.presenter.view, apply_func, post_filter)
 
     def do_apply_filter_sync(self, stacks: list[ImageStack], post_filter: Callable[[Any], None]):
@@ -12,17 +12,19 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 import numpy as np
-from PyQt5.QtWidgets import QApplication, QLineEdit
+from PyQt5.QtWidgets import QApplication, QDoubleSpinBox, QLineEdit
 
 from mantidimaging.core.data import ImageStack
+from mantidimaging.core.data.snapshot import SnapshotFrames, SnapshotStore
 from mantidimaging.core.operation_history.const import OPERATION_HISTORY, OPERATION_DISPLAY_NAME
+from mantidimaging.gui.dialogs.async_task import start_async_task_view
 from mantidimaging.gui.mvp_base import BasePresenter
 from mantidimaging.gui.utility import BlockQtSignals
-from mantidimaging.gui.utility.common import operation_in_progress
 from mantidimaging.gui.windows.stack_choice.presenter import StackChoicePresenter
 from mantidimaging.gui.widgets.dataset_selector import DatasetSelectorWidgetView
 
 from .model import FiltersWindowModel
+from .preview_cache import PreviewCache
 
 APPLY_TO_180_MSG = "Operations applied to the sample are also automatically applied to the " \
       "180 degree projection. Please avoid applying an operation unless you're" \
@@ -34,8 +36,11 @@ FLAT_FIELD_REGION = [-0.2, 1.2]
 
 CROP_COORDINATES = "Crop Coordinates"
 ROI_NORMALISATION = "ROI Normalisation"
+RESCALE = "Rescale"
 
 if TYPE_CHECKING:
+    from mantidimaging.core.data.stack_statistics import StackStatistics  # pragma: no cover
+    from mantidimaging.gui.dialogs.async_task import TaskWorkerThread  # pragma: no cover
     from mantidimaging.gui.windows.main import MainWindowView  # pragma: no cover
     from mantidimaging.gui.windows.operations import FiltersWindowView  # pragma: no cover
     from mantidimaging.gui.widgets.mi_mini_image_view.view import MIMiniImageView
@@ -103,13 +108,16 @@ class FiltersWindowPresenter(BasePresenter):
         self.model = FiltersWindowModel(self)
         self._main_window = main_window
 
-        self.original_images_stack: dict[UUID, ImageStack] = {}
+        self.snapshots = SnapshotStore()
+        self.preview_cache = PreviewCache()
         self.applying_to_all = False
         self.filter_is_running = False
 
         self.prev_apply_single_state = True
         self.prev_apply_all_state = True
 
+        self._rescale_range_widgets: tuple[QDoubleSpinBox, QDoubleSpinBox] | None = None
+
     @property
     def main_window(self) -> MainWindowView:
         return self._main_window
@@ -184,6 +192,7 @@ class FiltersWindowPresenter(BasePresenter):
 
     def do_register_active_filter(self):
         filter_name = self.view.get_selected_filter()
+        self._rescale_range_widgets = None
 
         # Get registration function for new filter
         register_func = self.model.filter_registration_func(filter_name)
@@ -194,6 +203,8 @@ class FiltersWindowPresenter(BasePresenter):
 
         if filter_name == CROP_COORDINATES or filter_name == ROI_NORMALISATION:
             self.init_roi_field(filter_widget_kwargs["roi_field"])
+        elif filter_name == RESCALE:
+            self.init_rescale_range(filter_widget_kwargs["min_input_widget"], filter_widget_kwargs["max_input_widget"])
 
         self.model.setup_filter(filter_name, filter_widget_kwargs)
         self.view.clear_notification_dialog()
@@ -221,10 +232,6 @@ class FiltersWindowPresenter(BasePresenter):
             if not self.view.ask_confirmation(REPEAT_FLAT_FIELDING_MSG):
                 return
 
-        if self.view.safeApply.isChecked():
-            with operation_in_progress("Safe Apply: Copying Data", "-------------------------------------", self.view):
-                self.original_images_stack = {self.stack.id: self.stack.copy()}
-
         # if is a 180degree stack and a user says no, cancel apply filter.
         if self.is_a_proj180deg(self.stack) and not self.view.ask_confirmation(APPLY_TO_180_MSG):
             return
@@ -238,19 +245,15 @@ class FiltersWindowPresenter(BasePresenter):
         if not confirmed:
             return
         stacks = self.main_window.get_all_stacks()
-        if self.view.safeApply.isChecked():
-            with operation_in_progress("Safe Apply: Copying Data", "-------------------------------------", self.view):
-                self.original_images_stack = {}
-                for stack in stacks:
-                    self.original_images_stack[stack.id] = stack.copy()
 
         if len(stacks) > 0:
             self.applying_to_all = True
         self._do_apply_filter(stacks)
 
     def _wait_for_stack_choice(self, new_stack: ImageStack, stack_uuid: UUID):
-        stack_choice = StackChoicePresenter(self.original_images_stack[stack_uuid], new_stack, self)
-        del self.original_images_stack[stack_uuid]
+        snapshot = self.snapshots.latest(stack_uuid)
+        assert snapshot is not None
+        stack_choice = StackChoicePresenter(SnapshotFrames(snapshot), new_stack, self)
         if self.model.show_negative_overlay():
             stack_choice.enable_nonpositive_check()
         stack_choice.show()
@@ -266,6 +269,8 @@ class FiltersWindowPresenter(BasePresenter):
         return any(stack_to_check is stack for stack in self.main_window.get_all_180_projections())
 
     def _post_filter(self, updated_stacks: list[ImageStack], task):
+        for stack in updated_stacks:
+            self.preview_cache.invalidate(stack.id)
         try:
             use_new_data = True
             negative_stacks = []
@@ -275,6 +280,8 @@ class FiltersWindowPresenter(BasePresenter):
                     # otherwise check with user which one to keep
                     if self.view.safeApply.isChecked():
                         use_new_data = self._wait_for_stack_choice(stack, stack.id)
+                        # The original data has been restored or rejected, so its snapshot is no longer needed
+                        self.snapshots.discard(stack.id)
                     # if the stack that was kept happened to have a proj180 stack - then apply the filter to that too
                     if stack.has_proj180deg() and use_new_data and not self.applying_to_all:
                         if self.model.selected_filter.allow_for_180_projection:
@@ -282,7 +289,12 @@ class FiltersWindowPresenter(BasePresenter):
                             # and running another async instance causes a race condition in the parallel module
                             # where the shared data can be removed in the middle of the operation of another operation
                             self._do_apply_filter_sync([stack.proj180deg])
-                if np.any(stack.data < 0):
+                else:
+                    # The filter failed or was cancelled part way through, so no operation was recorded for the
+                    # changes it had already made
+                    stack.mark_modified()
+                    self.snapshots.discard(stack.id)
+                if stack.statistics().negative_count > 0:
                     negative_stacks.append(stack)
 
             self.applying_to_all = False
@@ -317,7 +329,11 @@ class FiltersWindowPresenter(BasePresenter):
         self.prev_apply_all_state = self.view.applyToAllButton.isEnabled()
         # Disable the apply buttons
         self._set_apply_buttons_enabled(False, False)
-        self.model.do_apply_filter(apply_to, partial(self._post_filter, apply_to))
+        # Previews of the neighbouring slices should not be worked out while the stacks are being changed
+        self.preview_cache.cancel_pending(wait=True)
+        # Safe apply snapshots are taken in the task, so the GUI is not blocked while the stacks are written out
+        snapshots = self.snapshots if self.view.safeApply.isChecked() else None
+        self.model.do_apply_filter(apply_to, partial(self._post_filter, apply_to), snapshots)
 
     def _do_apply_filter_sync(self, apply_to):
         self.model.do_apply_filter_sync(apply_to, partial(self._post_filter, apply_to))
@@ -339,35 +355,31 @@ class FiltersWindowPresenter(BasePresenter):
             if is_flat_fielding:
                 self.view.previews.after_region = FLAT_FIELD_REGION
 
-        if not self.model.selected_filter.operate_on_sinograms:
-            subset = self.stack.slice_as_image_stack(self.model.preview_image_idx)
-            squeeze_axis = 0
-        else:
-            if self.stack.num_projections < 2:
-                self.show_error("This filter requires a stack with multiple projections", "")
-                self.view.clear_previews()
-                return
-            subset = self.stack.sino_as_image_stack(self.model.preview_image_idx)
-            squeeze_axis = 1
-
-        # Take copies for display to prevent issues when the shared memory is cleaned
-        before_image = np.copy(subset.data.squeeze(squeeze_axis))
+        sinograms = self.model.selected_filter.operate_on_sinograms
+        if sinograms and self.stack.num_projections < 2:
+            self.show_error("This filter requires a stack with multiple projections", "")
+            self.view.clear_previews()
+            return
 
+        preview_idx = self.model.preview_image_idx
         try:
-            if self.model.filter_widget_kwargs:
-                self.model.apply_to_images(subset)
+            filter_func = self.model.preview_func()
+            preview = self.preview_cache.get(self.stack, preview_idx, sinograms, filter_func)
         except Exception as e:
             msg = f"Error applying filter for preview: {e}"
             self.show_error(msg, traceback.format_exc())
 
             # Can't continue be need the before image drawn
+            before_image = self.preview_cache.get(self.stack, preview_idx, sinograms, None).before
             self._update_preview_image(before_image, self.view.preview_image_before)
             return
 
-        # Update image after first in order to prevent wrong histogram ranges being shared
-
-        filtered_image_data = np.copy(subset.data.squeeze(squeeze_axis))
+        # Work out the neighbouring slices while the user looks at this one, so scrolling through them is quick
+        neighbours = [i for i in (preview_idx + 1, preview_idx - 1) if 0 <= i <= self.max_preview_image_idx]
+        self.preview_cache.prefetch(self.stack, neighbours, sinograms, filter_func)
+        before_image, filtered_image_data = preview
 
+        # Update image after first in order to prevent wrong histogram ranges being shared
         if np.any(filtered_image_data < 0):
             self._show_preview_negative_values_error(self.model.preview_image_idx)
 
@@ -456,6 +468,46 @@ class FiltersWindowPresenter(BasePresenter):
         crop_string = ", ".join(["0", "0", str(y), str(x)])
         roi_field.setText(crop_string)
 
+    def init_rescale_range(self, min_input_widget: QDoubleSpinBox, max_input_widget: QDoubleSpinBox):
+        """
+        Sets the initial input range of the rescale widgets to the range of the data, from the statistics of the stack.
+        :param min_input_widget: The min input spin box widget.
+        :param max_input_widget: The max input spin box widget.
+        """
+        if self.stack is None:
+            return
+
+        self._rescale_range_widgets = (min_input_widget, max_input_widget)
+        statistics = self.stack.cached_statistics
+        if statistics is not None:
+            self._set_rescale_range(statistics)
+            return
+
+        # Scanning a large stack takes a while, so do it off the GUI thread and fill in the range when it finishes
+        on_complete = partial(self._on_rescale_statistics_done, self.stack, self.stack.generation,
+                              self._rescale_range_widgets)
+        start_async_task_view(self.view, self.stack.statistics, on_complete)
+
+    def _on_rescale_statistics_done(self, stack: ImageStack, generation: int,
+                                    widgets: tuple[QDoubleSpinBox, QDoubleSpinBox], task: TaskWorkerThread) -> None:
+        """
+        Fills in the rescale range once the statistics have been worked out, if the same stack and rescale widgets
+        are still selected.
+        """
+        if not task.was_successful():
+            return
+        if self.stack is not stack or stack.generation != generation or self._rescale_range_widgets is not widgets:
+            return
+        self._set_rescale_range(task.result)
+
+    def _set_rescale_range(self, statistics: StackStatistics) -> None:
+        if self._rescale_range_widgets is None:
+            return
+        min_input_widget, max_input_widget = self._rescale_range_widgets
+        if np.isfinite(statistics.min) and np.isfinite(statistics.max):
+            min_input_widget.setValue(statistics.min)
+            max_input_widget.setValue(statistics.max)
+
     def _show_negative_values_error(self, negative_stacks: list[ImageStack]):
         """
         Shows information on the view and in the log about negative values in the output.
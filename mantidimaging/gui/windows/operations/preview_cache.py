@@ -0,0 +1,205 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+from collections.abc import Hashable, Iterable
+
+import numpy as np
+
+from mantidimaging.core.data import ImageStack
+
+if TYPE_CHECKING:
+    from functools import partial
+
+# Memory the cached before and after images can use before the least recently used are dropped
+PREVIEW_CACHE_BYTES = 1024**3
+
+
+class Preview(NamedTuple):
+    before: np.ndarray
+    after: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return self.before.nbytes + (self.after.nbytes if self.after is not self.before else 0)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, ImageStack):
+        return value.id, value.generation
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    hash(value)
+    return value
+
+
+def preview_key(stack: ImageStack, index: int, sinograms: bool, filter_func: partial | None) -> Hashable | None:
+    """
+    Key for the preview of a slice of a stack with a filter and its parameters. None if one of the parameters can not
+    be used in a key, so the preview can not be cached.
+    """
+    if filter_func is None:
+        return stack.id, stack.generation, index, sinograms, None
+    try:
+        params = _freeze(filter_func.args), _freeze(filter_func.keywords)
+    except TypeError:
+        return None
+    return stack.id, stack.generation, index, sinograms, filter_func.func, params
+
+
+def compute_preview(stack: ImageStack, index: int, sinograms: bool, filter_func: partial | None) -> Preview:
+    """
+    Run the filter on a copy of a single projection or sinogram of the stack
+
+    :param stack: The stack to preview
+    :param index: Index of the projection, or of the sinogram if sinograms is True
+    :param sinograms: Run the filter on a sinogram rather than a projection
+    :param filter_func: The filter with its parameters, or None to leave the image unchanged
+    """
+    if not sinograms:
+        subset = stack.slice_as_image_stack(index)
+        squeeze_axis = 0
+    else:
+        subset = stack.sino_as_image_stack(index)
+        squeeze_axis = 1
+
+    # Take copies for display to prevent issues when the shared memory is cleaned
+    before = np.copy(subset.data.squeeze(squeeze_axis))
+    if filter_func is None:
+        return Preview(before, before)
+    filter_func(subset)
+    return Preview(before, np.copy(subset.data.squeeze(squeeze_axis)))
+
+
+class PreviewCache:
+    """
+    Least recently used cache of filter previews, limited by the memory used by the images.
+
+    Previews are run one at a time on a background thread, both those that are waited for and the neighbouring slices
+    that are worked out ahead of time, so that the filters never run concurrently with each other.
+    """
+
+    def __init__(self, budget_bytes: int = PREVIEW_CACHE_BYTES):
+        self.budget_bytes = budget_bytes
+        self._previews: OrderedDict[Hashable, Preview] = OrderedDict()
+        self._nbytes = 0
+        self._pending: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._previews)
+
+    def get(self, stack: ImageStack, index: int, sinograms: bool, filter_func: partial | None) -> Preview:
+        """
+        The preview of a slice, from the cache if it has already been worked out. Waits for it otherwise, dropping any
+        other previews that are queued so that it does not wait behind neighbours of earlier parameters.
+
+        :raises: Any error raised by the filter
+        """
+        key = preview_key(stack, index, sinograms, filter_func)
+        with self._lock:
+            if key in self._previews:
+                self._previews.move_to_end(key)
+                return self._previews[key]
+        self.cancel_pending(keep=key)
+        return self._submit(key, stack, index, sinograms, filter_func).result()
+
+    def prefetch(self, stack: ImageStack, indices: Iterable[int], sinograms: bool, filter_func: partial | None) -> None:
+        """
+        Work out the previews of some slices in the background, dropping any that are queued but have not started yet
+        """
+        self.cancel_pending()
+        for index in indices:
+            key = preview_key(stack, index, sinograms, filter_func)
+            if key is None:
+                return
+            with self._lock:
+                cached = key in self._previews
+            if not cached:
+                self._submit(key, stack, index, sinograms, filter_func)
+
+    def cancel_pending(self, wait: bool = False, keep: Hashable | None = None) -> None:
+        """
+        Drop the previews that are queued but have not started yet
+
+        :param wait: Also wait for one that is running to finish
+        :param keep: Key of a preview to leave queued
+        """
+        with self._lock:
+            pending = [future for key, future in self._pending.items() if keep is None or key != keep]
+        for future in pending:
+            future.cancel()
+        if wait:
+            futures.wait(pending)
+
+    def wait(self) -> None:
+        """
+        Wait for all of the queued and running previews to finish
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        futures.wait(pending)
+
+    def invalidate(self, stack_id: Any = None) -> None:
+        """
+        Drop the cached previews of a stack, or all of them if stack_id is None
+        """
+        with self._lock:
+            for key in [key for key in self._previews if stack_id is None or key[0] == stack_id]:
+                self._nbytes -= self._previews.pop(key).nbytes
+
+    def shutdown(self) -> None:
+        self.cancel_pending()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.invalidate()
+
+    def _submit(self, key: Hashable | None, stack: ImageStack, index: int, sinograms: bool,
+                filter_func: partial | None) -> Future:
+        with self._lock:
+            if key is not None and key in self._pending and not self._pending[key].cancelled():
+                return self._pending[key]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mi_preview")
+            future = self._executor.submit(self._compute, key, stack, index, sinograms, filter_func)
+            if key is not None:
+                self._pending[key] = future
+        if key is not None:
+            # Outside of the lock, as the callback is run straight away if the preview has already been worked out
+            future.add_done_callback(lambda f: self._discard_pending(key, f))
+        return future
+
+    def _discard_pending(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _compute(self, key: Hashable | None, stack: ImageStack, index: int, sinograms: bool,
+                 filter_func: partial | None) -> Preview:
+        preview = compute_preview(stack, index, sinograms, filter_func)
+        if key is not None:
+            self._store(key, preview)
+        return preview
+
+    def _store(self, key: Hashable, preview: Preview) -> None:
+        with self._lock:
+            if key in self._previews:
+                self._nbytes -= self._previews.pop(key).nbytes
+            self._previews[key] = preview
+            self._nbytes += preview.nbytes
+            while self._nbytes > self.budget_bytes and len(self._previews) > 1:
+                _, dropped = self._previews.popitem(last=False)
+                self._nbytes -= dropped.nbytes
@@ -134,6 +134,21 @@ class FiltersWindowModelTest(unittest.TestCase):
             [mock.call(mock_stacks[0], progress=mock_progress),
              mock.call(mock_stacks[1], progress=mock_progress)])
 
+    def test_apply_filter_to_stacks_snapshots_each_stack_first(self):
+        mock_stacks = [mock.Mock(), mock.Mock()]
+        mock_progress = mock.Mock()
+        calls = mock.Mock()
+        self.model.apply_to_images = calls.apply_to_images  # type: ignore
+
+        self.model.apply_to_stacks(mock_stacks, mock_progress, snapshots=calls.snapshots)
+
+        self.assertEqual(calls.mock_calls, [
+            mock.call.snapshots.take(mock_stacks[0], mock_progress),
+            mock.call.apply_to_images(mock_stacks[0], progress=mock_progress),
+            mock.call.snapshots.take(mock_stacks[1], mock_progress),
+            mock.call.apply_to_images(mock_stacks[1], progress=mock_progress)
+        ])
+
     def test_apply_filter_to_images(self):
         """
         When no 180deg projection is loaded the filter is only
@@ -155,6 +170,30 @@ class FiltersWindowModelTest(unittest.TestCase):
         selected_filter_mock.validate_execute_kwargs.assert_called_once()
         callback_mock.assert_called_once_with(images, progress=progress_mock)
 
+    def test_preview_func(self):
+        selected_filter_mock = mock.Mock()
+        selected_filter_mock.execute_wrapper.return_value = partial(mock.Mock(), size=3)
+        self.model.selected_filter = selected_filter_mock
+        self.model.filter_widget_kwargs = {"size_field": mock.Mock()}
+
+        preview_func = self.model.preview_func()
+
+        self.assertIs(preview_func, selected_filter_mock.execute_wrapper.return_value)
+        selected_filter_mock.execute_wrapper.assert_called_once_with(**self.model.filter_widget_kwargs)
+
+    def test_preview_func_without_parameters(self):
+        self.model.filter_widget_kwargs = {}
+
+        self.assertIsNone(self.model.preview_func())
+
+    def test_preview_func_validates_parameters(self):
+        self.model.selected_filter = mock.Mock()
+        self.model.selected_filter.validate_execute_kwargs.return_value = False
+        self.model.filter_widget_kwargs = {"size_field": mock.Mock()}
+
+        with self.assertRaisesRegex(ValueError, "Not all required parameters"):
+            self.model.preview_func()
+
     def test_get_filter_module_name(self):
         self.model.filters = mock.MagicMock()
 
@@ -2,6 +2,8 @@
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
 import logging
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -13,6 +15,7 @@ from unittest.mock import DEFAULT, Mock
 
 from parameterized import parameterized
 
+from mantidimaging.core.data.snapshot import SnapshotFrames, SnapshotStore
 from mantidimaging.core.operation_history.const import OPERATION_HISTORY, OPERATION_DISPLAY_NAME
 from mantidimaging.gui.windows.main import MainWindowView
 from mantidimaging.gui.windows.operations import FiltersWindowPresenter
@@ -29,12 +32,14 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.view = mock.MagicMock()
         self.presenter = FiltersWindowPresenter(self.view, self.main_window)
         self.presenter.model.filter_widget_kwargs = {"roi_field": None}
+        self.presenter.snapshots = mock.create_autospec(SnapshotStore, instance=True)
         self.view.presenter = self.presenter
         self.mock_stacks: list[ImageStack] = []
         for _ in range(2):
             mock_stack = mock.Mock()
             mock_stack.data = np.zeros([3, 3, 3])
             mock_stack.has_proj180deg = mock.Mock(return_value=True)
+            mock_stack.statistics.return_value.negative_count = 0
             self.mock_stacks.append(mock_stack)
 
     @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.filter_registration_func')
@@ -75,11 +80,11 @@ class FiltersWindowPresenterTest(unittest.TestCase):
 
         expected_apply_to = [stack]
         assert_called_once_with(apply_filter_mock, expected_apply_to,
-                                partial(self.presenter._post_filter, expected_apply_to))
+                                partial(self.presenter._post_filter, expected_apply_to), None)
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
     @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.do_apply_filter')
-    def test_apply_filter_to_all(self, apply_filter_mock: mock.Mock, _):
+    def test_apply_filter_to_all(self, apply_filter_mock: mock.Mock):
+        self.presenter.view.safeApply.isChecked.return_value = False
         self.view.ask_confirmation.return_value = False
         self.presenter.do_apply_filter_to_all()
 
@@ -94,7 +99,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
 
         self.presenter.do_apply_filter_to_all()
 
-        assert_called_once_with(apply_filter_mock, mock_stacks, partial(self.presenter._post_filter, mock_stacks))
+        assert_called_once_with(apply_filter_mock, mock_stacks, partial(self.presenter._post_filter, mock_stacks), None)
 
     @mock.patch.multiple('mantidimaging.gui.windows.operations.presenter.FiltersWindowPresenter',
                          do_update_previews=DEFAULT,
@@ -133,6 +138,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter._post_filter(self.mock_stacks[:1], mock_task)
 
         self.presenter.view.show_error_dialog.assert_called_once_with('Operation failed: 123')
+        self.mock_stacks[0].mark_modified.assert_called_once()
         do_update_previews.assert_called_once()
         self.presenter.view.filter_applied.emit.assert_called_once()
 
@@ -196,6 +202,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         mock_stack = mock.MagicMock()
         mock_stack.has_proj180deg.return_value = True
         mock_stack.data = np.arange(3)
+        mock_stack.statistics.return_value.negative_count = 0
         mock_stacks: list[ImageStack] = [mock_stack]
         mock_task = mock.MagicMock()
         mock_task.error = None
@@ -209,24 +216,24 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter.do_update_previews()
         self.view.clear_previews.assert_called_once()
 
-    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.apply_to_images')
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.preview_func')
     def test_update_previews_apply_throws_exception(self, apply_mock: mock.Mock):
-        apply_mock.side_effect = Exception
-        stack = mock.Mock()
+        apply_mock.return_value.side_effect = Exception
+        stack = mock.Mock(num_images=1)
         images = generate_images([1, 10, 10])
         stack.slice_as_image_stack.return_value = images
         self.presenter.stack = stack
 
         self.presenter.do_update_previews()
 
-        stack.slice_as_image_stack.assert_called_once_with(self.presenter.model.preview_image_idx)
+        stack.slice_as_image_stack.assert_called_with(self.presenter.model.preview_image_idx)
         self.view.clear_previews.assert_called_once()
-        apply_mock.assert_called_once()
+        apply_mock.return_value.assert_called_once()
 
     @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowPresenter._update_preview_image')
-    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.apply_to_images')
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.preview_func')
     def test_update_previews_with_no_lock_checked(self, apply_mock: mock.Mock, update_preview_image_mock: mock.Mock):
-        stack = mock.Mock()
+        stack = mock.Mock(num_images=1)
         images = generate_images([1, 10, 10])
         stack.slice_as_image_stack.return_value = images
         self.presenter.stack = stack
@@ -237,17 +244,17 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         stack.slice_as_image_stack.assert_called_once_with(self.presenter.model.preview_image_idx)
         self.view.clear_previews.assert_called_once()
         self.assertEqual(3, update_preview_image_mock.call_count)
-        apply_mock.assert_called_once()
+        apply_mock.return_value.assert_called_once()
         self.view.previews.auto_range.assert_called_once()
         self.view.previews.record_histogram_regions.assert_not_called()
         self.view.previews.restore_histogram_regions.assert_not_called()
         self.view.previews.autorange_histograms.assert_called_once()
 
     @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowPresenter._update_preview_image')
-    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.apply_to_images')
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.preview_func')
     def test_auto_range_called_when_locks_are_checked(self, apply_mock: mock.Mock,
                                                       update_preview_image_mock: mock.Mock):
-        stack = mock.Mock()
+        stack = mock.Mock(num_images=1)
         images = generate_images([1, 10, 10])
         stack.slice_as_image_stack.return_value = images
         self.presenter.stack = stack
@@ -265,10 +272,10 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.view.previews.autorange_histograms.assert_not_called()
 
     @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowPresenter._update_preview_image')
-    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.apply_to_images')
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.preview_func')
     def test_lock_scale_checked_flat_fielding_special_case(self, apply_mock: mock.Mock,
                                                            update_preview_image_mock: mock.Mock):
-        stack = mock.Mock()
+        stack = mock.Mock(num_images=1)
         images = generate_images([1, 10, 10])
         stack.slice_as_image_stack.return_value = images
         self.presenter.stack = stack
@@ -287,9 +294,9 @@ class FiltersWindowPresenterTest(unittest.TestCase):
 
     @parameterized.expand([(True, True), (False, True), (True, False), (False, False)])
     @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowPresenter._update_preview_image')
-    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.apply_to_images')
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.preview_func')
     def test_update_previews_shapes(self, sino_op, stack_sino, _, update_preview_image_mock: mock.Mock):
-        stack = mock.Mock(num_projections=10)
+        stack = mock.Mock(num_projections=10, num_images=1, num_sinograms=1)
         if not sino_op:
             stack.slice_as_image_stack.return_value = generate_images([1, 10, 12])
             stack.slice_as_image_stack.return_value._is_sinograms = stack_sino
@@ -328,13 +335,52 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter._do_apply_filter = mock.MagicMock()  # type: ignore
         task = mock.MagicMock()
         task.error = None
-        self.presenter.original_images_stack = {stack.id: mock.Mock() for stack in self.mock_stacks}
+        snapshots = {stack.id: mock.Mock() for stack in self.mock_stacks}
+        self.presenter.snapshots.latest.side_effect = snapshots.get
 
         self.presenter._post_filter(self.mock_stacks, task)
 
         self.assertEqual(2, stack_choice_presenter.call_count)
         self.assertEqual(2, stack_choice_presenter.return_value.show.call_count)
-        self.assertDictEqual(self.presenter.original_images_stack, {})
+        for stack, call in zip(self.mock_stacks, stack_choice_presenter.call_args_list, strict=True):
+            original, new_stack, presenter = call.args
+            self.assertIsInstance(original, SnapshotFrames)
+            self.assertIs(original.snapshot, snapshots[stack.id])
+            self.assertEqual((new_stack, presenter), (stack, self.presenter))
+
+    @parameterized.expand([("keep_new", True), ("keep_original", False)])
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.StackChoicePresenter')
+    def test_safe_apply_snapshot_discarded_after_stack_choice(self, _, use_new_data, stack_choice_presenter):
+        stack_choice_presenter.return_value.done = True
+        stack_choice_presenter.return_value.use_new_data = use_new_data
+        self.presenter.view.safeApply.isChecked.return_value = True
+        self.presenter.do_update_previews = mock.Mock()
+        stack = generate_images()
+        task = mock.Mock()
+        task.error = None
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.presenter.snapshots = SnapshotStore(directory=directory)
+            self.presenter.snapshots.take(stack)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            self.presenter._post_filter([stack], task)
+            stack_choice_presenter.reset_mock()
+
+            self.assertEqual(len(self.presenter.snapshots), 0)
+            self.assertEqual(os.listdir(directory), [])
+
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.StackChoicePresenter')
+    def test_snapshot_discarded_when_filter_fails(self, stack_choice_presenter):
+        self.presenter.view.safeApply.isChecked.return_value = True
+        self.presenter.do_update_previews = mock.Mock()
+        task = mock.Mock()
+        task.error = "failed"
+
+        self.presenter._post_filter(self.mock_stacks, task)
+
+        stack_choice_presenter.assert_not_called()
+        self.presenter.snapshots.discard.assert_has_calls([mock.call(stack.id) for stack in self.mock_stacks])
 
     @mock.patch('mantidimaging.gui.windows.operations.presenter.StackChoicePresenter')
     def test_unchecked_safe_apply_does_not_start_stack_choice_presenter(self, stack_choice_presenter):
@@ -348,27 +394,36 @@ class FiltersWindowPresenterTest(unittest.TestCase):
 
         stack_choice_presenter.assert_not_called()
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_original_stack_assigned_when_safe_apply_checked(self, _):
+    def test_snapshot_taken_in_task_when_safe_apply_checked(self):
         stack = mock.MagicMock()
         stack.id = "123"
         self.presenter.stack = stack
-        stack_copy = "THIS IS USEFUL STACK DATA"
-        stack.copy.return_value = stack_copy
-        self.presenter._do_apply_filter = mock.MagicMock()
+        self.presenter.model.do_apply_filter = mock.MagicMock()
+        self.presenter.view.safeApply.isChecked.return_value = True
 
         self.presenter.do_apply_filter()
 
-        stack.copy.assert_called_once()
-        self.assertDictEqual({stack.id: stack_copy}, self.presenter.original_images_stack)
+        self.presenter.snapshots.take.assert_not_called()
+        self.assertIs(self.presenter.model.do_apply_filter.call_args.args[2], self.presenter.snapshots)
+        stack.copy.assert_not_called()
+
+    def test_snapshot_taken_in_task_when_safe_apply_to_all(self):
+        self.main_window.get_all_stacks.return_value = self.mock_stacks
+        self.presenter.model.do_apply_filter = mock.MagicMock()
+        self.presenter.view.safeApply.isChecked.return_value = True
+
+        self.presenter.do_apply_filter_to_all()
+
+        self.presenter.snapshots.take.assert_not_called()
+        self.presenter.model.do_apply_filter.assert_called_once_with(self.mock_stacks, mock.ANY,
+                                                                     self.presenter.snapshots)
 
     def test_set_filter_by_name(self):
         NAME = "ROI Normalisation"
         self.presenter.set_filter_by_name(NAME)
         self.view.filterSelector.setCurrentText.assert_called_with(NAME)
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_warning_when_flat_fielding_is_run_twice(self, _):
+    def test_warning_when_flat_fielding_is_run_twice(self):
         """
         Test that a warning is displayed if the user is trying to run flat-fielding again.
         """
@@ -379,8 +434,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter.do_apply_filter()
         self.view.ask_confirmation.assert_called_once_with(REPEAT_FLAT_FIELDING_MSG)
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_no_warning_when_flat_fielding_isnt_run(self, _):
+    def test_no_warning_when_flat_fielding_isnt_run(self):
         """
         Test no warning is created if the user isn't running flat fielding.
         """
@@ -390,8 +444,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter.do_apply_filter()
         self.view.ask_confirmation.assert_not_called()
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_no_warning_when_flat_fielding_is_first_operation(self, _):
+    def test_no_warning_when_flat_fielding_is_first_operation(self):
         """
         Test that no warning is created when flat fielding is the first operation the user runs, and no operation
         history exists.
@@ -402,8 +455,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter.do_apply_filter()
         self.view.ask_confirmation.assert_not_called()
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_no_warning_when_flat_fielding_is_run_for_first_time(self, _):
+    def test_no_warning_when_flat_fielding_is_run_for_first_time(self):
         """
         Test that no warning is created if an operation history exists but flat fielding isn't in it.
         """
@@ -414,8 +466,7 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter.do_apply_filter()
         self.view.ask_confirmation.assert_not_called()
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_no_operation_run_when_user_cancels_flat_fielding(self, _):
+    def test_no_operation_run_when_user_cancels_flat_fielding(self):
         """
         Test that pressing "Cancel" when the flat-fielding warning is displayed means that no operation is run.
         """
@@ -427,15 +478,13 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         self.presenter.do_apply_filter()
         self.presenter._do_apply_filter.assert_not_called()
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_buttons_disabled_while_filter_is_running(self, _):
+    def test_buttons_disabled_while_filter_is_running(self):
         self.presenter.model.do_apply_filter = mock.MagicMock()
         self.presenter._do_apply_filter(None)
         self.presenter.view.applyButton.setEnabled.assert_called_once_with(False)
         self.presenter.view.applyToAllButton.setEnabled.assert_called_once_with(False)
 
-    @mock.patch("mantidimaging.gui.windows.operations.presenter.operation_in_progress")
-    def test_running_operation_records_previous_button_states(self, _):
+    def test_running_operation_records_previous_button_states(self):
         self.presenter.view.applyButton.isEnabled.return_value = prev_apply_single_state = True
         self.presenter.view.applyToAllButton.isEnabled.return_value = prev_apply_all_state = False
         self.presenter.model.do_apply_filter = mock.MagicMock()
@@ -443,6 +492,85 @@ class FiltersWindowPresenterTest(unittest.TestCase):
         assert self.presenter.prev_apply_single_state == prev_apply_single_state
         assert self.presenter.prev_apply_all_state == prev_apply_all_state
 
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.start_async_task_view')
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.FiltersWindowModel.filter_registration_func')
+    def test_register_rescale_sets_input_range_from_stack_statistics(self, filter_reg_mock: mock.Mock,
+                                                                      start_async_task_mock: mock.Mock):
+        self.view.get_selected_filter.return_value = "Rescale"
+        min_input_widget, max_input_widget = mock.Mock(), mock.Mock()
+        filter_reg_mock.return_value.return_value = {
+            "min_input_widget": min_input_widget,
+            "max_input_widget": max_input_widget
+        }
+        self.presenter.stack = generate_images()
+        self.presenter.stack.data[0, 0, 0] = -3.0
+        self.presenter.stack.data[1, 0, 0] = 7.5
+        self.presenter.stack.data[2, 0, 0] = np.nan
+
+        with mock.patch("mantidimaging.gui.windows.operations.presenter.BlockQtSignals"):
+            self.presenter.do_register_active_filter()
+
+        start_async_task_mock.assert_called_once()
+        _, task, on_complete = start_async_task_mock.call_args.args
+        min_input_widget.setValue.assert_not_called()
+        on_complete(mock.Mock(was_successful=mock.Mock(return_value=True), result=task()))
+
+        min_input_widget.setValue.assert_called_once_with(-3.0)
+        max_input_widget.setValue.assert_called_once_with(7.5)
+
+    def test_init_rescale_range_does_nothing_when_stack_is_none(self):
+        min_input_widget, max_input_widget = mock.Mock(), mock.Mock()
+        self.presenter.init_rescale_range(min_input_widget, max_input_widget)
+        min_input_widget.setValue.assert_not_called()
+        max_input_widget.setValue.assert_not_called()
+
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.start_async_task_view')
+    def test_init_rescale_range_uses_cached_statistics(self, start_async_task_mock: mock.Mock):
+        self.presenter.stack = generate_images()
+        statistics = self.presenter.stack.statistics()
+        min_input_widget, max_input_widget = mock.Mock(), mock.Mock()
+
+        with mock.patch("mantidimaging.core.data.imagestack.compute_statistics") as compute_statistics:
+            self.presenter.init_rescale_range(min_input_widget, max_input_widget)
+
+        compute_statistics.assert_not_called()
+        start_async_task_mock.assert_not_called()
+        min_input_widget.setValue.assert_called_once_with(statistics.min)
+        max_input_widget.setValue.assert_called_once_with(statistics.max)
+
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.start_async_task_view')
+    def test_init_rescale_range_computes_statistics_off_gui_thread(self, start_async_task_mock: mock.Mock):
+        self.presenter.stack = generate_images()
+
+        with mock.patch("mantidimaging.core.data.imagestack.compute_statistics") as compute_statistics:
+            self.presenter.init_rescale_range(mock.Mock(), mock.Mock())
+
+        compute_statistics.assert_not_called()
+        start_async_task_mock.assert_called_once()
+        self.assertEqual(start_async_task_mock.call_args.args[1], self.presenter.stack.statistics)
+
+    @parameterized.expand([("stack_changed", ), ("stack_modified", ), ("filter_changed", ), ("task_failed", )])
+    @mock.patch('mantidimaging.gui.windows.operations.presenter.start_async_task_view')
+    def test_init_rescale_range_ignores_stale_statistics(self, case: str, start_async_task_mock: mock.Mock):
+        self.presenter.stack = generate_images()
+        min_input_widget, max_input_widget = mock.Mock(), mock.Mock()
+        self.presenter.init_rescale_range(min_input_widget, max_input_widget)
+        _, task, on_complete = start_async_task_mock.call_args.args
+        result = mock.Mock(was_successful=mock.Mock(return_value=True), result=task())
+
+        if case == "stack_changed":
+            self.presenter.stack = generate_images()
+        elif case == "stack_modified":
+            self.presenter.stack.mark_modified()
+        elif case == "filter_changed":
+            self.presenter._rescale_range_widgets = None
+        else:
+            result.was_successful.return_value = False
+        on_complete(result)
+
+        min_input_widget.setValue.assert_not_called()
+        max_input_widget.setValue.assert_not_called()
+
     def test_init_roi_field_does_nothing_when_stack_is_none(self):
         mock_roi_field = mock.Mock()
         self.presenter.init_roi_field(mock_roi_field)
@@ -554,8 +682,8 @@ class FiltersWindowPresenterTest(unittest.TestCase):
 
     def test_negative_values_preview_message(self):
         self.presenter.model.preview_image_idx = slice_idx = 14
-        self.presenter.model.apply_to_images = mock.Mock()
-        self.presenter.stack = mock.Mock()
+        self.presenter.model.preview_func = mock.Mock()
+        self.presenter.stack = mock.Mock(num_images=1)
         self.presenter.stack.slice_as_image_stack.return_value.data = np.ones([1, 3, 3]) * -1
         self.presenter.do_update_previews()
 
@@ -563,8 +691,8 @@ class FiltersWindowPresenterTest(unittest.TestCase):
             f"Negative values found in result preview for slice {slice_idx}.")
 
     def test_no_negative_values_preview_message(self):
-        self.presenter.model.apply_to_images = mock.Mock()
-        self.presenter.stack = mock.Mock()
+        self.presenter.model.preview_func = mock.Mock()
+        self.presenter.stack = mock.Mock(num_images=1)
         self.presenter.stack.slice_as_image_stack.return_value.data = np.ones([1, 3, 3])
         self.presenter.do_update_previews()
 
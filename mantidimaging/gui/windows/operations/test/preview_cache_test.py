@@ -0,0 +1,230 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import threading
+import unittest
+from functools import partial
+from unittest import mock
+
+import numpy as np
+import numpy.testing as npt
+
+from mantidimaging.core.operations.arithmetic import ArithmeticFilter
+from mantidimaging.gui.windows.operations.preview_cache import PreviewCache, compute_preview, preview_key
+from mantidimaging.test_helpers.unit_test_helper import generate_images
+
+
+def _arithmetic(mult_val: float = 2.0) -> partial:
+    return partial(ArithmeticFilter.filter_func, mult_val=mult_val)
+
+
+class PreviewCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.stack = generate_images((6, 8, 10), seed=2)
+        self.cache = PreviewCache()
+
+    def tearDown(self) -> None:
+        self.cache.shutdown()
+
+    def test_compute_preview_of_projection(self):
+        preview = compute_preview(self.stack, 2, False, _arithmetic())
+
+        npt.assert_array_equal(preview.before, self.stack.data[2])
+        npt.assert_allclose(preview.after, self.stack.data[2] * 2)
+
+    def test_compute_preview_of_sinogram(self):
+        preview = compute_preview(self.stack, 3, True, _arithmetic())
+
+        npt.assert_array_equal(preview.before, self.stack.sino(3))
+        npt.assert_allclose(preview.after, self.stack.sino(3) * 2)
+
+    def test_compute_preview_without_filter(self):
+        preview = compute_preview(self.stack, 1, False, None)
+
+        self.assertIs(preview.before, preview.after)
+        self.assertEqual(preview.nbytes, self.stack.data[1].nbytes)
+
+    def test_key_depends_on_parameters_and_generation(self):
+        key = preview_key(self.stack, 1, False, _arithmetic())
+
+        self.assertEqual(key, preview_key(self.stack, 1, False, _arithmetic()))
+        self.assertNotEqual(key, preview_key(self.stack, 1, False, _arithmetic(3.0)))
+        self.assertNotEqual(key, preview_key(self.stack, 2, False, _arithmetic()))
+        self.assertNotEqual(key, preview_key(self.stack, 1, True, _arithmetic()))
+        self.stack.record_operation("Test", "Test")
+        self.assertNotEqual(key, preview_key(self.stack, 1, False, _arithmetic()))
+
+    def test_key_of_stack_parameter(self):
+        other = generate_images()
+        key = preview_key(self.stack, 1, False, partial(mock.Mock(), flat=other))
+
+        other.mark_modified()
+
+        self.assertIsNotNone(key)
+        self.assertNotEqual(key, preview_key(self.stack, 1, False, partial(mock.Mock(), flat=other)))
+
+    def test_unhashable_parameter_is_not_cached(self):
+        filter_func = partial(mock.Mock(), values=np.zeros(3))
+
+        self.assertIsNone(preview_key(self.stack, 1, False, filter_func))
+        self.cache.get(self.stack, 1, False, filter_func)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_filter_only_run_once_for_same_parameters(self):
+        filter_func = mock.Mock(wraps=_arithmetic())
+        filter_func.args = ()
+        filter_func.keywords = {"mult_val": 2.0}
+        filter_func.func = ArithmeticFilter.filter_func
+
+        first = self.cache.get(self.stack, 1, False, filter_func)
+        second = self.cache.get(self.stack, 1, False, filter_func)
+
+        filter_func.assert_called_once()
+        self.assertIs(first, second)
+
+    def test_cache_dropped_when_stack_modified(self):
+        first = self.cache.get(self.stack, 1, False, _arithmetic())
+
+        self.stack.data[1] = 5
+        self.stack.record_operation("Test", "Test")
+        second = self.cache.get(self.stack, 1, False, _arithmetic())
+
+        self.assertIsNot(first, second)
+        npt.assert_allclose(second.after, 10)
+
+    def test_invalidate(self):
+        other = generate_images()
+        self.cache.get(self.stack, 1, False, None)
+        self.cache.get(other, 1, False, None)
+
+        self.cache.invalidate(self.stack.id)
+
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.nbytes, other.data[1].nbytes)
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_least_recently_used_dropped_over_budget(self):
+        image_bytes = self.stack.data[0].nbytes
+        self.cache.budget_bytes = 3 * image_bytes * 2
+        first = self.cache.get(self.stack, 0, False, _arithmetic())
+        self.cache.get(self.stack, 1, False, _arithmetic())
+        self.cache.get(self.stack, 2, False, _arithmetic())
+        # Use the first again so the second is the least recently used
+        self.cache.get(self.stack, 0, False, _arithmetic())
+
+        self.cache.get(self.stack, 3, False, _arithmetic())
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertLessEqual(self.cache.nbytes, self.cache.budget_bytes)
+        self.assertIs(self.cache.get(self.stack, 0, False, _arithmetic()), first)
+        self.assertIsNone(self.cache._previews.get(preview_key(self.stack, 1, False, _arithmetic())))
+
+    def test_prefetch_fills_cache_in_background(self):
+        self.cache.prefetch(self.stack, [2, 3], False, _arithmetic())
+        self.cache.wait()
+
+        self.assertIsNotNone(self.cache._previews.get(preview_key(self.stack, 2, False, _arithmetic())))
+        self.assertIsNotNone(self.cache._previews.get(preview_key(self.stack, 3, False, _arithmetic())))
+
+    def test_prefetch_drops_queued_previews(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_filter(images):
+            started.set()
+            release.wait(timeout=5)
+
+        # Keep the background thread busy so that the next previews stay queued
+        self.cache.prefetch(self.stack, [0], False, partial(slow_filter))
+        started.wait(timeout=5)
+        self.cache.prefetch(self.stack, [4, 5], False, _arithmetic())
+        queued = [self.cache._pending[preview_key(self.stack, i, False, _arithmetic())] for i in [4, 5]]
+        self.cache.prefetch(self.stack, [1], False, _arithmetic())
+        release.set()
+        self.cache.wait()
+
+        self.assertTrue(all(future.cancelled() for future in queued))
+        self.assertIsNotNone(self.cache._previews.get(preview_key(self.stack, 1, False, _arithmetic())))
+        self.assertIsNone(self.cache._previews.get(preview_key(self.stack, 4, False, _arithmetic())))
+
+    def test_get_does_not_wait_for_queued_prefetches(self):
+        started = threading.Event()
+        release = threading.Event()
+        prefetched = []
+
+        def slow_filter(images):
+            started.set()
+            release.wait(timeout=5)
+
+        def neighbour_filter(images):
+            prefetched.append(images)
+
+        self.cache.prefetch(self.stack, [0], False, partial(slow_filter))
+        started.wait(timeout=5)
+        self.cache.prefetch(self.stack, [4, 5], False, partial(neighbour_filter))
+        queued = [self.cache._pending[preview_key(self.stack, i, False, partial(neighbour_filter))] for i in [4, 5]]
+        # The running preview can not be stopped, so let it finish while get is waiting
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+
+        preview = self.cache.get(self.stack, 1, False, _arithmetic())
+
+        timer.join()
+        npt.assert_allclose(preview.after, self.stack.data[1] * 2)
+        self.assertTrue(all(future.cancelled() for future in queued))
+        self.assertEqual(prefetched, [])
+
+    def test_get_keeps_queued_prefetch_of_same_preview(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_filter(images):
+            started.set()
+            release.wait(timeout=5)
+
+        self.cache.prefetch(self.stack, [0], False, partial(slow_filter))
+        started.wait(timeout=5)
+        self.cache.prefetch(self.stack, [1], False, _arithmetic())
+        queued = self.cache._pending[preview_key(self.stack, 1, False, _arithmetic())]
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+
+        preview = self.cache.get(self.stack, 1, False, _arithmetic())
+
+        timer.join()
+        self.assertIs(preview, queued.result())
+
+    def test_cancel_pending_waits_for_running_preview(self):
+        started = threading.Event()
+        finished = threading.Event()
+
+        def slow_filter(images):
+            started.set()
+            finished.wait(timeout=0.2)
+            finished.set()
+
+        self.cache.prefetch(self.stack, [0], False, partial(slow_filter))
+        self.cache.prefetch(self.stack, [4], False, _arithmetic())
+        started.wait(timeout=5)
+
+        self.cache.cancel_pending(wait=True)
+
+        self.assertTrue(finished.is_set())
+        self.assertIsNone(self.cache._previews.get(preview_key(self.stack, 4, False, _arithmetic())))
+
+    def test_get_raises_filter_error(self):
+
+        def failing_filter(images):
+            raise RuntimeError("filter failed")
+
+        with self.assertRaisesRegex(RuntimeError, "filter failed"):
+            self.cache.get(self.stack, 1, False, partial(failing_filter))
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -127,6 +127,7 @@ class FiltersWindowView(BaseMainWindowView):
             self.roi_selector_dialog.close()
 
         self.presenter.set_stack(None)
+        self.presenter.preview_cache.shutdown()
         self.auto_update_triggered.disconnect()
         self.main_window.filters = None
         self.presenter.view = None
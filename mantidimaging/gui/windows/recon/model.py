@@ -3,6 +3,7 @@
 from __future__ import annotations
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
 
 import numpy as np
 
@@ -11,9 +12,11 @@ from mantidimaging.core.operation_history import const
 from mantidimaging.core.operations.divide import DivideFilter
 from mantidimaging.core.reconstruct import get_reconstructor_for
 from mantidimaging.core.reconstruct.astra_recon import allowed_recon_kwargs as astra_allowed_kwargs
+from mantidimaging.core.reconstruct.fbp_recon import allowed_recon_kwargs as fbp_allowed_kwargs
 from mantidimaging.core.reconstruct.tomopy_recon import allowed_recon_kwargs as tomopy_allowed_kwargs
 from mantidimaging.core.reconstruct.cil_recon import allowed_recon_kwargs as cil_allowed_kwargs
 from mantidimaging.core.rotation.polyfit_correlation import find_center
+from mantidimaging.core.rotation.square_sum_minimisation import find_cors
 from mantidimaging.core.utility.cuda_check import CudaChecker
 from mantidimaging.core.utility.data_containers import (Degrees, ReconstructionParameters, ScalarCoR, Slope)
 from mantidimaging.core.utility.progress_reporting import Progress
@@ -181,6 +184,7 @@ class ReconstructWindowModel:
     @staticmethod
     def load_allowed_recon_kwargs() -> dict[str, Any]:
         d = tomopy_allowed_kwargs()
+        d.update(fbp_allowed_kwargs())
         if CudaChecker().cuda_is_present():
             d.update(astra_allowed_kwargs())
             d.update(cil_allowed_kwargs())
@@ -221,8 +225,12 @@ class ReconstructWindowModel:
         slices = np.linspace(remove_a_bit, self.images.height - remove_a_bit, num=num_cors, dtype=np.int32)
         return self.selected_row, slices
 
-    def auto_find_minimisation_sqsum(self, slices: list[int], recon_params: ReconstructionParameters,
-                                     initial_cor: list[float], progress: Progress) -> list[float]:
+    def auto_find_minimisation_sqsum(self,
+                                     slices: list[int],
+                                     recon_params: ReconstructionParameters,
+                                     initial_cor: list[float],
+                                     progress: Progress,
+                                     on_cor_found: Callable[[int, float], None] | None = None) -> list[float]:
         """
 
         :param slices: Slice indices to be reconstructed
@@ -231,6 +239,7 @@ class ReconstructWindowModel:
                             If a float is passed it will be used for all slices.
                             If a list is passed, the COR will be retrieved for each slice.
         :param progress: Progress reporter
+        :param on_cor_found: Called with the slice index and COR as the search of each slice finishes
         """
 
         # Ensure we have some sample data
@@ -243,14 +252,7 @@ class ReconstructWindowModel:
             raise ValueError("The number of initial COR values must match the number of slices being reconstructed")
 
         reconstructor = get_reconstructor_for(recon_params.algorithm)
-        progress = Progress.ensure_instance(progress, num_steps=len(slices))
-        progress.update(0, msg=f"Calculating COR for slice {slices[0]}")
-        cors = []
-        for idx, slice in enumerate(slices):
-            cor = reconstructor.find_cor(self.images, slice, initial_cor[idx], recon_params)
-            cors.append(cor)
-            progress.update(msg=f"Calculating COR for slice {slice}")
-        return cors
+        return find_cors(reconstructor, self.images, slices, initial_cor, recon_params, progress, on_cor_found)
 
     def auto_find_correlation(self, progress: Progress) -> tuple[ScalarCoR, Degrees]:
         return find_center(self.images, progress)
@@ -261,13 +263,13 @@ class ReconstructWindowModel:
                and images.width == images.proj180deg.width
 
     def stack_contains_nans(self) -> bool:
-        return bool(np.any(np.isnan(self.images.data)))
+        return self.images.statistics().nan_count > 0
 
     def stack_contains_zeroes(self) -> bool:
-        return not np.all(self.images.data)
+        return self.images.statistics().zero_count > 0
 
     def stack_contains_negative_values(self) -> bool:
-        return bool(np.any(self.images.data < 0))
+        return self.images.statistics().negative_count > 0
 
     @property
     def stack_id(self) -> uuid.UUID | None:
@@ -425,13 +425,14 @@ class ReconstructWindowPresenter(BasePresenter):
         else:
             initial_cor = [self.view.rotation_centre]
 
+        def _cor_found(slice_idx: int, cor: float) -> None:
+            # Called on the task's thread, the signal adds the row to the table on the GUI thread
+            self.view.cor_found.emit(selected_row, int(slice_idx), cor)
+
         def _completed_finding_cors(task: TaskWorkerThread) -> None:
             if task.error is not None:
                 self.view.show_error_dialog(f"Finding the COR failed.\n\n Error: {str(task.error)}")
             else:
-                cors = task.result
-                for slice_idx, cor in zip(slice_indices, cors, strict=True):
-                    self.view.add_cor_table_row(selected_row, slice_idx, cor)
                 self.do_cor_fit()
             self.view.set_correlate_buttons_enabled(True)
 
@@ -441,9 +442,11 @@ class ReconstructWindowPresenter(BasePresenter):
                               _completed_finding_cors, {
                                   'slices': slice_indices,
                                   'recon_params': self.view.recon_params(),
-                                  'initial_cor': initial_cor
+                                  'initial_cor': initial_cor,
+                                  'on_cor_found': _cor_found
                               },
-                              tracker=self.async_tracker)
+                              tracker=self.async_tracker,
+                              cancelable=True)
 
     def proj_180_degree_shape_matches_images(self, images) -> bool:
         return self.model.proj_180_degree_shape_matches_images(images)
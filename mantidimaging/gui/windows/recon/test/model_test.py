@@ -11,6 +11,7 @@ import numpy as np
 from mantidimaging.core.data import ImageStack
 from mantidimaging.core.operation_history import const
 from mantidimaging.core.reconstruct.astra_recon import allowed_recon_kwargs as astra_allowed_kwargs
+from mantidimaging.core.reconstruct.fbp_recon import allowed_recon_kwargs as fbp_allowed_kwargs
 from mantidimaging.core.reconstruct.tomopy_recon import allowed_recon_kwargs as tomopy_allowed_kwargs
 from mantidimaging.core.reconstruct.cil_recon import allowed_recon_kwargs as cil_allowed_kwargs
 from mantidimaging.core.rotation.data_model import Point
@@ -177,10 +178,11 @@ class ReconWindowModelTest(unittest.TestCase):
 
     def test_load_allowed_recon_args_no_cuda(self):
         with mock.patch("mantidimaging.gui.windows.recon.model.CudaChecker.cuda_is_present", return_value=False):
-            assert self.model.load_allowed_recon_kwargs() == tomopy_allowed_kwargs()
+            assert self.model.load_allowed_recon_kwargs() == tomopy_allowed_kwargs() | fbp_allowed_kwargs()
 
     def test_load_allowed_recon_args_with_cuda(self):
         allowed_args = tomopy_allowed_kwargs()
+        allowed_args.update(fbp_allowed_kwargs())
         allowed_args.update(astra_allowed_kwargs())
         allowed_args.update(cil_allowed_kwargs())
         with mock.patch("mantidimaging.gui.windows.recon.model.CudaChecker.cuda_is_present", return_value=True):
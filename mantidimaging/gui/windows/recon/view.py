@@ -9,10 +9,11 @@ from uuid import UUID
 import numpy
 from PyQt5.QtWidgets import (QAbstractItemView, QComboBox, QDoubleSpinBox, QInputDialog, QPushButton, QSpinBox,
                              QVBoxLayout, QWidget, QTextEdit, QLabel, QApplication, QStyle, QCheckBox)
-from PyQt5.QtCore import QSignalBlocker
+from PyQt5.QtCore import QSignalBlocker, pyqtSignal
 
 from mantidimaging.core.data import ImageStack
 from mantidimaging.core.net.help_pages import SECTION_USER_GUIDE, open_help_webpage
+from mantidimaging.core.reconstruct.fbp_recon import FBP_CPU_ALGORITHM
 from mantidimaging.core.utility.cuda_check import CudaChecker
 from mantidimaging.core.utility.data_containers import Degrees, ReconstructionParameters, ScalarCoR, Slope
 from mantidimaging.gui.mvp_base import BaseMainWindowView
@@ -33,6 +34,9 @@ LOG = getLogger(__name__)
 
 
 class ReconstructWindowView(BaseMainWindowView):
+    # Row, slice index and COR of a COR found by an automatic search running on another thread
+    cor_found = pyqtSignal(int, int, float)
+
     tableView: RemovableRowTableView
     imageLayout: QVBoxLayout
 
@@ -87,10 +91,12 @@ class ReconstructWindowView(BaseMainWindowView):
 
         self.main_window = main_window
         self.presenter = ReconstructWindowPresenter(self, main_window)
+        self.cor_found.connect(self.add_cor_table_row)
 
         self.algorithmName.insertItem(1, "FBP_CUDA")
         self.algorithmName.insertItem(2, "SIRT_CUDA")
         self.algorithmName.insertItem(3, "CIL_PDHG-TV")
+        self.algorithmName.insertItem(4, FBP_CPU_ALGORITHM)
         self.algorithmName.setCurrentIndex(1)
         if not CudaChecker().cuda_is_present():
             self.algorithmName.model().item(1).setEnabled(False)
@@ -6,6 +6,7 @@ import traceback
 from typing import TYPE_CHECKING
 
 from mantidimaging.core.data.imagestack import ImageStack
+from mantidimaging.core.data.snapshot import SnapshotFrames
 from mantidimaging.gui.windows.stack_choice.presenter_base import StackChoicePresenterMixin
 from mantidimaging.gui.windows.stack_choice.view import Notification, StackChoiceView
 
@@ -15,7 +16,12 @@ if TYPE_CHECKING:
 
 class StackChoicePresenter(StackChoicePresenterMixin):
 
-    def __init__(self, original_stack: ImageStack, new_stack: ImageStack, operations_presenter: FiltersWindowPresenter):
+    def __init__(self, original_stack: ImageStack | SnapshotFrames, new_stack: ImageStack,
+                 operations_presenter: FiltersWindowPresenter):
+        """
+        :param original_stack: The data before the operation. If it is a snapshot, choosing the original data restores
+                               the snapshot into the new stack's array, rather than handing over the original's array.
+        """
 
         self.operations_presenter = operations_presenter
         self.original_stack = original_stack
@@ -41,8 +47,11 @@ class StackChoicePresenter(StackChoicePresenterMixin):
             self.show_error(e, traceback.format_exc())
 
     def do_reapply_original_data(self):
-        self.new_stack.shared_array = self.original_stack.shared_array
-        self.new_stack.metadata = self.original_stack.metadata
+        if isinstance(self.original_stack, SnapshotFrames):
+            self.original_stack.restore(self.new_stack)
+        else:
+            self.new_stack.shared_array = self.original_stack.shared_array
+            self.new_stack.metadata = self.original_stack.metadata
         self.view.choice_made = True
         self.close_view()
 
@@ -13,6 +13,7 @@ import mantidimaging.test_helpers.unit_test_helper as th
 from mantidimaging.gui.windows.stack_choice.presenter import StackChoicePresenter
 from mantidimaging.gui.windows.stack_choice.view import Notification
 from mantidimaging.core.data.imagestack import ImageStack
+from mantidimaging.core.data.snapshot import SnapshotFrames
 
 
 class StackChoicePresenterTest(unittest.TestCase):
@@ -77,6 +78,19 @@ class StackChoicePresenterTest(unittest.TestCase):
         self.assertTrue(self.v.choice_made)
         self.p.close_view.assert_called_once()
 
+    def test_do_reapply_original_data_from_snapshot(self):
+        self.p.close_view = mock.MagicMock()
+        snapshot = mock.Mock()
+        self.p.original_stack = SnapshotFrames(snapshot)
+        shared_array = self.new_stack.shared_array
+
+        self.p.do_reapply_original_data()
+
+        snapshot.restore.assert_called_once_with(self.new_stack, None)
+        self.assertIs(self.new_stack.shared_array, shared_array)
+        self.assertTrue(self.v.choice_made)
+        self.p.close_view.assert_called_once()
+
     def test_do_clean_up_original_data(self):
         self.p.original_stack = mock.MagicMock()
         self.p.close_view = mock.MagicMock()
@@ -1,16 +1,19 @@
 # Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
 # SPDX - License - Identifier: GPL-3.0-or-later
 from __future__ import annotations
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import DEFAULT, Mock, patch
 from uuid import uuid4
 
+import numpy.testing as npt
 from PyQt5 import sip
 from PyQt5.QtWidgets import QMessageBox
 from pyqtgraph import ViewBox
 
 import mantidimaging.test_helpers.unit_test_helper as th
+from mantidimaging.core.data.snapshot import SnapshotFrames, SnapshotStore
 from mantidimaging.gui.windows.stack_choice.view import Notification, StackChoiceView
 from mantidimaging.test_helpers import start_qapplication
 
@@ -227,3 +230,17 @@ class StackChoiceViewTest(unittest.TestCase):
 
         self.v.new_stack.ui.histogram.sigLevelsChanged.emit(expected_emit)
         _set_from_new_to_old.assert_not_called()
+
+    def test_original_snapshot_frames_shown_without_reading_every_frame(self):
+        with tempfile.TemporaryDirectory() as directory:
+            snapshot = SnapshotStore(directory=directory).take(self.original_stack)
+            frames = SnapshotFrames(snapshot)
+
+            with mock.patch.object(snapshot, "frame", wraps=snapshot.frame) as read_frame:
+                view = StackChoiceView(frames, self.new_stack, self.p, None)
+                view.original_stack.setCurrentIndex(3)
+
+            self.assertIs(view.original_stack.image, frames)
+            npt.assert_array_equal(view.original_stack.image_item.image, self.original_stack.data[3])
+            self.assertLess(len({c.args for c in read_frame.call_args_list}), self.original_stack.data.shape[0])
+            sip.delete(view)
@@ -15,6 +15,7 @@ from mantidimaging.gui.mvp_base import BaseMainWindowView
 from mantidimaging.gui.widgets.mi_image_view.view import MIImageView
 
 if TYPE_CHECKING:
+    from mantidimaging.core.data.snapshot import SnapshotFrames
     from mantidimaging.gui.windows.stack_choice.compare_presenter import StackComparePresenter  # pragma: no cover
     from mantidimaging.gui.windows.stack_choice.presenter import StackChoicePresenter  # pragma: no cover
 
@@ -30,7 +31,7 @@ class StackChoiceView(BaseMainWindowView):
     newDataButton: QPushButton
     lockHistograms: QCheckBox
 
-    def __init__(self, original_stack: ImageStack, new_stack: ImageStack,
+    def __init__(self, original_stack: ImageStack | SnapshotFrames, new_stack: ImageStack,
                  presenter: StackComparePresenter | StackChoicePresenter, parent: QMainWindow | None):
         super().__init__(parent, "gui/ui/stack_choice_window.ui")
 
@@ -48,7 +49,9 @@ class StackChoiceView(BaseMainWindowView):
         self.new_stack.name = "New Stack"
         self.new_stack.enable_nan_check(True)
 
-        self._setup_stack_for_view(self.original_stack, original_stack.data)
+        # Snapshot frames are shown as they are, so that only the frames being looked at are read
+        original_data = original_stack.data if isinstance(original_stack, ImageStack) else original_stack
+        self._setup_stack_for_view(self.original_stack, original_data)
         self._setup_stack_for_view(self.new_stack, new_stack.data)
 
         self.topVerticalOriginal.addWidget(self.original_stack)
@@ -122,7 +125,7 @@ class StackChoiceView(BaseMainWindowView):
             self.original_stack.roiClicked()
             self.new_stack.roiClicked()
 
-    def _setup_stack_for_view(self, stack: MIImageView, data: np.ndarray):
+    def _setup_stack_for_view(self, stack: MIImageView, data: np.ndarray | SnapshotFrames):
         stack.setContentsMargins(4, 4, 4, 4)
         stack.setImage(data)
         stack.ui.menuBtn.hide()
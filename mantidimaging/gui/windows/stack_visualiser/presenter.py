@@ -4,21 +4,30 @@ from __future__ import annotations
 
 import numpy as np
 import traceback
+from copy import deepcopy
 from enum import IntEnum, auto
 from logging import getLogger
 from typing import TYPE_CHECKING
 
 from mantidimaging.core.data import ImageStack
 from mantidimaging.core.operation_history import const
+from mantidimaging.core.operation_history.pipeline import replay_history
+from mantidimaging.core.parallel import utility as pu
 from mantidimaging.core.utility.sensible_roi import SensibleROI
+from mantidimaging.gui.dialogs.async_task import start_async_task_view
 from mantidimaging.gui.mvp_base import BasePresenter
 from .model import SVModel
 from ...utility.common import operation_in_progress
 from mantidimaging.core.data.dataset import Dataset
 
 if TYPE_CHECKING:
+    from mantidimaging.core.utility.progress_reporting import Progress  # pragma: no cover
+    from mantidimaging.gui.dialogs.async_task import TaskWorkerThread  # pragma: no cover
     from .view import StackVisualiserView  # pragma: no cover
 
+# The stacks of a dataset that operations replayed from another stack can use, e.g. for flat-fielding
+REPLAY_STACKS = ("flat_before", "flat_after", "dark_before", "dark_after")
+
 
 class SVNotification(IntEnum):
     REFRESH_IMAGE = auto()
@@ -102,12 +111,27 @@ class StackVisualiserPresenter(BasePresenter):
         self.refresh_image()
 
     def create_swapped_axis_stack(self):
-        with operation_in_progress("Creating sinograms, copying data, this may take a while",
-                                   "The data is being copied, this may take a while.", self.view):
-            new_stack = self.images.copy(flip_axes=True)
-            new_stack.name = self.images.name + "_sino"
-            new_stack.record_operation(const.OPERATION_NAME_AXES_SWAP, display_name="Axes Swapped")
-            self.add_sinograms_to_model_and_update_view(new_stack)
+        start_async_task_view(self.view, self._create_sinograms, self._on_sinograms_created)
+
+    def _create_sinograms(self, progress: Progress | None = None) -> ImageStack:
+        """
+        Transposes the stack into a new one, tile by tile on the process pool, so the only allocation is the new stack.
+        """
+        shape = (self.images.data.shape[1], self.images.data.shape[0], self.images.data.shape[2])
+        new_stack = ImageStack(self.images.create_array_like(shape),
+                               indices=deepcopy(self.images.indices),
+                               metadata=deepcopy(self.images.metadata),
+                               sinograms=not self.images.is_sinograms,
+                               name=self.images.name + "_sino")
+        pu.swap_axes_into(self.images.data, new_stack.data, progress)
+        new_stack.record_operation(const.OPERATION_NAME_AXES_SWAP, display_name="Axes Swapped")
+        return new_stack
+
+    def _on_sinograms_created(self, task: TaskWorkerThread) -> None:
+        if task.error is not None:
+            self.view._main_window.show_error_dialog(f"Creating sinograms failed: {task.error}")
+            return
+        self.add_sinograms_to_model_and_update_view(task.result)
 
     def dupe_stack(self):
         with operation_in_progress("Copying data, this may take a while",
@@ -123,6 +147,41 @@ class StackVisualiserPresenter(BasePresenter):
             new_images.name = self.images.name
             self.add_new_dataset_to_model_and_update_view(new_images)
 
+    def stacks_with_history(self) -> dict[str, ImageStack]:
+        """
+        Gets the other open stacks that have operations that can be applied to this stack, by window name.
+        """
+        stacks = {}
+        for stack_id in self.view._main_window.stack_list:
+            if stack_id.id == self.images.id:
+                continue
+            stack = self.view._main_window.get_images_from_stack_uuid(stack_id.id)
+            if stack.is_processed:
+                stacks[stack_id.name] = stack
+        return stacks
+
+    def apply_operations_of(self, source: ImageStack) -> None:
+        """
+        Applies the operations in the history of another stack to this stack, using the flats and darks of this
+        stack's dataset.
+        :param source: The stack to take the operations from
+        """
+        main_window = self.view._main_window
+        dataset = main_window.get_dataset(main_window.get_dataset_id_from_stack_uuid(self.images.id))
+        stacks = {name: getattr(dataset, name) for name in REPLAY_STACKS}
+        start_async_task_view(self.view, replay_history, self._on_operations_applied, {
+            'images': self.images,
+            'metadata': source.metadata,
+            'stacks': stacks
+        })
+
+    def _on_operations_applied(self, task: TaskWorkerThread) -> None:
+        if task.error is not None:
+            # Stages that finished before the error have changed the data
+            self.images.mark_modified()
+            self.view._main_window.show_error_dialog(f"Applying operations failed: {task.error}")
+        self.view._main_window.stack_changed.emit()
+
     def add_new_dataset_to_model_and_update_view(self, images: ImageStack):
         dataset = Dataset(stacks=[images], name=images.name)
         self.view._main_window.presenter.model.add_dataset_to_model(dataset)
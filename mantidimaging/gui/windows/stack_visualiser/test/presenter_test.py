@@ -11,6 +11,10 @@ from mantidimaging.gui.windows.stack_visualiser.presenter import SVParameters
 
 import mantidimaging.test_helpers.unit_test_helper as th
 from mantidimaging.core.data import ImageStack
+from mantidimaging.core.data.dataset import Dataset
+from mantidimaging.core.operation_history import const
+from mantidimaging.core.operation_history.pipeline import replay_history
+from mantidimaging.gui.windows.main.presenter import StackId
 from mantidimaging.gui.windows.stack_visualiser import StackVisualiserPresenter, StackVisualiserView, SVNotification, \
     SVImageMode
 
@@ -107,6 +111,92 @@ class StackVisualiserPresenterTest(unittest.TestCase):
         self.view._main_window.presenter.add_sinograms_to_dataset_and_update_view.assert_called_once_with(
             sinograms, self.presenter.images.id)
 
+    @patch("mantidimaging.gui.windows.stack_visualiser.presenter.start_async_task_view")
+    def test_notify_swap_axes_creates_sinograms_in_a_task(self, start_async_task_view):
+        self.presenter.notify(SVNotification.SWAP_AXES)
+
+        start_async_task_view.assert_called_once_with(self.view, self.presenter._create_sinograms,
+                                                      self.presenter._on_sinograms_created)
+
+    def test_create_sinograms(self):
+        self.presenter.images.name = "stack"
+
+        sinograms = self.presenter._create_sinograms()
+
+        np.testing.assert_array_equal(sinograms.data, np.swapaxes(self.presenter.images.data, 0, 1))
+        self.assertFalse(np.shares_memory(sinograms.data, self.presenter.images.data))
+        self.assertTrue(sinograms.is_sinograms)
+        self.assertEqual(sinograms.name, "stack_sino")
+        self.assertEqual(sinograms.metadata[const.OPERATION_HISTORY][-1][const.OPERATION_NAME],
+                         const.OPERATION_NAME_AXES_SWAP)
+        self.assertNotIn(const.OPERATION_HISTORY, self.presenter.images.metadata)
+
+    def test_on_sinograms_created_adds_them_to_the_dataset(self):
+        sinograms = th.generate_images()
+
+        self.presenter._on_sinograms_created(mock.Mock(error=None, result=sinograms))
+
+        self.view._main_window.presenter.add_sinograms_to_dataset_and_update_view.assert_called_once_with(
+            sinograms, self.presenter.images.id)
+
+    def test_on_sinograms_created_shows_error(self):
+        self.presenter._on_sinograms_created(mock.Mock(error=MemoryError("out of memory")))
+
+        self.view._main_window.show_error_dialog.assert_called_once_with("Creating sinograms failed: out of memory")
+        self.view._main_window.presenter.add_sinograms_to_dataset_and_update_view.assert_not_called()
+
+    def test_stacks_with_history(self):
+        processed, unprocessed = th.generate_images(), th.generate_images()
+        processed.record_operation("ArithmeticFilter", "Arithmetic", mult_val=2.0)
+        self.presenter.images.record_operation("ArithmeticFilter", "Arithmetic", mult_val=3.0)
+        stacks = {stack.id: stack for stack in [processed, unprocessed, self.presenter.images]}
+        self.view._main_window.stack_list = [
+            StackId(processed.id, "processed"),
+            StackId(unprocessed.id, "unprocessed"),
+            StackId(self.presenter.images.id, "this")
+        ]
+        self.view._main_window.get_images_from_stack_uuid.side_effect = stacks.get
+
+        self.assertEqual(self.presenter.stacks_with_history(), {"processed": processed})
+
+    @patch("mantidimaging.gui.windows.stack_visualiser.presenter.start_async_task_view")
+    def test_apply_operations_of_uses_the_flats_and_darks_of_the_dataset(self, start_async_task_view):
+        source = th.generate_images()
+        source.record_operation("ArithmeticFilter", "Arithmetic", mult_val=2.0)
+        flat_before, dark_before = th.generate_images(), th.generate_images()
+        dataset = Dataset(sample=self.presenter.images, flat_before=flat_before, dark_before=dark_before)
+        self.view._main_window.get_dataset.return_value = dataset
+
+        self.presenter.apply_operations_of(source)
+
+        self.view._main_window.get_dataset_id_from_stack_uuid.assert_called_once_with(self.presenter.images.id)
+        start_async_task_view.assert_called_once_with(
+            self.view, replay_history, self.presenter._on_operations_applied, {
+                'images': self.presenter.images,
+                'metadata': source.metadata,
+                'stacks': {
+                    'flat_before': flat_before,
+                    'flat_after': None,
+                    'dark_before': dark_before,
+                    'dark_after': None
+                }
+            })
+
+    def test_on_operations_applied_refreshes_stacks(self):
+        self.presenter._on_operations_applied(mock.Mock(error=None))
+
+        self.view._main_window.show_error_dialog.assert_not_called()
+        self.view._main_window.stack_changed.emit.assert_called_once()
+
+    def test_on_operations_applied_shows_error(self):
+        generation = self.presenter.images.generation
+
+        self.presenter._on_operations_applied(mock.Mock(error=ValueError("bad parameters")))
+
+        self.view._main_window.show_error_dialog.assert_called_once_with("Applying operations failed: bad parameters")
+        self.view._main_window.stack_changed.emit.assert_called_once()
+        self.assertNotEqual(self.presenter.images.generation, generation)
+
 
 if __name__ == '__main__':
     unittest.main()
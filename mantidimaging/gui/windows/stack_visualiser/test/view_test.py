@@ -53,6 +53,29 @@ class StackVisualiserViewTest(unittest.TestCase):
 
         self.assertTrue(self.roi_callback_was_called)
 
+    @mock.patch("mantidimaging.gui.windows.stack_visualiser.view.QInputDialog.getItem")
+    def test_apply_operations_of_stack(self, get_item):
+        other_view, other_data = self._add_stack_visualiser()
+        # Only the stacks with visible windows are listed
+        self.window.show()
+        other_view.setWindowTitle("Processed")
+        other_data.record_operation("ArithmeticFilter", "Arithmetic", mult_val=2.0)
+        get_item.return_value = ("Processed", True)
+        self.view.presenter.apply_operations_of = mock.Mock()
+
+        self.view.apply_operations_of_stack()
+
+        self.assertEqual(get_item.call_args.args[3], ["Processed"])
+        self.view.presenter.apply_operations_of.assert_called_once_with(other_data)
+
+    @mock.patch("mantidimaging.gui.windows.stack_visualiser.view.QMessageBox.information")
+    @mock.patch("mantidimaging.gui.windows.stack_visualiser.view.QInputDialog.getItem")
+    def test_apply_operations_of_stack_without_processed_stacks(self, get_item, information):
+        self.view.apply_operations_of_stack()
+
+        information.assert_called_once()
+        get_item.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -58,6 +58,7 @@ class StackVisualiserView(QDockWidget):
                          ("Mark as projections/sinograms", self.mark_as_sinograms), ("", None),
                          ("Toggle averaged image", lambda: self.presenter.notify(SVNotification.TOGGLE_IMAGE_MODE)),
                          ("Create sinograms from stack", lambda: self.presenter.notify(SVNotification.SWAP_AXES)),
+                         ("Apply operations of another stack", self.apply_operations_of_stack),
                          ("Set ROI", self.set_roi), ("Copy ROI to clipboard", self.copy_roi_to_clipboard), ("", None),
                          ("Change window name", self.change_window_name_clicked),
                          ("Goto projection", self.goto_projection), ("Goto angle", self.goto_angle)]
@@ -205,6 +206,21 @@ class StackVisualiserView(QDockWidget):
             self.presenter.images._is_sinograms = False if item == "projections" else True
             self._main_window.stack_changed.emit()
 
+    def apply_operations_of_stack(self):
+        stacks = self.presenter.stacks_with_history()
+        if not stacks:
+            QMessageBox.information(self, "Apply operations", "No other stack has any operations to apply")
+            return
+        name, accepted = QInputDialog.getItem(self,
+                                              "Apply operations of another stack",
+                                              "Apply the operations of:",
+                                              list(stacks),
+                                              0,
+                                              False,
+                                              flags=INPUT_DIALOG_FLAGS)
+        if accepted:
+            self.presenter.apply_operations_of(stacks[name])
+
     def ask_confirmation(self, msg: str):
         response = QMessageBox.question(self, "Confirm action", msg, QMessageBox.Ok | QMessageBox.Cancel)  # type:ignore
         return response == QMessageBox.Ok
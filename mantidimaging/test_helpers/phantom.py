@@ -0,0 +1,39 @@
+# Copyright (C) 2021 ISIS Rutherford Appleton Laboratory UKRI
+# SPDX - License - Identifier: GPL-3.0-or-later
+from __future__ import annotations
+
+import astra
+import numpy as np
+
+from mantidimaging.core.data import ImageStack
+from mantidimaging.core.parallel import utility as pu
+from mantidimaging.core.reconstruct.astra_recon import vec_geom_init2d
+from mantidimaging.core.utility.data_containers import ScalarCoR
+
+PHANTOM_WIDTH = 32
+
+
+def generate_phantom() -> np.ndarray:
+    """
+    A PHANTOM_WIDTH square slice holding two discs of different densities
+    """
+    yy, xx = np.mgrid[:PHANTOM_WIDTH, :PHANTOM_WIDTH]
+    return (((xx - 20)**2 + (yy - 12)**2 < 16) + 0.5 * ((xx - 10)**2 + (yy - 18)**2 < 25)).astype(np.float32)
+
+
+def generate_phantom_projections(cors: list[ScalarCoR], num_angles: int = 90) -> ImageStack:
+    """
+    Projections of the phantom in every slice, each slice rotating about its own CoR
+    """
+    images = ImageStack(pu.create_array((num_angles, len(cors), PHANTOM_WIDTH)))
+    proj_angles = images.projection_angles()
+    vol_geom = astra.create_vol_geom((PHANTOM_WIDTH, PHANTOM_WIDTH))
+    for i, cor in enumerate(cors):
+        vectors = vec_geom_init2d(proj_angles, 1.0, cor.to_vec(PHANTOM_WIDTH).value)
+        proj_geom = astra.create_proj_geom('parallel_vec', PHANTOM_WIDTH, vectors)
+        proj_id = astra.create_projector('line', proj_geom, vol_geom)
+        sino_id, sino = astra.create_sino(generate_phantom(), proj_id)
+        astra.data2d.delete(sino_id)
+        astra.projector.delete(proj_id)
+        images.data[:, i] = np.exp(-0.1 * sino)
+    return images